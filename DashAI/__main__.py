@@ -8,6 +8,7 @@ import logging
 import pathlib
 import threading
 import webbrowser
+from typing import Optional
 
 import typer
 import uvicorn
@@ -15,6 +16,7 @@ from typing_extensions import Annotated
 
 from DashAI.back.app import create_app
 from DashAI.back.core.enums.logging_levels import LoggingLevel
+from DashAI.back.startup_profiler import StartupProfiler, profile_imports
 
 
 def open_browser() -> None:
@@ -35,6 +37,16 @@ def main(
             )
         ),
     ] = LoggingLevel.INFO,
+    profile_startup: Annotated[
+        Optional[pathlib.Path],
+        typer.Option(
+            help=(
+                "Measure the import and initialization time of the application, "
+                "write the report as JSON to this path and exit without starting "
+                "the server."
+            )
+        ),
+    ] = None,
 ) -> None:
     """Main function for DashAI package.
 
@@ -48,12 +60,27 @@ def main(
         Path where DashAI local files will be stored, by default "~/.DashAI".
     logging_level : LoggingLevel
         Logging level. Defaults to LoggingLevel.INFO.
+    profile_startup : Optional[pathlib.Path]
+        If specified, path where the startup profiling report is written instead of
+        starting the server, by default None.
 
     """
     logging.getLogger(name=__package__).setLevel(level=logging_level.value)
 
     logger = logging.getLogger(__name__)
 
+    if profile_startup is not None:
+        logger.info("Profiling DashAI startup.")
+        profiler = StartupProfiler()
+        create_app(
+            local_path=local_path,
+            logging_level=logging_level.value,
+            profiler=profiler,
+        )
+        profiler.save_report(profile_imports(), profile_startup)
+        logger.info("Startup report saved in %s.", profile_startup)
+        return
+
     logger.info("Starting DashAI application.")
     logger.info("Opening browser.")
     timer = threading.Timer(interval=1, function=open_browser)
@@ -16,22 +16,6 @@ log = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def _intersect_component_lists(
-    previous_selected_components: Dict[str, Dict[str, Any]],
-    component_list: List[Dict[str, Any]],
-) -> Dict[str, Dict[str, Any]]:
-    selected_components = {
-        component_dict["name"]: component_dict
-        for component_dict in component_list
-        if component_dict["name"] in previous_selected_components
-    }
-    return selected_components
-
-
-def _delete_class(component_dict: Dict[str, Any]) -> Dict[str, Any]:
-    return {key: value for key, value in component_dict.items() if key != "class"}
-
-
 @router.get("/")
 @inject
 async def get_components(
@@ -116,39 +100,13 @@ async def get_components(
             ),
         )
 
-    # 1. obtain all components from the selected registry/registries
-    # if none, get_components_by_type returns all components.
-    selected_components = {
-        component_dict["name"]: component_dict
-        for component_dict in component_registry.get_components_by_types(
-            select=select_types
-        )
-    }
-
-    # 2. ignore the requested types
-    if ignore_types is not None:
-        selected_components = _intersect_component_lists(
-            selected_components,
-            component_registry.get_components_by_types(ignore=ignore_types),
-        )
-
-    # 3. select only the components related to "related_component"
-    if related_component is not None:
-        selected_components = _intersect_component_lists(
-            selected_components,
-            component_registry.get_related_components(related_component),
-        )
-
-    # 4. filter if component parent was specified.
-    if component_parent is not None:
-        selected_components = _intersect_component_lists(
-            selected_components,
-            component_registry.get_child_components(component_parent, recursive=True),
-        )
-
-    return [
-        _delete_class(component_dict) for component_dict in selected_components.values()
-    ]
+    # the registry answers the query from its indexes, intersecting the filters.
+    return component_registry.get_component_payloads(
+        select_types=select_types,
+        ignore_types=ignore_types,
+        related_component=related_component,
+        component_parent=component_parent,
+    )
 
 
 @router.get("/{id}/")
@@ -181,7 +139,7 @@ def get_component_by_id(
             status_code=404,
             detail=f"Component {id} not found in the registry.",
         )
-    return _delete_class(component_registry[id])
+    return component_registry.get_payload(id)
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
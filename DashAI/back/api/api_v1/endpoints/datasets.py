@@ -1,19 +1,28 @@
 import logging
 import os
 import shutil
-from typing import Any, Dict
-
-from fastapi import APIRouter, Depends, File, Form, Response, UploadFile, status
+from typing import Any, Dict, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.exceptions import HTTPException
 from kink import di, inject
-from sqlalchemy import exc
+from sqlalchemy import exc, select
 from sqlalchemy.orm.session import sessionmaker
 
 from DashAI.back.api.api_v1.schemas.datasets_params import (
     DatasetParams,
     DatasetUpdateParams,
 )
-from DashAI.back.api.utils import parse_params
+from DashAI.back.api.utils import parse_params, select_page
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     DashAIDataset,
     get_columns_spec,
@@ -25,6 +34,10 @@ from DashAI.back.dataloaders.classes.dashai_dataset import (
     to_dashai_dataset,
     update_columns_spec,
 )
+from DashAI.back.dataloaders.classes.dataset_store import (
+    release_dataset_shards,
+    store_dataset_shards,
+)
 from DashAI.back.dependencies.database.models import Dataset
 from DashAI.back.dependencies.registry import ComponentRegistry
 
@@ -35,12 +48,29 @@ router = APIRouter()
 @router.get("/")
 @inject
 async def get_datasets(
+    response: Response,
+    name: Optional[str] = None,
+    fields: Optional[str] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
 ):
     """Retrieve a list of the stored datasets in the database.
 
+    The datasets are paginated by id: when a page of `limit` datasets is full,
+    the response has an X-Next-After-Id header with the after_id of the next
+    page.
+
     Parameters
     ----------
+    name : Optional[str]
+        If specified, only the dataset with this name is returned.
+    fields : Optional[str]
+        Comma separated names of the columns to return, by default all of them.
+    after_id : Optional[int]
+        If specified, only the datasets with a greater id are returned.
+    limit : Optional[int]
+        Maximum number of datasets to return, by default all of them.
     session_factory : sessionmaker
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
@@ -56,7 +86,10 @@ async def get_datasets(
     logger.debug("Retrieving all datasets.")
     with session_factory() as db:
         try:
-            datasets = db.query(Dataset).all()
+            where = [] if name is None else [Dataset.name == name]
+            datasets = select_page(
+                db, Dataset, response, where, fields, after_id, limit
+            )
 
         except exc.SQLAlchemyError as e:
             logger.exception(e)
@@ -306,6 +339,7 @@ async def upload_dataset(
             dataset_path = folder_path / "dataset"
         logger.debug("Saving dataset in %s", str(dataset_path))
         save_dataset(new_dataset, dataset_path)
+        fingerprint = store_dataset_shards(dataset_path, config["DATASET_SHARDS_PATH"])
 
         # - NOTE -------------------------------------------------------------
         # Is important that the DatasetDict dataset it be saved in "/dataset"
@@ -329,6 +363,7 @@ async def upload_dataset(
             new_dataset = Dataset(
                 name=parsed_params.name,
                 file_path=folder_path,
+                fingerprint=fingerprint,
             )
             db.add(new_dataset)
             db.commit()
@@ -350,9 +385,14 @@ async def upload_dataset(
 async def delete_dataset(
     dataset_id: int,
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
+    config: Dict[str, Any] = Depends(lambda: di["config"]),
 ):
     """Delete the dataset associated with the provided ID from the database.
 
+    The shards of the dataset that are not shared with other datasets are
+    removed from the shards store, as well as its prepared datasets when no
+    other dataset has the same fingerprint.
+
     Parameters
     ----------
     dataset_id : int
@@ -360,6 +400,8 @@ async def delete_dataset(
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
+    config: Dict[str, Any]
+        Application settings.
 
     Returns
     -------
@@ -377,6 +419,13 @@ async def delete_dataset(
 
             db.delete(dataset)
             db.commit()
+            fingerprint_in_use = (
+                dataset.fingerprint is not None
+                and db.scalar(
+                    select(Dataset.id).where(Dataset.fingerprint == dataset.fingerprint)
+                )
+                is not None
+            )
 
         except exc.SQLAlchemyError as e:
             logger.exception(e)
@@ -387,6 +436,12 @@ async def delete_dataset(
 
     try:
         shutil.rmtree(dataset.file_path, ignore_errors=True)
+        release_dataset_shards(config["DATASET_SHARDS_PATH"])
+        if dataset.fingerprint is not None and not fingerprint_in_use:
+            shutil.rmtree(
+                config["PREPARED_DATASETS_PATH"] / dataset.fingerprint,
+                ignore_errors=True,
+            )
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     except OSError as e:
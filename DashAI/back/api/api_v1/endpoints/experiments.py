@@ -1,7 +1,7 @@
 import logging
 from typing import Union
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.exceptions import HTTPException
 from kink import di, inject
 from sqlalchemy import exc
@@ -11,6 +11,7 @@ from DashAI.back.api.api_v1.schemas.experiments_params import (
     ColumnsValidationParams,
     ExperimentParams,
 )
+from DashAI.back.api.utils import select_page
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     get_column_names_from_indexes,
     load_dataset,
@@ -28,12 +29,32 @@ router = APIRouter()
 @router.get("/")
 @inject
 async def get_experiments(
+    response: Response,
+    dataset_id: Union[int, None] = None,
+    task_name: Union[str, None] = None,
+    fields: Union[str, None] = None,
+    after_id: Union[int, None] = None,
+    limit: Union[int, None] = Query(None, ge=1),
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
 ):
     """Retrieve a list of the stored experiments in the database.
 
+    The experiments are paginated by id: when a page of `limit` experiments is
+    full, the response has an X-Next-After-Id header with the after_id of the
+    next page.
+
     Parameters
     ----------
+    dataset_id: Union[int, None], optional
+        If specified, only the experiments of this dataset are returned.
+    task_name: Union[str, None], optional
+        If specified, only the experiments of this task are returned.
+    fields: Union[str, None], optional
+        Comma separated names of the columns to return, by default all of them.
+    after_id: Union[int, None], optional
+        If specified, only the experiments with a greater id are returned.
+    limit: Union[int, None], optional
+        Maximum number of experiments to return, by default all of them.
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
@@ -44,9 +65,17 @@ async def get_experiments(
     List[dict]
         A list of dict containing experiments.
     """
+    where = []
+    if dataset_id is not None:
+        where.append(Experiment.dataset_id == dataset_id)
+    if task_name is not None:
+        where.append(Experiment.task_name == task_name)
+
     with session_factory() as db:
         try:
-            all_experiments = db.query(Experiment).all()
+            all_experiments = select_page(
+                db, Experiment, response, where, fields, after_id, limit
+            )
         except exc.SQLAlchemyError as e:
             log.exception(e)
             raise HTTPException(
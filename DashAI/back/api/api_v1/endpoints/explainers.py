@@ -1,8 +1,9 @@
 import logging
 import os
 import pickle
+from typing import Union
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.exceptions import HTTPException
 from kink import di, inject
 from sqlalchemy import exc, select
@@ -13,6 +14,7 @@ from DashAI.back.api.api_v1.schemas.explainers_params import (
     LocalExplainerParams,
     ValidateDatasetParams,
 )
+from DashAI.back.api.utils import select_page
 from DashAI.back.core.enums.status import ExplainerStatus
 from DashAI.back.dataloaders.classes.dashai_dataset import load_dataset
 from DashAI.back.dependencies.database.models import (
@@ -30,10 +32,29 @@ log = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _explainers_filters(explainer_class, run_id, explainer_status):
+    """Build the filters of the explainers list endpoints."""
+    where = [explainer_class.run_id == run_id]
+    if explainer_status is not None:
+        try:
+            where.append(explainer_class.status == ExplainerStatus(explainer_status))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid explainer status {explainer_status}",
+            ) from e
+    return where
+
+
 @router.get("/global")
 @inject
 async def get_global_explainers(
+    response: Response,
     run_id: int,
+    explainer_status: Union[int, None] = Query(None, alias="status"),
+    fields: Union[str, None] = None,
+    after_id: Union[int, None] = None,
+    limit: Union[int, None] = Query(None, ge=1),
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
 ):
     """Returns the global explanainers in the database associated with the
@@ -43,6 +64,16 @@ async def get_global_explainers(
     ----------
     run_id: int
         Run id to select the global explanations to retrieve.
+    explainer_status: Union[int, None], optional
+        If specified, only the explainers with this status value are returned.
+    fields: Union[str, None], optional
+        Comma separated names of the columns to return, by default all of them.
+    after_id: Union[int, None], optional
+        If specified, only the explainers with a greater id are returned. When
+        a page of `limit` explainers is full, the response has an
+        X-Next-After-Id header with the after_id of the next page.
+    limit: Union[int, None], optional
+        Maximum number of explainers to return, by default all of them.
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
@@ -59,9 +90,15 @@ async def get_global_explainers(
     """
     with session_factory() as db:
         try:
-            global_explainers = db.scalars(
-                select(GlobalExplainer).where(GlobalExplainer.run_id == run_id)
-            ).all()
+            global_explainers = select_page(
+                db,
+                GlobalExplainer,
+                response,
+                _explainers_filters(GlobalExplainer, run_id, explainer_status),
+                fields,
+                after_id,
+                limit,
+            )
 
         except exc.SQLAlchemyError as e:
             log.exception(e)
@@ -307,7 +344,12 @@ async def delete_global_explainer(
 @router.get("/local")
 @inject
 async def get_local_explainers(
+    response: Response,
     run_id: int,
+    explainer_status: Union[int, None] = Query(None, alias="status"),
+    fields: Union[str, None] = None,
+    after_id: Union[int, None] = None,
+    limit: Union[int, None] = Query(None, ge=1),
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
 ):
     """Returns the local explanainers in the database associated with the
@@ -317,6 +359,16 @@ async def get_local_explainers(
     ----------
     run_id: int
         Run id to select the global explanations to retrieve.
+    explainer_status: Union[int, None], optional
+        If specified, only the explainers with this status value are returned.
+    fields: Union[str, None], optional
+        Comma separated names of the columns to return, by default all of them.
+    after_id: Union[int, None], optional
+        If specified, only the explainers with a greater id are returned. When
+        a page of `limit` explainers is full, the response has an
+        X-Next-After-Id header with the after_id of the next page.
+    limit: Union[int, None], optional
+        Maximum number of explainers to return, by default all of them.
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
@@ -333,9 +385,15 @@ async def get_local_explainers(
     """
     with session_factory() as db:
         try:
-            local_explainers = db.scalars(
-                select(LocalExplainer).where(LocalExplainer.run_id == run_id)
-            ).all()
+            local_explainers = select_page(
+                db,
+                LocalExplainer,
+                response,
+                _explainers_filters(LocalExplainer, run_id, explainer_status),
+                fields,
+                after_id,
+                limit,
+            )
 
         except exc.SQLAlchemyError as e:
             log.exception(e)
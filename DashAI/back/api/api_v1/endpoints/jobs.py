@@ -1,7 +1,11 @@
+import asyncio
+import json
 import logging
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 from kink import di, inject
 from sqlalchemy.orm import sessionmaker
 
@@ -11,12 +15,25 @@ from DashAI.back.dependencies.job_queues.base_job_queue import JobQueueError
 from DashAI.back.dependencies.job_queues.job_queue import job_queue_loop
 from DashAI.back.dependencies.registry import ComponentRegistry
 from DashAI.back.job.base_job import BaseJob, JobError
+from DashAI.back.job.progress import ProgressBroker
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# seconds without events after which a comment is sent to keep the stream open.
+KEEP_ALIVE_INTERVAL = 15.0
+
+
+def _format_event(event: Dict[str, Any]) -> str:
+    """Format a progress event as a server-sent event."""
+    data = json.dumps(
+        event,
+        default=lambda value: value.item() if hasattr(value, "item") else str(value),
+    )
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
 
 @router.post("/start/")
 async def start_job_queue(
@@ -62,6 +79,76 @@ async def get_jobs(
     return all_jobs
 
 
+@router.get("/progress")
+@inject
+async def stream_progress(
+    request: Request,
+    job_id: Optional[int] = None,
+    run_id: Optional[int] = None,
+    follow: bool = True,
+    progress_broker: ProgressBroker = Depends(lambda: di["progress_broker"]),
+):
+    """Stream the progress of the jobs as server-sent events.
+
+    Each event has the type of the progress event (job, phase, trial, step or
+    evaluation) and a JSON object with its data, labeled with the job id and
+    type and, for the run jobs, the run id. The last events are sent first, so
+    a client that connects while a job runs receives its current progress.
+
+    Parameters
+    ----------
+    job_id : Optional[int]
+        If given, only the events of this job are sent.
+    run_id : Optional[int]
+        If given, only the events of this run are sent.
+    follow : bool
+        If True (default), the stream stays open and sends the new events as
+        they are published. Otherwise, only the last events are sent.
+    progress_broker : ProgressBroker
+        The current app progress broker.
+
+    Returns
+    -------
+    StreamingResponse
+        A text/event-stream response with the progress events.
+    """
+    filters = {
+        key: value
+        for key, value in [("job_id", job_id), ("run_id", run_id)]
+        if value is not None
+    }
+
+    def selected(event: Dict[str, Any]) -> bool:
+        return all(event.get(key) == value for key, value in filters.items())
+
+    async def history_events() -> AsyncIterator[str]:
+        for event in progress_broker.history():
+            if selected(event):
+                yield _format_event(event)
+
+    async def live_events() -> AsyncIterator[str]:
+        queue = progress_broker.subscribe()
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=KEEP_ALIVE_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if selected(event):
+                    yield _format_event(event)
+        finally:
+            progress_broker.unsubscribe(queue)
+
+    return StreamingResponse(
+        live_events() if follow else history_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.get("/{job_id}")
 @inject
 async def get_job(
@@ -110,8 +197,9 @@ async def enqueue_job(
 
     Parameters
     ----------
-    run_id : int
-        Id of the Run to train and evaluate.
+    params : JobParams
+        The job type, its parameters and its priority. Jobs with higher priority
+        are executed first.
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
@@ -139,7 +227,7 @@ async def enqueue_job(
                 detail="Job not delivered",
             ) from e
         try:
-            job_queue.put(job)
+            job_queue.put(job, priority=params.priority)
         except JobQueueError as e:
             logger.exception(e)
             raise HTTPException(
@@ -175,7 +263,8 @@ async def cancel_job(
         If is not posible to get the job from the job queue.
     """
     try:
-        job_queue.get(job_id)
+        job = job_queue.get(job_id)
+        job_queue.task_done(job)
     except JobQueueError as e:
         logger.exception(e)
         raise HTTPException(
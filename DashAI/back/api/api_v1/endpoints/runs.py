@@ -3,13 +3,14 @@ import os
 import pickle
 from typing import Union
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.exceptions import HTTPException
 from kink import di, inject
 from sqlalchemy import exc, select
 from sqlalchemy.orm import sessionmaker
 
 from DashAI.back.api.api_v1.schemas.runs_params import RunParams
+from DashAI.back.api.utils import select_page
 from DashAI.back.dependencies.database.models import Experiment, Run, RunStatus
 
 logging.basicConfig(level=logging.DEBUG)
@@ -21,18 +22,36 @@ router = APIRouter()
 @router.get("/")
 @inject
 async def get_runs(
+    response: Response,
     experiment_id: Union[int, None] = None,
+    run_status: Union[int, None] = Query(None, alias="status"),
+    model_name: Union[str, None] = None,
+    fields: Union[str, None] = None,
+    after_id: Union[int, None] = None,
+    limit: Union[int, None] = Query(None, ge=1),
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
 ):
     """Retrieve a list of the stored experiment runs in the database.
 
-    The runs can be filtered by experiment_id if the parameter is passed.
+    The runs can be filtered by experiment_id, status and model_name, and are
+    paginated by id: when a page of `limit` runs is full, the response has an
+    X-Next-After-Id header with the after_id of the next page.
 
     Parameters
     ----------
     experiment_id: Union[int, None], optional
         If specified, the function will return all the runs associated with
         the experiment, by default None.
+    run_status: Union[int, None], optional
+        If specified, only the runs with this status value are returned.
+    model_name: Union[str, None], optional
+        If specified, only the runs of this model are returned.
+    fields: Union[str, None], optional
+        Comma separated names of the columns to return, by default all of them.
+    after_id: Union[int, None], optional
+        If specified, only the runs with a greater id are returned.
+    limit: Union[int, None], optional
+        Maximum number of runs to return, by default all of them.
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
@@ -47,19 +66,29 @@ async def get_runs(
     HTTPException
         If the experiment is not registered in the DB.
     """
+    where = []
+    if experiment_id is not None:
+        where.append(Run.experiment_id == experiment_id)
+    if run_status is not None:
+        try:
+            where.append(Run.status == RunStatus(run_status))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid run status {run_status}",
+            ) from e
+    if model_name is not None:
+        where.append(Run.model_name == model_name)
+
     with session_factory() as db:
         try:
-            if experiment_id is not None:
-                runs = db.scalars(
-                    select(Run).where(Run.experiment_id == experiment_id)
-                ).all()
-                if not runs:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail="Runs associated with Experiment not found",
-                    )
-            else:
-                runs = db.query(Run).all()
+            # an empty page is a valid result for an existing experiment.
+            if experiment_id is not None and db.get(Experiment, experiment_id) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Runs associated with Experiment not found",
+                )
+            runs = select_page(db, Run, response, where, fields, after_id, limit)
         except exc.SQLAlchemyError as e:
             log.exception(e)
             raise HTTPException(
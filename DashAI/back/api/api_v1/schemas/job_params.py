@@ -6,5 +6,6 @@ from pydantic import BaseModel, ConfigDict
 class JobParams(BaseModel):
     model_config = ConfigDict(extra="allow")
 
-    job_type: Literal["ModelJob", "ExplainerJob"]
+    job_type: Literal["ModelJob", "ExplainerJob", "BatchModelJob"]
     kwargs: dict
+    priority: int = 0
@@ -1,9 +1,12 @@
 import logging
+from typing import Any, List, Optional, Sequence
 
 import pydantic
-from fastapi import status
+from fastapi import Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import HTTPException
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session
 
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
@@ -34,3 +37,95 @@ def parse_params(model_class, params):
             detail=jsonable_encoder(e.errors()),
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         ) from e
+
+
+def parse_fields(model_class, fields: Optional[str]) -> Optional[List[Any]]:
+    """
+    Parse a comma separated list of fields into the columns of a DB model.
+
+    Parameters
+    ----------
+    model_class : Base
+        The SQLAlchemy model.
+    fields : Optional[str]
+        Comma separated names of the columns, or None for every column.
+
+    Returns
+    -------
+    Optional[List[Any]]
+        The selected columns, always including the id, or None for every column.
+    """
+    if fields is None:
+        return None
+
+    columns = inspect(model_class).columns
+    names = ["id"] + [
+        name.strip() for name in fields.split(",") if name.strip() not in ("", "id")
+    ]
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return [getattr(model_class, name) for name in dict.fromkeys(names)]
+
+
+def select_page(
+    db: Session,
+    model_class,
+    response: Response,
+    where: Sequence[Any] = (),
+    fields: Optional[str] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """
+    Select a page of rows of a DB model, paginated by id (keyset pagination).
+
+    The rows are ordered by id. When the page is full, the id of its last row
+    is returned in the X-Next-After-Id header, to be sent as after_id to get
+    the next page.
+
+    Parameters
+    ----------
+    db : Session
+        The DB session.
+    model_class : Base
+        The SQLAlchemy model.
+    response : Response
+        The response of the endpoint, where the next page header is set.
+    where : Sequence[Any]
+        Filters of the rows.
+    fields : Optional[str]
+        Comma separated names of the columns to return. If None, the complete
+        objects are returned.
+    after_id : Optional[int]
+        Only the rows with a greater id are returned.
+    limit : Optional[int]
+        Maximum number of rows of the page. If None, all the rows are returned.
+
+    Returns
+    -------
+    List[Any]
+        The model objects, or dicts with the selected fields.
+    """
+    columns = parse_fields(model_class, fields)
+    statement = select(*columns) if columns else select(model_class)
+    statement = statement.where(*where)
+    if after_id is not None:
+        statement = statement.where(model_class.id > after_id)
+    statement = statement.order_by(model_class.id)
+    if limit is not None:
+        statement = statement.limit(limit)
+
+    if columns:
+        rows = [row._asdict() for row in db.execute(statement)]
+        last_id = rows[-1]["id"] if rows else None
+    else:
+        rows = db.scalars(statement).all()
+        last_id = rows[-1].id if rows else None
+
+    if limit is not None and len(rows) == limit:
+        response.headers["X-Next-After-Id"] = str(last_id)
+    return rows
@@ -2,7 +2,7 @@
 
 import logging
 import pathlib
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 
 import datasets
 from fastapi import FastAPI
@@ -14,6 +14,8 @@ from DashAI.back.api.front_api import router as app_router
 from DashAI.back.container import build_container
 from DashAI.back.dependencies.config_builder import build_config_dict
 from DashAI.back.dependencies.database.models import Base
+from DashAI.back.dependencies.job_queues import SQLiteJobQueue
+from DashAI.back.startup_profiler import StartupProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,7 @@ def create_app(
     logging_level: Literal[
         "NOTSET", "DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"
     ] = "INFO",
+    profiler: Optional[StartupProfiler] = None,
 ) -> FastAPI:
     """Create the main application.
 
@@ -51,58 +54,74 @@ def create_app(
     logging_level : Literal['NOTSET', 'DEBUG', 'INFO', 'WARN', 'ERROR', 'CRITICAL']
         Set the package logging level. It affects all subpackages loggers that does
         not specifies mannualy the logging level, by default "INFO"
+    profiler : Optional[StartupProfiler], optional
+        Profiler where the time taken by each step is recorded, by default None.
 
     Returns
     -------
     FastAPI
         The created FastAPI application.
     """
-    # generating config dict and setting logging level
+    if profiler is None:
+        profiler = StartupProfiler()
 
-    config = build_config_dict(
-        local_path=local_path,
-        logging_level=logging_level,
-    )
+    # generating config dict and setting logging level
+    with profiler.step("config"):
+        config = build_config_dict(
+            local_path=local_path,
+            logging_level=logging_level,
+        )
 
-    logging.getLogger(__package__).setLevel(level=config["LOGGING_LEVEL"])
-    datasets.logging.set_verbosity(int(config["LOGGING_LEVEL"]))
+        logging.getLogger(__package__).setLevel(level=config["LOGGING_LEVEL"])
+        datasets.logging.set_verbosity(int(config["LOGGING_LEVEL"]))
 
     logger.debug("App parameters: %s.", str(config))
     logger.debug("Logging level set to %s.", config["LOGGING_LEVEL"])
 
     logger.debug("3. Creating app container and setting up dependency injection.")
-    container = build_container(config=config)
+    with profiler.step("container"):
+        container = build_container(config=config)
 
     logger.debug("Creating local paths.")
-    _create_path_if_not_exists(config["LOCAL_PATH"])
-    _create_path_if_not_exists(config["DATASETS_PATH"])
-    _create_path_if_not_exists(config["EXPLANATIONS_PATH"])
-    _create_path_if_not_exists(config["RUNS_PATH"])
+    with profiler.step("local_paths"):
+        _create_path_if_not_exists(config["LOCAL_PATH"])
+        _create_path_if_not_exists(config["DATASETS_PATH"])
+        _create_path_if_not_exists(config["DATASET_SHARDS_PATH"])
+        _create_path_if_not_exists(config["PREPARED_DATASETS_PATH"])
+        _create_path_if_not_exists(config["AUDIO_FEATURES_PATH"])
+        _create_path_if_not_exists(config["EXPLANATIONS_PATH"])
+        _create_path_if_not_exists(config["RUNS_PATH"])
 
     logger.debug("5. Creating database.")
-    Base.metadata.create_all(bind=container["engine"])
+    with profiler.step("database"):
+        Base.metadata.create_all(bind=container["engine"])
+    with profiler.step("job_queue"):
+        container["job_cost_estimator"].load_history(container["session_factory"])
+        if isinstance(container["job_queue"], SQLiteJobQueue):
+            container["job_queue"].requeue_claimed_jobs()
 
     logger.debug("6. Initializing FastAPI application.")
-    app = FastAPI(title="DashAI")
-    api_v0 = FastAPI(title="DashAI API v0")
-    api_v1 = FastAPI(title="DashAI API v1")
-
-    logger.debug("7. Mounting API routers.")
-    api_v0.include_router(api_router_v0)
-    api_v1.include_router(api_router_v1)
-
-    app.mount(config["API_V0_STR"], api_v0)
-    app.mount(config["API_V1_STR"], api_v1)
-
-    app.include_router(app_router)
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    with profiler.step("routers"):
+        app = FastAPI(title="DashAI")
+        api_v0 = FastAPI(title="DashAI API v0")
+        api_v1 = FastAPI(title="DashAI API v1")
+
+        logger.debug("7. Mounting API routers.")
+        api_v0.include_router(api_router_v0)
+        api_v1.include_router(api_router_v1)
+
+        app.mount(config["API_V0_STR"], api_v0)
+        app.mount(config["API_V1_STR"], api_v1)
+
+        app.include_router(app_router)
+
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
     app.container = container
     logger.debug("Application successfully created.")
 
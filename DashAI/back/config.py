@@ -10,6 +10,16 @@ class DefaultSettings(BaseSettings):
 
     LOCAL_PATH: str = "~/.DashAI"
     SQLITE_DB_PATH: str = "db.sqlite"
+    SQLITE_POOL_SIZE: int = 10
+    SQLITE_BUSY_TIMEOUT: int = 30000
     DATASETS_PATH: str = "datasets"
+    DATASET_SHARDS_PATH: str = "dataset_shards"
+    PREPARED_DATASETS_PATH: str = "prepared_datasets"
+    AUDIO_FEATURES_PATH: str = "audio_features"
     RUNS_PATH: str = "runs"
     EXPLANATIONS_PATH: str = "explanations"
+
+    JOB_QUEUE: str = "simple"
+    JOB_QUEUE_SCHEDULING: str = "shortest_job_first"
+
+    EVALUATION_BATCH_SIZE: int = 10000
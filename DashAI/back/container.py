@@ -3,105 +3,91 @@ from typing import Dict
 
 from kink import Container, di
 
-from DashAI.back.dataloaders import (
-    CSVDataLoader,
-    ExcelDataLoader,
-    ImageDataLoader,
-    JSONDataLoader,
-)
 from DashAI.back.dependencies.database import setup_sqlite_db
-from DashAI.back.dependencies.job_queues import SimpleJobQueue
+from DashAI.back.dependencies.job_queues import SimpleJobQueue, SQLiteJobQueue
+from DashAI.back.dependencies.job_queues.job_cost_estimator import JobCostEstimator
 from DashAI.back.dependencies.registry import ComponentRegistry
-from DashAI.back.explainability import (
-    KernelShap,
-    PartialDependence,
-    PermutationFeatureImportance,
-)
-from DashAI.back.job import ExplainerJob, ModelJob
-from DashAI.back.metrics import F1, MAE, RMSE, Accuracy, Bleu, Precision, Recall
-from DashAI.back.models import (
-    SVC,
-    BagOfWordsTextClassificationModel,
-    DecisionTreeClassifier,
-    DistilBertTransformer,
-    DummyClassifier,
-    GradientBoostingR,
-    HistGradientBoostingClassifier,
-    KNeighborsClassifier,
-    LinearRegression,
-    LinearSVR,
-    LogisticRegression,
-    MLPRegression,
-    OpusMtEnESTransformer,
-    RandomForestClassifier,
-    RandomForestRegression,
-    RidgeRegression,
-    ViTTransformer,
-)
-from DashAI.back.optimizers import (
-    HyperOptOptimizer,
-    OptunaOptimizer,
-)
-from DashAI.back.tasks import (
-    ImageClassificationTask,
-    RegressionTask,
-    TabularClassificationTask,
-    TextClassificationTask,
-    TranslationTask,
-)
+from DashAI.back.dependencies.registry.component_index import load_component_index
+from DashAI.back.job.progress import ProgressBroker
 
 logger = logging.getLogger(__name__)
 
 
-INITIAL_COMPONENTS = [
-    # Tasks
-    TabularClassificationTask,
-    TextClassificationTask,
-    TranslationTask,
-    ImageClassificationTask,
-    RegressionTask,
-    # Models
-    SVC,
-    DecisionTreeClassifier,
-    DummyClassifier,
-    GradientBoostingR,
-    HistGradientBoostingClassifier,
-    KNeighborsClassifier,
-    LogisticRegression,
-    MLPRegression,
-    RandomForestClassifier,
-    RandomForestRegression,
-    DistilBertTransformer,
-    ViTTransformer,
-    OpusMtEnESTransformer,
-    BagOfWordsTextClassificationModel,
-    RidgeRegression,
-    LinearSVR,
-    LinearRegression,
-    # Dataloaders
-    CSVDataLoader,
-    JSONDataLoader,
-    ImageDataLoader,
-    ExcelDataLoader,
-    # Metrics
-    F1,
-    Accuracy,
-    Precision,
-    Recall,
-    Bleu,
-    MAE,
-    RMSE,
-    # Optimizers
-    OptunaOptimizer,
-    HyperOptOptimizer,
-    # Jobs
-    ExplainerJob,
-    ModelJob,
-    # Explainers
-    KernelShap,
-    PartialDependence,
-    PermutationFeatureImportance,
-]
+# Components are registered by type and dotted path, so their modules (and heavy
+# dependencies like torch or transformers) are imported only when the component
+# is requested from the registry. Their payloads and relationships are read from
+# the static component index, so listing them does not import them either. The
+# index must be regenerated when this list or a component schema changes:
+#   python -m DashAI.back.dependencies.registry.component_index
+INITIAL_COMPONENTS = {
+    "Task": [
+        "DashAI.back.tasks.tabular_classification_task.TabularClassificationTask",
+        "DashAI.back.tasks.text_classification_task.TextClassificationTask",
+        "DashAI.back.tasks.translation_task.TranslationTask",
+        "DashAI.back.tasks.image_classification_task.ImageClassificationTask",
+        "DashAI.back.tasks.regression_task.RegressionTask",
+    ],
+    "Model": [
+        "DashAI.back.models.scikit_learn.svc.SVC",
+        "DashAI.back.models.scikit_learn.decision_tree_classifier."
+        "DecisionTreeClassifier",
+        "DashAI.back.models.scikit_learn.dummy_classifier.DummyClassifier",
+        "DashAI.back.models.scikit_learn.gradient_boosting_regression."
+        "GradientBoostingR",
+        "DashAI.back.models.scikit_learn.hist_gradient_boosting_classifier."
+        "HistGradientBoostingClassifier",
+        "DashAI.back.models.scikit_learn.k_neighbors_classifier.KNeighborsClassifier",
+        "DashAI.back.models.scikit_learn.logistic_regression.LogisticRegression",
+        "DashAI.back.models.scikit_learn.mlp_regression.MLPRegression",
+        "DashAI.back.models.scikit_learn.random_forest_classifier."
+        "RandomForestClassifier",
+        "DashAI.back.models.scikit_learn.random_forest_regression."
+        "RandomForestRegression",
+        "DashAI.back.models.hugging_face.distilbert_transformer.DistilBertTransformer",
+        "DashAI.back.models.hugging_face.vit_transformer.ViTTransformer",
+        "DashAI.back.models.hugging_face.opus_mt_en_es_transformer."
+        "OpusMtEnESTransformer",
+        "DashAI.back.models.scikit_learn.bow_text_classification_model."
+        "BagOfWordsTextClassificationModel",
+        "DashAI.back.models.scikit_learn.ridge_regression.RidgeRegression",
+        "DashAI.back.models.scikit_learn.linearSVR.LinearSVR",
+        "DashAI.back.models.scikit_learn.linear_regression.LinearRegression",
+    ],
+    "DataLoader": [
+        "DashAI.back.dataloaders.classes.csv_dataloader.CSVDataLoader",
+        "DashAI.back.dataloaders.classes.json_dataloader.JSONDataLoader",
+        "DashAI.back.dataloaders.classes.image_dataloader.ImageDataLoader",
+        "DashAI.back.dataloaders.classes.excel_dataloader.ExcelDataLoader",
+        "DashAI.back.dataloaders.classes.parquet_dataloader.ParquetDataLoader",
+        "DashAI.back.dataloaders.classes.arrow_dataloader.ArrowDataLoader",
+    ],
+    "Metric": [
+        "DashAI.back.metrics.classification.f1.F1",
+        "DashAI.back.metrics.classification.accuracy.Accuracy",
+        "DashAI.back.metrics.classification.precision.Precision",
+        "DashAI.back.metrics.classification.recall.Recall",
+        "DashAI.back.metrics.translation.bleu.Bleu",
+        "DashAI.back.metrics.regression.mae.MAE",
+        "DashAI.back.metrics.regression.rmse.RMSE",
+    ],
+    "Optimizer": [
+        "DashAI.back.optimizers.optuna_optimizer.OptunaOptimizer",
+        "DashAI.back.optimizers.hyperopt_optimizer.HyperOptOptimizer",
+    ],
+    "Job": [
+        "DashAI.back.job.explainer_job.ExplainerJob",
+        "DashAI.back.job.model_job.ModelJob",
+        "DashAI.back.job.batch_model_job.BatchModelJob",
+    ],
+    "LocalExplainer": [
+        "DashAI.back.explainability.explainers.kernel_shap.KernelShap",
+    ],
+    "GlobalExplainer": [
+        "DashAI.back.explainability.explainers.partial_dependence.PartialDependence",
+        "DashAI.back.explainability.explainers.permutation_feature_importance."
+        "PermutationFeatureImportance",
+    ],
+}
 
 
 def build_container(config: Dict[str, str]) -> Container:
@@ -123,13 +109,29 @@ def build_container(config: Dict[str, str]) -> Container:
             * sessionmaker: A session factory for creating database sessions.
             * ComponentRegistry: The app component registry.
             * BaseJobQueue: The app job queue.
+            * JobCostEstimator: The estimator of the jobs execution cost.
+            * ProgressBroker: The broker of the jobs progress events.
     """
     engine, session_factory = setup_sqlite_db(config)
 
     di["config"] = config
     di["engine"] = engine
     di["session_factory"] = session_factory
-    di["component_registry"] = ComponentRegistry(initial_components=INITIAL_COMPONENTS)
-    di["job_queue"] = SimpleJobQueue()
+    di["component_registry"] = ComponentRegistry(
+        lazy_components=INITIAL_COMPONENTS, component_index=load_component_index()
+    )
+    di["job_cost_estimator"] = JobCostEstimator()
+    di["progress_broker"] = ProgressBroker()
+    if config["JOB_QUEUE"] == "sqlite":
+        di["job_queue"] = SQLiteJobQueue(
+            session_factory=session_factory,
+            scheduling=config["JOB_QUEUE_SCHEDULING"],
+            cost_estimator=di["job_cost_estimator"],
+        )
+    else:
+        di["job_queue"] = SimpleJobQueue(
+            scheduling=config["JOB_QUEUE_SCHEDULING"],
+            cost_estimator=di["job_cost_estimator"],
+        )
 
     return di
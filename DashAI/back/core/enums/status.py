@@ -15,3 +15,8 @@ class RunStatus(Enum):
     STARTED = 2
     FINISHED = 3
     ERROR = 4
+
+
+class JobStatus(Enum):
+    QUEUED = 0
+    CLAIMED = 1
@@ -0,0 +1,44 @@
+"""Lazy attribute loading for packages that re-export heavy components."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_import(
+    package_name: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module level `__getattr__` and `__dir__` of a lazy package.
+
+    Each attribute is imported from its module the first time that it is
+    accessed (PEP 562), so importing the package (or any of its submodules) does
+    not import the dependencies of every component it exports.
+
+    Parameters
+    ----------
+    package_name : str
+        Name of the package that exports the attributes, i.e., its `__name__`.
+    attributes : Dict[str, str]
+        Mapping from each exported attribute name to the dotted path of the
+        module where it is defined.
+
+    Returns
+    -------
+    Tuple[Callable[[str], Any], Callable[[], List[str]]]
+        The `__getattr__` and `__dir__` functions of the package.
+    """
+
+    def _getattr(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(
+                f"module '{package_name}' has no attribute '{name}'",
+            )
+        value = getattr(importlib.import_module(attributes[name]), name)
+        # store the attribute in the package to skip this function next time.
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def _dir() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(attributes))
+
+    return _getattr, _dir
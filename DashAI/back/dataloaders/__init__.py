@@ -6,3 +6,5 @@ from DashAI.back.dataloaders.classes.image_dataloader import ImageDataLoader
 from DashAI.back.dataloaders.classes.json_dataloader import JSONDataLoader
 from DashAI.back.dataloaders.classes.tabular_dataloader import TabularDataLoader
 from DashAI.back.dataloaders.classes.excel_dataloader import ExcelDataLoader
+from DashAI.back.dataloaders.classes.parquet_dataloader import ParquetDataLoader
+from DashAI.back.dataloaders.classes.arrow_dataloader import ArrowDataLoader
@@ -0,0 +1,13 @@
+"""DashAI Arrow IPC (Feather) Dataloader."""
+
+from DashAI.back.dataloaders.classes.columnar_dataloader import ColumnarDataLoader
+
+
+class ArrowDataLoader(ColumnarDataLoader):
+    """Data loader for data in Arrow IPC files (also known as Feather v2).
+
+    Uncompressed files are memory mapped, so their columns are loaded without
+    copying or parsing them.
+    """
+
+    FORMAT = "ipc"
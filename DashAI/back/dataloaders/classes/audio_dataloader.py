@@ -10,7 +10,11 @@ from DashAI.back.dataloaders.classes.dataloader import BaseDataLoader
 
 
 class AudioDataLoader(BaseDataLoader):
-    """Data loader for data from audio files."""
+    """Data loader for data from audio files.
+
+    The clips are stored encoded; their features are computed (and cached) on
+    demand with `extract_audio_features`.
+    """
 
     @beartype
     def load_data(
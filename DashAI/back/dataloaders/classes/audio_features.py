@@ -0,0 +1,311 @@
+"""Feature extraction pipeline for audio datasets with a persistent cache."""
+
+import hashlib
+import importlib.util
+import io
+import logging
+import math
+import os
+import pathlib
+import uuid
+import wave
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+from beartype import beartype
+from datasets import (
+    Array2D,
+    Audio,
+    Dataset,
+    Features,
+    concatenate_datasets,
+    load_from_disk,
+)
+from kink import inject
+from pydantic import BaseModel, Field
+from scipy.fft import dct
+from scipy.signal import resample_poly
+
+from DashAI.back.dataloaders.classes.dataset_store import hash_file
+
+logger = logging.getLogger(__name__)
+
+
+class AudioFeatureConfig(BaseModel):
+    """Configuration of the features extracted from the audio clips."""
+
+    feature: Literal["log_mel", "mfcc"] = "log_mel"
+    sampling_rate: int = Field(16000, gt=0)
+    max_duration: float = Field(10.0, gt=0)
+    n_fft: int = Field(400, gt=0)
+    hop_length: int = Field(160, gt=0)
+    n_mels: int = Field(80, gt=0)
+    n_mfcc: int = Field(13, gt=0)
+
+    def key(self) -> str:
+        """Hash of the configuration, used to key the features cache."""
+        return hashlib.sha256(self.model_dump_json().encode()).hexdigest()
+
+    def shape(self) -> Tuple[int, int]:
+        """Shape (features, frames) of the features of every clip."""
+        n_samples = round(self.max_duration * self.sampling_rate)
+        n_frames = 1 + (n_samples + 2 * (self.n_fft // 2) - self.n_fft) // (
+            self.hop_length
+        )
+        n_features = self.n_mfcc if self.feature == "mfcc" else self.n_mels
+        return n_features, n_frames
+
+
+def decode_audio(audio: Dict[str, Any]) -> Tuple[np.ndarray, int]:
+    """Decode an audio clip as a mono waveform.
+
+    The clips are decoded with soundfile when it is installed, otherwise only
+    PCM WAV files are supported.
+
+    Parameters
+    ----------
+    audio : Dict[str, Any]
+        The clip in the storage format of the HuggingFace Audio feature, i.e., a
+        dict with the encoded bytes (None if the clip is only stored as a file)
+        and its path.
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        The waveform (float32 values in [-1, 1]) and its sampling rate.
+
+    Raises
+    ------
+    ValueError
+        If the clip can not be decoded.
+    """
+    source = io.BytesIO(audio["bytes"]) if audio["bytes"] else audio["path"]
+
+    if importlib.util.find_spec("soundfile") is not None:
+        import soundfile
+
+        try:
+            samples, sampling_rate = soundfile.read(
+                source, dtype="float32", always_2d=True
+            )
+        except RuntimeError as e:
+            raise ValueError(f"Unable to decode audio {audio['path']}: {e}") from e
+        return samples.mean(axis=1), sampling_rate
+
+    try:
+        with wave.open(source, "rb") as wav_file:
+            sample_width = wav_file.getsampwidth()
+            n_channels = wav_file.getnchannels()
+            sampling_rate = wav_file.getframerate()
+            frames = wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Unable to decode audio {audio['path']}: {e}") from e
+
+    if sample_width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width in (2, 4):
+        dtype = np.int16 if sample_width == 2 else np.int32
+        samples = np.frombuffer(frames, dtype=dtype) / float(np.iinfo(dtype).max + 1)
+    else:
+        raise ValueError(
+            f"Unable to decode audio {audio['path']}: {8 * sample_width}-bit WAV "
+            "files require soundfile."
+        )
+    samples = samples.reshape(-1, n_channels).mean(axis=1)
+    return samples.astype(np.float32), sampling_rate
+
+
+def _mel_filterbank(config: AudioFeatureConfig) -> np.ndarray:
+    """Triangular filters (n_mels, n_fft // 2 + 1) on the HTK mel scale."""
+    max_mel = 2595 * math.log10(1 + (config.sampling_rate / 2) / 700)
+    hz_points = 700 * (10 ** (np.linspace(0, max_mel, config.n_mels + 2) / 2595) - 1)
+    fft_freqs = np.linspace(0, config.sampling_rate / 2, config.n_fft // 2 + 1)
+
+    lower = hz_points[:-2, None]
+    center = hz_points[1:-1, None]
+    upper = hz_points[2:, None]
+    rising = (fft_freqs - lower) / np.maximum(center - lower, 1e-10)
+    falling = (upper - fft_freqs) / np.maximum(upper - center, 1e-10)
+    return np.maximum(0, np.minimum(rising, falling))
+
+
+def compute_audio_features(
+    waveform: np.ndarray, sampling_rate: int, config: AudioFeatureConfig
+) -> np.ndarray:
+    """Resample a waveform and compute its fixed-shape features.
+
+    The waveform is padded with zeros (or truncated) to config.max_duration
+    seconds, so every clip has the same number of frames.
+
+    Parameters
+    ----------
+    waveform : np.ndarray
+        The mono waveform.
+    sampling_rate : int
+        Sampling rate of the waveform.
+    config : AudioFeatureConfig
+        The features configuration.
+
+    Returns
+    -------
+    np.ndarray
+        float32 array with shape `config.shape()`.
+    """
+    if sampling_rate != config.sampling_rate:
+        factor = math.gcd(sampling_rate, config.sampling_rate)
+        waveform = resample_poly(
+            waveform, config.sampling_rate // factor, sampling_rate // factor
+        )
+
+    n_samples = round(config.max_duration * config.sampling_rate)
+    waveform = np.pad(waveform[:n_samples], (0, max(0, n_samples - len(waveform))))
+    waveform = np.pad(waveform, config.n_fft // 2)
+
+    frames = np.lib.stride_tricks.sliding_window_view(waveform, config.n_fft)[
+        :: config.hop_length
+    ]
+    power = np.abs(np.fft.rfft(frames * np.hanning(config.n_fft), axis=1)) ** 2
+    log_mel = 10 * np.log10(np.maximum(_mel_filterbank(config) @ power.T, 1e-10))
+
+    if config.feature == "mfcc":
+        return dct(log_mel, type=2, axis=0, norm="ortho")[: config.n_mfcc].astype(
+            np.float32
+        )
+    return log_mel.astype(np.float32)
+
+
+def _hash_batch(audios: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Hash the encoded content of a batch of clips."""
+    return {
+        "audio_hash": [
+            hashlib.sha256(audio["bytes"]).hexdigest()
+            if audio["bytes"]
+            else hash_file(audio["path"])
+            for audio in audios
+        ]
+    }
+
+
+def _features_batch(
+    audios: List[Dict[str, Any]], config: Dict[str, Any]
+) -> Dict[str, List[np.ndarray]]:
+    """Decode a batch of clips and compute their features."""
+    feature_config = AudioFeatureConfig(**config)
+    return {
+        "features": [
+            compute_audio_features(*decode_audio(audio), feature_config)
+            for audio in audios
+        ]
+    }
+
+
+def _load_cache(cache_path: pathlib.Path) -> Optional[Dataset]:
+    """Load every shard of the features cache of a configuration."""
+    shards = [
+        load_from_disk(str(shard_path))
+        for shard_path in sorted(cache_path.glob("*"))
+        if shard_path.is_dir() and not shard_path.name.endswith(".tmp")
+    ]
+    return concatenate_datasets(shards) if shards else None
+
+
+@inject
+@beartype
+def extract_audio_features(
+    dataset: Dataset,
+    feature_config: AudioFeatureConfig,
+    audio_column: str = "audio",
+    output_column: str = "audio_features",
+    num_proc: Optional[int] = None,
+    batch_size: int = 32,
+    config: Dict[str, Any] = lambda di: di["config"],
+) -> Dataset:
+    """Add the features of the audio clips of a dataset as a new column.
+
+    Clips are decoded, resampled and converted to features lazily, in batched
+    `map` calls that may run in several processes. The features are cached in
+    Arrow shards keyed by the hash of each clip and by the features
+    configuration, so only the clips never seen with this configuration are
+    decoded, even by other experiments or datasets.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        Dataset with an audio column, e.g. loaded with the AudioDataLoader.
+    feature_config : AudioFeatureConfig
+        The configuration of the features.
+    audio_column : str
+        Name of the audio column, by default "audio".
+    output_column : str
+        Name of the column with the features, by default "audio_features".
+    num_proc : Optional[int]
+        Number of processes used to compute the features, by default one.
+    batch_size : int
+        Number of clips decoded by each map call, by default 32.
+    config : Dict[str, Any]
+        Application settings, provided by dependency injection.
+
+    Returns
+    -------
+    Dataset
+        The dataset with the new column of fixed-shape float32 arrays.
+    """
+    dataset = dataset.cast_column(audio_column, Audio(decode=False))
+    cache_path = pathlib.Path(config["AUDIO_FEATURES_PATH"]) / feature_config.key()
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    hashes = dataset.map(
+        _hash_batch,
+        batched=True,
+        batch_size=batch_size,
+        input_columns=[audio_column],
+        remove_columns=dataset.column_names,
+        num_proc=num_proc,
+        desc="Hashing audio clips",
+    )["audio_hash"]
+
+    cache = _load_cache(cache_path)
+    index: Dict[str, int] = {}
+    if cache is not None:
+        for row, audio_hash in enumerate(cache["audio_hash"]):
+            index.setdefault(audio_hash, row)
+
+    missing_rows: Dict[str, int] = {}
+    for row, audio_hash in enumerate(hashes):
+        if audio_hash not in index:
+            missing_rows.setdefault(audio_hash, row)
+
+    if missing_rows:
+        logger.debug("Computing the features of %d audio clips.", len(missing_rows))
+        missing = dataset.select(list(missing_rows.values()))
+        features = missing.map(
+            _features_batch,
+            batched=True,
+            batch_size=batch_size,
+            input_columns=[audio_column],
+            remove_columns=missing.column_names,
+            features=Features(
+                {"features": Array2D(shape=feature_config.shape(), dtype="float32")}
+            ),
+            fn_kwargs={"config": feature_config.model_dump()},
+            num_proc=num_proc,
+            desc="Computing audio features",
+        ).add_column("audio_hash", list(missing_rows.keys()))
+
+        # the shard is published atomically, so concurrent readers never see it
+        # partially written.
+        shard_name = uuid.uuid4().hex
+        features.save_to_disk(str(cache_path / f"{shard_name}.tmp"))
+        os.replace(cache_path / f"{shard_name}.tmp", cache_path / shard_name)
+
+        cache = _load_cache(cache_path)
+        index = {}
+        for row, audio_hash in enumerate(cache["audio_hash"]):
+            index.setdefault(audio_hash, row)
+
+    clip_features = (
+        cache.select([index[audio_hash] for audio_hash in hashes])
+        .select_columns(["features"])
+        .rename_column("features", output_column)
+    )
+    return concatenate_datasets([dataset, clip_features], axis=1)
@@ -0,0 +1,280 @@
+"""DashAI base dataloader for columnar (Arrow based) file formats."""
+
+import ast
+import glob
+import os
+import pathlib
+import re
+import shutil
+import uuid
+from typing import Any, Dict, List, Optional, Union
+
+import datasets
+import fsspec.core
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+from beartype import beartype
+from datasets import Dataset, DatasetDict
+from datasets.builder import DatasetGenerationError
+from starlette.datastructures import UploadFile
+
+from DashAI.back.core.schema_fields import (
+    bool_field,
+    none_type,
+    schema_field,
+    string_field,
+)
+from DashAI.back.core.schema_fields.base_schema import BaseSchema
+from DashAI.back.dataloaders.classes.dataloader import (
+    BaseDataLoader,
+    DataloaderMoreOptionsSchema,
+    DatasetSplitsSchema,
+)
+
+_CONDITION = re.compile(
+    r"^\s*(?P<column>.+?)\s*(?P<operator>==|!=|>=|<=|>|<|\bnot in\b|\bin\b)"
+    r"\s*(?P<value>.+?)\s*$"
+)
+_CONJUNCTION = re.compile(r"\s+and\s+", flags=re.IGNORECASE)
+
+
+class ColumnarDataloaderSchema(BaseSchema):
+    name: schema_field(
+        none_type(string_field()),
+        "",
+        (
+            "Custom name to register your dataset. If no name is specified, "
+            "the name of the uploaded file will be used."
+        ),
+    )  # type: ignore
+    columns: schema_field(
+        none_type(string_field()),
+        placeholder=None,
+        description="""
+        Comma separated list of the names of the columns to load (e.g. "age,sex").
+        Only these columns are read from the files.
+        If null, all the columns will be loaded.
+        """,
+    )  # type: ignore
+    filter: schema_field(
+        none_type(string_field()),
+        placeholder=None,
+        description="""
+        Conditions that the rows must satisfy to be loaded, joined with "and"
+        (e.g. age >= 30 and sex == "F" and city in ["Lima", "Quito"]).
+        The supported operators are ==, !=, >, >=, <, <=, in and not in.
+        If null, all the rows will be loaded.
+        """,
+    )  # type: ignore
+    splits_in_folders: schema_field(
+        bool_field(),
+        False,
+        (
+            "If your data has folders that define the splits select 'true', "
+            "otherwise 'false'."
+        ),
+    )  # type: ignore
+    splits: DatasetSplitsSchema
+    more_options: DataloaderMoreOptionsSchema
+
+
+@beartype
+def parse_filter(filter_string: Optional[str]) -> Optional[pc.Expression]:
+    """Parse the rows filter of the dataloader into an Arrow expression.
+
+    Parameters
+    ----------
+    filter_string : Optional[str]
+        Conditions joined with "and", each one with the form
+        `<column> <operator> <value>`, where value is a Python literal.
+
+    Returns
+    -------
+    Optional[pc.Expression]
+        The expression that selects the rows, or None if there is no filter.
+
+    Raises
+    ------
+    ValueError
+        If some condition is not valid.
+    """
+    if filter_string is None or not filter_string.strip():
+        return None
+
+    expression = None
+    for condition in _CONJUNCTION.split(filter_string.strip()):
+        match = _CONDITION.match(condition)
+        if match is None:
+            raise ValueError(f"Invalid filter condition: {condition!r}.")
+        try:
+            value = ast.literal_eval(match["value"])
+        except (ValueError, SyntaxError) as e:
+            raise ValueError(
+                f"Invalid value in filter condition {condition!r}: {match['value']}"
+            ) from e
+
+        field = pc.field(match["column"])
+        operator = match["operator"]
+        if operator == "==":
+            condition_expression = field == value
+        elif operator == "!=":
+            condition_expression = field != value
+        elif operator == ">":
+            condition_expression = field > value
+        elif operator == ">=":
+            condition_expression = field >= value
+        elif operator == "<":
+            condition_expression = field < value
+        elif operator == "<=":
+            condition_expression = field <= value
+        elif operator == "in":
+            condition_expression = field.isin(value)
+        else:
+            condition_expression = ~field.isin(value)
+
+        expression = (
+            condition_expression
+            if expression is None
+            else expression & condition_expression
+        )
+
+    return expression
+
+
+def parse_columns(columns: Optional[str]) -> Optional[List[str]]:
+    """Parse the comma separated list of columns to load (None for all)."""
+    if columns is None or not columns.strip():
+        return None
+    return [column.strip() for column in columns.split(",") if column.strip()]
+
+
+class ColumnarDataLoader(BaseDataLoader):
+    """Base data loader for columnar files, read with pyarrow datasets.
+
+    Subclasses define the pyarrow dataset FORMAT of their files.
+    """
+
+    COMPATIBLE_COMPONENTS = [
+        "TabularClassificationTask",
+        "TextClassificationTask",
+        "TranslationTask",
+    ]
+    SCHEMA = ColumnarDataloaderSchema
+    FORMAT: str
+
+    def _read_files(self, paths: List[str], params: Dict[str, Any]) -> Dataset:
+        """Read the selected columns and rows of the files of a split.
+
+        The files are scanned by batches, which are written to an Arrow file of
+        the datasets cache as they are read, so the split is loaded in bounded
+        memory and the returned dataset memory maps that file, not the files of
+        the split.
+
+        Parameters
+        ----------
+        paths : List[str]
+            Paths (or URLs) of the files of the split.
+        params : Dict[str, Any]
+            Dict with the dataloader parameters.
+
+        Returns
+        -------
+        Dataset
+            The data of the split.
+        """
+        if "://" in paths[0]:
+            filesystem, _ = fsspec.core.url_to_fs(paths[0])
+        else:
+            filesystem = pafs.LocalFileSystem()
+
+        scanner = ds.dataset(paths, format=self.FORMAT, filesystem=filesystem).scanner(
+            columns=parse_columns(params.get("columns")),
+            filter=parse_filter(params.get("filter")),
+        )
+
+        cache_path = (
+            pathlib.Path(datasets.config.HF_DATASETS_CACHE) / "columnar_dataloader"
+        )
+        cache_path.mkdir(parents=True, exist_ok=True)
+        arrow_path = str(cache_path / f"{uuid.uuid4().hex}.arrow")
+        try:
+            with pa.ipc.new_stream(arrow_path, scanner.projected_schema) as writer:
+                for batch in scanner.to_batches():
+                    writer.write_batch(batch)
+        except BaseException:
+            os.remove(arrow_path)
+            raise
+        return Dataset.from_file(arrow_path)
+
+    @beartype
+    def load_data(
+        self,
+        filepath_or_buffer: Union[UploadFile, str],
+        temp_path: str,
+        params: Dict[str, Any],
+    ) -> DatasetDict:
+        """Load the columnar dataset into a DatasetDict.
+
+        Only the selected columns are read, and the filter is pushed down to
+        the reader, which skips the blocks of rows that can not satisfy it. The
+        read rows are streamed to the datasets cache, so the uploaded files are
+        removed once loaded.
+
+        Parameters
+        ----------
+        filepath_or_buffer : Union[UploadFile, str], optional
+            An URL where the dataset is located or a FastAPI/Uvicorn uploaded file
+            object.
+        temp_path : str
+            The temporary path where the files will be extracted and then uploaded.
+        params : Dict[str, Any]
+            Dict with the dataloader parameters. The options are:
+            - `columns` (str, optional): Comma separated list of the columns to
+              load. By default, all the columns.
+            - `filter` (str, optional): Conditions joined with "and" that the
+              rows must satisfy. By default, all the rows.
+
+        Returns
+        -------
+        DatasetDict
+            A HuggingFace's Dataset with the loaded data.
+        """
+        try:
+            if isinstance(filepath_or_buffer, str):
+                dataset = DatasetDict(
+                    {"train": self._read_files([filepath_or_buffer], params)}
+                )
+
+            elif isinstance(filepath_or_buffer, UploadFile):
+                files_path = self.extract_files(temp_path, filepath_or_buffer)
+                if files_path.split("/")[-1] == "files":
+                    split_files = {
+                        "train": glob.glob(files_path + "/train/*"),
+                        "test": glob.glob(files_path + "/test/*"),
+                        "validation": glob.glob(files_path + "/val/*")
+                        + glob.glob(files_path + "/validation/*"),
+                    }
+                    try:
+                        dataset = DatasetDict(
+                            {
+                                split: self._read_files(sorted(files), params)
+                                for split, files in split_files.items()
+                                if files
+                            }
+                        )
+                    finally:
+                        shutil.rmtree(files_path, ignore_errors=True)
+                else:
+                    try:
+                        dataset = DatasetDict(
+                            {"train": self._read_files([files_path], params)}
+                        )
+                    finally:
+                        os.remove(files_path)
+
+        except ValueError as e:
+            raise DatasetGenerationError from e
+
+        return dataset
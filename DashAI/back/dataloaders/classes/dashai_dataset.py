@@ -3,10 +3,13 @@
 import json
 import os
 import pathlib
-from typing import Dict, List, Literal, Tuple, Union
+import shutil
+import uuid
+from typing import Dict, Iterator, List, Literal, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 from beartype import beartype
 from datasets import (
     ClassLabel,
@@ -17,7 +20,6 @@ from datasets import (
     load_from_disk,
 )
 from datasets.table import Table
-from sklearn.model_selection import train_test_split
 
 
 class DashAIDataset(Dataset):
@@ -228,6 +230,65 @@ def save_dataset(datasetdict: DatasetDict, path: Union[str, pathlib.Path]) -> No
         )
 
 
+@beartype
+def save_prepared_dataset(
+    x: DatasetDict, y: DatasetDict, path: Union[str, pathlib.Path]
+) -> None:
+    """Publish the input and output columns of a prepared dataset.
+
+    The splits are stored as Arrow files, so any process can attach to them with
+    `load_prepared_dataset` without copying the data to its memory.
+    The dataset is first written in a temporary directory and then moved to its
+    final path, so a partially written dataset is never loaded. If another
+    process published the dataset first, the written copy is discarded.
+
+    Parameters
+    ----------
+    x : DatasetDict
+        Input columns of the prepared dataset.
+    y : DatasetDict
+        Output columns of the prepared dataset.
+    path : Union[str, pathlib.Path]
+        Path where the prepared dataset will be stored.
+    """
+    path = pathlib.Path(path)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        save_dataset(x, tmp_path / "x")
+        save_dataset(y, tmp_path / "y")
+        os.rename(tmp_path, path)
+    except OSError:
+        if not path.exists():
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+@beartype
+def load_prepared_dataset(
+    path: Union[str, pathlib.Path],
+) -> Tuple[DatasetDict, DatasetDict]:
+    """Attach to a prepared dataset published with `save_prepared_dataset`.
+
+    The splits are memory-mapped, so the processes that load the same prepared
+    dataset share its data instead of holding private copies.
+
+    Parameters
+    ----------
+    path : Union[str, pathlib.Path]
+        Path where the prepared dataset is stored.
+
+    Returns
+    -------
+    Tuple[DatasetDict, DatasetDict]
+        The input and output columns of the prepared dataset.
+    """
+    return (
+        load_dataset(str(pathlib.Path(path) / "x")),
+        load_dataset(str(pathlib.Path(path) / "y")),
+    )
+
+
 @beartype
 def check_split_values(
     train_size: float,
@@ -300,6 +361,9 @@ def split_indexes(
     Tuple[List, List, List]
         Train, Test and Validation indexes.
     """
+    # sklearn is imported here since it is slow to import and this module is
+    # imported at startup.
+    from sklearn.model_selection import train_test_split
 
     # Generate shuffled indexes
     np.random.seed(seed)
@@ -391,6 +455,103 @@ def to_dashai_dataset(dataset: DatasetDict) -> DatasetDict:
     return dataset
 
 
+def _encode_classes(batch: pa.Table, classes: Dict[str, pa.Array]) -> pa.Table:
+    """Replace the values of some columns of a batch by their index in classes."""
+    for column, column_classes in classes.items():
+        batch = batch.set_column(
+            batch.schema.get_field_index(column),
+            column,
+            pc.cast(pc.index_in(batch[column], column_classes), pa.int64()),
+        )
+    return batch
+
+
+def encode_class_columns(dataset: DatasetDict, columns: List[str]) -> DatasetDict:
+    """Encode some columns of every split as ClassLabel columns.
+
+    The classes of each column are the sorted unique values of the column over
+    all the splits, so every split shares the same encoding. The values are
+    encoded with Arrow compute functions, without converting the columns into
+    Python objects, by a batched map that writes the encoded splits to their
+    cache files, so splits loaded from disk remain memory-mapped. Null values
+    remain null, and the columns that already are ClassLabel columns are not
+    changed.
+
+    Parameters
+    ----------
+    dataset : DatasetDict
+        The dataset whose columns are encoded.
+    columns : List[str]
+        Names of the columns to encode.
+
+    Returns
+    -------
+    DatasetDict
+        A new dataset with the encoded columns, where each split has the type of
+        the original split.
+
+    Raises
+    ------
+    ValueError
+        If some column does not exist or its values can not be encoded.
+    """
+    splits = list(dataset)
+    if not splits:
+        return dataset
+    for column in columns:
+        if column not in dataset[splits[0]].column_names:
+            raise ValueError(
+                f"Error while encoding the classes: column '{column}' does not "
+                "exist in dataset."
+            )
+    columns = [
+        column
+        for column in columns
+        if not isinstance(dataset[splits[0]].features[column], ClassLabel)
+    ]
+    if not columns:
+        return dataset
+
+    arrow_splits = {split: dataset[split].with_format("arrow") for split in splits}
+    classes: Dict[str, pa.Array] = {}
+    for column in columns:
+        # only the column is read, taking the selected rows of each split.
+        split_values = [arrow_splits[split][column] for split in splits]
+        try:
+            values = pa.chunked_array(
+                [chunk for values in split_values for chunk in values.chunks],
+                type=split_values[0].type,
+            )
+            column_classes = pc.unique(values).drop_null()
+            classes[column] = column_classes.take(pc.array_sort_indices(column_classes))
+        except pa.ArrowException as e:
+            raise ValueError(
+                f"The values of column '{column}' can not be encoded as classes."
+            ) from e
+
+    encoded_dataset = DatasetDict()
+    for split in splits:
+        features = dataset[split].features.copy()
+        for column, column_classes in classes.items():
+            features[column] = ClassLabel(
+                names=[str(class_name) for class_name in column_classes.to_pylist()]
+            )
+        encoded_split = arrow_splits[split].map(
+            _encode_classes,
+            batched=True,
+            features=features,
+            fn_kwargs={"classes": classes},
+            desc=f"Encoding the classes of the {split} split",
+        )
+        encoded_dataset[split] = type(dataset[split])(
+            encoded_split.data,
+            info=encoded_split.info,
+            split=encoded_split.split,
+            fingerprint=encoded_split._fingerprint,
+        )
+    return encoded_dataset
+
+
 @beartype
 def validate_inputs_outputs(
     datasetdict: DatasetDict,
@@ -493,6 +654,32 @@ def select_columns(
     return (input_columns_dataset, output_columns_dataset)
 
 
+def iter_batches(dataset: Dataset, batch_size: int) -> Iterator[DashAIDataset]:
+    """Iterate over consecutive batches of rows of a dataset.
+
+    The batches are views of the dataset (no rows are copied), so only the batches
+    that are being used are loaded in memory.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        Dataset to iterate.
+    batch_size : int
+        Maximum number of rows of each batch.
+
+    Yields
+    ------
+    DashAIDataset
+        The batches of the dataset, in order.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}.")
+
+    for start in range(0, len(dataset), batch_size):
+        batch = dataset.select(range(start, min(start + batch_size, len(dataset))))
+        yield DashAIDataset(batch.data, info=batch.info, indices_table=batch._indices)
+
+
 @beartype
 def get_columns_spec(dataset_path: str) -> Dict[str, Dict]:
     """Return the column with their respective types
@@ -545,14 +732,16 @@ def update_columns_spec(dataset_path: str, columns: Dict) -> DatasetDict:
 
     # load the dataset from where its stored
     dataset_dict = load_from_disk(dataset_path=dataset_path)
+    # the class columns are encoded with the same classes in every split
+    dataset_dict = encode_class_columns(
+        dataset_dict,
+        [column for column in columns if columns[column].type == "ClassLabel"],
+    )
     for split in dataset_dict:
         # copy the features with the columns ans types
-        new_features = dataset_dict[split].features
+        new_features = dataset_dict[split].features.copy()
         for column in columns:
-            if columns[column].type == "ClassLabel":
-                names = list(set(dataset_dict[split][column]))
-                new_features[column] = ClassLabel(names=names)
-            elif columns[column].type == "Value":
+            if columns[column].type == "Value":
                 new_features[column] = Value(columns[column].dtype)
 
         # cast the column types with the changes
@@ -1,9 +1,12 @@
 """DashAI base class for dataloaders."""
 
-import io
 import logging
+import os
+import shutil
+import tempfile
 import zipfile
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Final, Union
 
 from datasets import DatasetDict
@@ -20,6 +23,9 @@ from DashAI.back.core.schema_fields.base_schema import BaseSchema
 
 logger = logging.getLogger(__name__)
 
+# size of the chunks in which the uploaded files are copied.
+CHUNK_SIZE = 1 << 20
+
 
 class DatasetSplitsSchema(BaseSchema):
     train_size: schema_field(
@@ -106,9 +112,24 @@ class BaseDataLoader(ConfigObject):
         """
         raise NotImplementedError
 
+    def _extract_member(
+        self, zip_file: zipfile.ZipFile, member: zipfile.ZipInfo, files_path: str
+    ) -> None:
+        """Extract a member of a zip file, creating its parent folders first so
+        members can be extracted concurrently."""
+        parent_folders = [
+            part for part in member.filename.split("/")[:-1] if part not in ("..", ".")
+        ]
+        os.makedirs(os.path.join(files_path, *parent_folders), exist_ok=True)
+        zip_file.extract(member, path=files_path)
+
     def extract_files(self, dataset_path: str, file: UploadFile) -> str:
         """Extract the files to load the data in a DataDict later.
 
+        The upload is copied by chunks to a temporary file (unless it already is
+        a seekable file), and the members of a zip file are streamed from it and
+        extracted by a pool of threads, so the upload is never held in memory.
+
         Args:
             dataset_path (str): Path where dataset will be saved.
             file (UploadFile): File uploaded for the user.
@@ -119,13 +140,26 @@ class BaseDataLoader(ConfigObject):
         """
         if file.content_type == "application/zip":
             files_path = f"{dataset_path}/files"
-            with zipfile.ZipFile(
-                file=io.BytesIO(file.file.read()),
-                mode="r",
-            ) as zip_file:
-                zip_file.extractall(path=files_path)
+            with tempfile.TemporaryFile() as spooled_file:
+                if file.file.seekable():
+                    file.file.seek(0)
+                    zip_source = file.file
+                else:
+                    shutil.copyfileobj(file.file, spooled_file, CHUNK_SIZE)
+                    zip_source = spooled_file
+
+                with zipfile.ZipFile(file=zip_source, mode="r") as zip_file:
+                    members = zip_file.infolist()
+                    with ThreadPoolExecutor() as executor:
+                        for future in [
+                            executor.submit(
+                                self._extract_member, zip_file, member, files_path
+                            )
+                            for member in members
+                        ]:
+                            future.result()
         else:
             files_path = f"{dataset_path}/{file.filename}"
             with open(files_path, "wb") as f:
-                f.write(file.file.read())
+                shutil.copyfileobj(file.file, f, CHUNK_SIZE)
         return files_path
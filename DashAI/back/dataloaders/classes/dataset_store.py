@@ -0,0 +1,120 @@
+"""Content addressed storage of the Arrow shards of the datasets."""
+
+import hashlib
+import logging
+import os
+import pathlib
+import uuid
+from typing import Union
+
+from beartype import beartype
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20
+# the state of a split stores a random fingerprint, so it is not part of the content.
+_IGNORED_FILES = ["state.json"]
+
+
+@beartype
+def hash_file(path: Union[str, pathlib.Path]) -> str:
+    """Compute the SHA-256 digest of a file, reading it by chunks.
+
+    Parameters
+    ----------
+    path : Union[str, pathlib.Path]
+        Path of the file.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link_shard(file_path: pathlib.Path, shard_path: pathlib.Path) -> None:
+    """Make a dataset file and its shard in the store the same file on disk."""
+    try:
+        # the first dataset with this content publishes its file as the shard.
+        os.link(file_path, shard_path)
+        return
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.warning("Unable to store shard %s, keeping a copy: %s", shard_path, e)
+        return
+
+    tmp_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        os.link(shard_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        logger.warning("Unable to link shard %s, keeping a copy: %s", shard_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+@beartype
+def store_dataset_shards(
+    dataset_path: Union[str, pathlib.Path], shards_path: Union[str, pathlib.Path]
+) -> str:
+    """Deduplicate the Arrow shards of a saved dataset and compute its fingerprint.
+
+    Each Arrow file of the dataset is hashed and hard linked with the shard of
+    the store that has the same content, so identical datasets (or splits)
+    uploaded several times are stored once. When the file system does not
+    support hard links, the dataset keeps its own copy of the files.
+
+    The fingerprint of the dataset is the hash of the content of its files, so
+    it can be used as key of any cache derived from the dataset data.
+
+    Parameters
+    ----------
+    dataset_path : Union[str, pathlib.Path]
+        Path where the dataset was saved with `save_dataset`.
+    shards_path : Union[str, pathlib.Path]
+        Path of the shards store.
+
+    Returns
+    -------
+    str
+        The fingerprint of the dataset.
+    """
+    dataset_path = pathlib.Path(dataset_path)
+    shards_path = pathlib.Path(shards_path)
+    shards_path.mkdir(parents=True, exist_ok=True)
+
+    manifest = []
+    for file_path in sorted(dataset_path.rglob("*")):
+        if not file_path.is_file() or file_path.name in _IGNORED_FILES:
+            continue
+        file_hash = hash_file(file_path)
+        manifest.append(f"{file_path.relative_to(dataset_path).as_posix()}:{file_hash}")
+        if file_path.suffix == ".arrow":
+            _link_shard(file_path, shards_path / f"{file_hash}.arrow")
+
+    return hashlib.sha256("\n".join(manifest).encode()).hexdigest()
+
+
+@beartype
+def release_dataset_shards(shards_path: Union[str, pathlib.Path]) -> None:
+    """Remove the shards of the store that are not used by any dataset.
+
+    A shard is not used when the store holds its only link, i.e., every dataset
+    that shared it was deleted.
+
+    Parameters
+    ----------
+    shards_path : Union[str, pathlib.Path]
+        Path of the shards store.
+    """
+    for shard_path in pathlib.Path(shards_path).glob("*.arrow"):
+        try:
+            if shard_path.stat().st_nlink == 1:
+                shard_path.unlink()
+        except OSError as e:
+            logger.warning("Unable to release shard %s: %s", shard_path, e)
@@ -1,14 +1,19 @@
 """DashAI Excel Dataloader."""
 
 import glob
+import importlib.util
 import os
 import shutil
-from typing import Any, Dict, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
 from beartype import beartype
 from datasets import Dataset, DatasetDict
 from datasets.builder import DatasetGenerationError
+from datasets.table import InMemoryTable
 from starlette.datastructures import UploadFile
 
 from DashAI.back.core.schema_fields import (
@@ -68,12 +73,101 @@ class ExcelDataloaderSchema(BaseSchema):
     more_options: DataloaderMoreOptionsSchema
 
 
+@lru_cache(maxsize=None)
+def get_excel_engine() -> Optional[str]:
+    """Obtain the fastest Excel engine available for pandas.
+
+    The calamine engine (a read-only Rust parser) is used when python-calamine is
+    installed and pandas supports it (pandas >= 2.2). Otherwise, pandas chooses
+    its default engine (openpyxl for xlsx files).
+
+    Returns
+    -------
+    Optional[str]
+        The name of the engine, or None to use the pandas default.
+    """
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    if pandas_version >= (2, 2) and importlib.util.find_spec("python_calamine"):
+        return "calamine"
+    return None
+
+
+def read_excel_file(path: str, params: Dict[str, Any]) -> pa.Table:
+    """Read a sheet of an Excel file as an Arrow table.
+
+    Parameters
+    ----------
+    path : str
+        Path or URL of the Excel file.
+    params : Dict[str, Any]
+        Dict with the dataloader parameters (sheet, header and usecols).
+
+    Returns
+    -------
+    pa.Table
+        The sheet data.
+    """
+    df = pd.read_excel(
+        io=path,
+        sheet_name=params["sheet"],
+        header=params["header"],
+        usecols=params["usecols"],
+        engine=get_excel_engine(),
+    )
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
 class ExcelDataLoader(BaseDataLoader):
     """Data loader for tabular data in Excel files."""
 
     COMPATIBLE_COMPONENTS = ["TabularClassificationTask"]
     SCHEMA = ExcelDataloaderSchema
 
+    def _read_files(self, paths: List[str], params: Dict[str, Any]) -> Dataset:
+        """Read the Excel files of a split and concatenate them.
+
+        The files are parsed in parallel processes, and each one is converted
+        directly to an Arrow table. The tables are concatenated without copying
+        their data when all of them have the same schema.
+
+        Parameters
+        ----------
+        paths : List[str]
+            Paths of the Excel files of the split.
+        params : Dict[str, Any]
+            Dict with the dataloader parameters.
+
+        Returns
+        -------
+        Dataset
+            The split data.
+
+        Raises
+        ------
+        ValueError
+            If the split has no files or some file can not be read.
+        """
+        if not paths:
+            raise ValueError("No Excel files to read.")
+
+        read_file = partial(read_excel_file, params=params)
+        if len(paths) == 1:
+            tables = [read_file(paths[0])]
+        else:
+            n_workers = min(len(paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                tables = list(executor.map(read_file, paths))
+
+        try:
+            table = pa.concat_tables(tables)
+        except pa.ArrowInvalid:
+            # the files have different column types, so pandas upcasts them.
+            table = pa.Table.from_pandas(
+                pd.concat([table.to_pandas() for table in tables]),
+                preserve_index=False,
+            )
+        return Dataset(InMemoryTable(table))
+
     @beartype
     def load_data(
         self,
@@ -100,12 +194,12 @@ class ExcelDataLoader(BaseDataLoader):
         """
 
         if isinstance(filepath_or_buffer, str):
-            dataset_dict = dataset = pd.read_excel(
-                io=filepath_or_buffer,
-                sheet_name=params["sheet"],
-                header=params["header"],
-                usecols=params["usecols"],
-            )
+            try:
+                dataset_dict = DatasetDict(
+                    {"train": self._read_files([filepath_or_buffer], params)}
+                )
+            except ValueError as e:
+                raise DatasetGenerationError from e
 
         elif isinstance(filepath_or_buffer, UploadFile):
             file_path = self.extract_files(
@@ -119,50 +213,11 @@ class ExcelDataLoader(BaseDataLoader):
                     file_path + "/validation/*"
                 )
                 try:
-                    train_df_list = [
-                        pd.read_excel(
-                            io=file_path,
-                            sheet_name=params["sheet"],
-                            header=params["header"],
-                            usecols=params["usecols"],
-                        )
-                        for file_path in sorted(train_files)
-                    ]
-
-                    train_df = pd.concat(train_df_list)
-                    test_df_list = [
-                        pd.read_excel(
-                            io=file_path,
-                            sheet_name=params["sheet"],
-                            header=params["header"],
-                            usecols=params["usecols"],
-                        )
-                        for file_path in sorted(test_files)
-                    ]
-                    test_df_list = pd.concat(test_df_list)
-
-                    val_df_list = [
-                        pd.read_excel(
-                            io=file_path,
-                            sheet_name=params["sheet"],
-                            header=params["header"],
-                            usecols=params["usecols"],
-                        )
-                        for file_path in sorted(val_files)
-                    ]
-                    val_df = pd.concat(val_df_list)
-
                     dataset_dict = DatasetDict(
                         {
-                            "train": Dataset.from_pandas(
-                                train_df, preserve_index=False
-                            ),
-                            "test": Dataset.from_pandas(
-                                test_df_list, preserve_index=False
-                            ),
-                            "validation": Dataset.from_pandas(
-                                val_df, preserve_index=False
-                            ),
+                            "train": self._read_files(sorted(train_files), params),
+                            "test": self._read_files(sorted(test_files), params),
+                            "validation": self._read_files(sorted(val_files), params),
                         }
                     )
                 except ValueError as e:
@@ -173,13 +228,9 @@ class ExcelDataLoader(BaseDataLoader):
 
             else:
                 try:
-                    dataset = pd.read_excel(
-                        io=file_path,
-                        sheet_name=params["sheet"],
-                        header=params["header"],
-                        usecols=params["usecols"],
+                    dataset_dict = DatasetDict(
+                        {"train": self._read_files([file_path], params)}
                     )
-                    dataset_dict = DatasetDict({"train": Dataset.from_pandas(dataset)})
 
                 except ValueError as e:
                     raise DatasetGenerationError from e
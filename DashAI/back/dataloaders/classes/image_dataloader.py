@@ -1,19 +1,119 @@
 """DashAI Image Dataloader."""
 
-from typing import Any, Dict, Union
+import io
+import os
+from typing import Any, Dict, List, Optional, Union
 
 from beartype import beartype
-from datasets import DatasetDict, load_dataset
+from datasets import DatasetDict, Image, load_dataset
+from PIL import Image as PILImage
 from starlette.datastructures import UploadFile
 
 from DashAI.back.dataloaders.classes.dataloader import BaseDataLoader
 
+# number of images processed and written to the dataset cache at once.
+CHUNK_SIZE = 64
+
+
+def process_image(
+    image: Dict[str, Any], image_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """Decode an image to validate it and optionally resize it.
+
+    Parameters
+    ----------
+    image : Dict[str, Any]
+        The image in the storage format of the HuggingFace Image feature, i.e., a
+        dict with the encoded image bytes (None if the image is only stored as a
+        file) and its path.
+    image_size : Optional[int]
+        If given, the image is resized to image_size x image_size pixels and
+        encoded as PNG. Otherwise, the original encoded image is kept.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The image with its encoded bytes, in the same format.
+
+    Raises
+    ------
+    OSError
+        If the image can not be decoded, or resized and encoded as PNG.
+    """
+    path = image["path"]
+    try:
+        image_bytes = image["bytes"]
+        if image_bytes is None:
+            with open(path, "rb") as file:
+                image_bytes = file.read()
+        with PILImage.open(io.BytesIO(image_bytes)) as decoded_image:
+            decoded_image.load()
+            if image_size is None:
+                return {"bytes": image_bytes, "path": path}
+            resized_image = decoded_image.resize((image_size, image_size))
+        # PNG can not store CMYK images, which are common in JPEG files.
+        if resized_image.mode == "CMYK":
+            resized_image = resized_image.convert("RGB")
+        buffer = io.BytesIO()
+        resized_image.save(buffer, format="PNG")
+    except OSError as e:
+        raise OSError(f"Unable to decode image {path}: {e}") from e
+
+    return {"bytes": buffer.getvalue(), "path": path}
+
+
+def process_images(
+    batch: Dict[str, List[Any]], columns: List[str], image_size: Optional[int]
+) -> Dict[str, List[Any]]:
+    """Process the images of a batch of rows with `process_image`."""
+    return {
+        column: [process_image(image, image_size) for image in batch[column]]
+        for column in columns
+    }
+
 
 class ImageDataLoader(BaseDataLoader):
     """Data loader for data from image files."""
 
     COMPATIBLE_COMPONENTS = ["ImageClassificationTask"]
 
+    def _embed_images(
+        self, dataset: DatasetDict, image_size: Optional[int], n_workers: int
+    ) -> DatasetDict:
+        """Replace the images of each split with the processed images.
+
+        The images are decoded, validated and resized by chunks of CHUNK_SIZE
+        rows, in n_workers parallel processes, and each processed chunk is
+        written to the cache file of the split, so only a few chunks of images
+        are held in memory.
+        """
+        for split in dataset:
+            features = dataset[split].features
+            image_columns = [
+                column
+                for column, feature in features.items()
+                if isinstance(feature, Image)
+            ]
+            if not image_columns:
+                continue
+            # the images are processed in their storage format, without decoding.
+            split_dataset = dataset[split]
+            for column in image_columns:
+                split_dataset = split_dataset.cast_column(column, Image(decode=False))
+            split_dataset = split_dataset.map(
+                process_images,
+                fn_kwargs={"columns": image_columns, "image_size": image_size},
+                batched=True,
+                batch_size=CHUNK_SIZE,
+                writer_batch_size=CHUNK_SIZE,
+                num_proc=n_workers if len(split_dataset) > CHUNK_SIZE else None,
+                desc=f"Processing the images of the {split} split",
+            )
+            for column in image_columns:
+                split_dataset = split_dataset.cast_column(column, features[column])
+            dataset[split] = split_dataset
+        return dataset
+
     @beartype
     def load_data(
         self,
@@ -23,6 +123,11 @@ class ImageDataLoader(BaseDataLoader):
     ) -> DatasetDict:
         """Load an image dataset.
 
+        The images are decoded (to validate them), optionally resized and stored
+        in the dataset itself, so training and inference do not need to read and
+        resize the original files again. The images are processed by chunks in
+        a pool of processes, and each chunk is written to the dataset cache.
+
         Parameters
         ----------
         filepath_or_buffer : Union[UploadFile, str], optional
@@ -32,7 +137,11 @@ class ImageDataLoader(BaseDataLoader):
             The temporary path where the files will be extracted and then uploaded.
         params : Dict[str, Any]
             Dict with the dataloader parameters. The options are:
-            - `separator` (str): The character that delimits the CSV data.
+            - `image_size` (int, optional): Size in pixels of the side of the
+              square images that the dataset will store. If not given, the
+              images are stored as they were uploaded.
+            - `n_workers` (int, optional): Number of processes used to process
+              the images. By default, the number of CPUs.
 
         Returns
         -------
@@ -55,4 +164,8 @@ class ImageDataLoader(BaseDataLoader):
                     f"{filepath_or_buffer.content_type}"
                 )
 
-        return dataset
+        return self._embed_images(
+            dataset,
+            image_size=params.get("image_size"),
+            n_workers=params.get("n_workers") or os.cpu_count() or 1,
+        )
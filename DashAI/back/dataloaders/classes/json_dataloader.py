@@ -1,11 +1,23 @@
 """DashAI JSON Dataloader."""
 
+import glob
+import io
+import itertools
+import json
 import os
+import pathlib
+import re
 import shutil
-from typing import Any, Dict, Union
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
+import datasets
+import fsspec
+import pyarrow as pa
+import pyarrow.json as paj
 from beartype import beartype
-from datasets import DatasetDict, load_dataset
+from datasets import Dataset, DatasetDict
+from datasets.builder import DatasetGenerationError
 from starlette.datastructures import UploadFile
 
 from DashAI.back.core.schema_fields import (
@@ -21,6 +33,306 @@ from DashAI.back.dataloaders.classes.dataloader import (
     DatasetSplitsSchema,
 )
 
+# size in characters (or bytes for JSON Lines) of the chunks read from the files.
+CHUNK_SIZE = 1 << 24
+# number of records converted at once to an Arrow table.
+BATCH_SIZE = 10_000
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONReader:
+    """Incremental reader of the values of a JSON document.
+
+    The document is read by chunks, so only the values being decoded are kept
+    in memory.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _read(self, size: int) -> bool:
+        """Append a chunk to the buffer, dropping the text already consumed."""
+        chunk = self._file.read(size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip the whitespace and return the next character, or "" at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read(self._chunk_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expecting one of {chars!r}, got {char or 'EOF'!r}.")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next value of the document."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read(size):
+                    raise
+            else:
+                # a number at the end of the buffer may continue in the next chunk.
+                if end < len(self._buffer) or not self._read(size):
+                    self._pos = end
+                    return value
+            size *= 2
+
+    def array(self) -> Iterator[Any]:
+        """Decode the items of the next array one by one."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_json_records(path: str, data_key: Optional[str]) -> Iterator[Any]:
+    """Incrementally parse the records of a JSON document.
+
+    Parameters
+    ----------
+    path : str
+        Path or URL of the JSON file.
+    data_key : Optional[str]
+        Field of the top-level object that contains the list of records. If
+        None, the document must be the list of records.
+
+    Yields
+    ------
+    Any
+        The records of the document.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON or does not have the list of records.
+    """
+    with fsspec.open(path, "r", encoding="utf-8") as file:
+        reader = _JSONReader(file, CHUNK_SIZE)
+        if data_key is None:
+            yield from reader.array()
+        else:
+            found = False
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.expect("}")
+            else:
+                while True:
+                    key = reader.value()
+                    reader.expect(":")
+                    if key == data_key and not found:
+                        found = True
+                        yield from reader.array()
+                    else:
+                        reader.value()
+                    if reader.expect(",}") == "}":
+                        break
+            if not found:
+                raise ValueError(f"The field {data_key} was not found in the file.")
+        if reader.peek():
+            raise ValueError("Extra data after the end of the JSON document.")
+
+
+def _records_to_table(records: List[Any]) -> pa.Table:
+    """Convert a list of records (dicts) to an Arrow table."""
+    if not all(isinstance(record, dict) for record in records):
+        raise ValueError("The records of the JSON file must be dictionaries.")
+    columns = dict.fromkeys(key for record in records for key in record)
+    return pa.Table.from_pydict(
+        {column: [record.get(column) for record in records] for column in columns}
+    )
+
+
+def _parse_json_lines(data: bytes) -> pa.Table:
+    """Parse a block of complete JSON lines with the pyarrow block reader."""
+    block_size = 1 << 20
+    while True:
+        try:
+            return paj.read_json(
+                io.BytesIO(data), read_options=paj.ReadOptions(block_size=block_size)
+            )
+        except pa.ArrowInvalid as e:
+            # a single line is larger than the blocks parsed in parallel.
+            if "straddling" not in str(e) or block_size >= len(data):
+                raise
+            block_size *= 2
+
+
+def iter_json_lines_tables(path: str) -> Iterator[pa.Table]:
+    """Parse a JSON Lines file by chunks of complete lines.
+
+    Parameters
+    ----------
+    path : str
+        Path or URL of the JSON Lines file.
+
+    Yields
+    ------
+    pa.Table
+        The records of each chunk of the file.
+    """
+    with fsspec.open(path, "rb") as file:
+        remainder = b""
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            chunk = remainder + chunk
+            end = chunk.rfind(b"\n") + 1
+            remainder = chunk[end:]
+            if chunk[:end].strip():
+                yield _parse_json_lines(chunk[:end])
+        if remainder.strip():
+            yield _parse_json_lines(remainder)
+
+
+def _is_json_lines(path: str) -> bool:
+    """Check if a file without data_key is JSON Lines instead of a JSON list."""
+    with fsspec.open(path, "r", encoding="utf-8") as file:
+        return _JSONReader(file, 1 << 10).peek() != "["
+
+
+def iter_json_tables(path: str, data_key: Optional[str]) -> Iterator[pa.Table]:
+    """Parse a JSON or JSON Lines file as a stream of Arrow tables.
+
+    Parameters
+    ----------
+    path : str
+        Path or URL of the file.
+    data_key : Optional[str]
+        Field of the JSON document that contains the list of records. If None,
+        the file must be a list of records or JSON Lines.
+
+    Yields
+    ------
+    pa.Table
+        The records of the file, by batches.
+    """
+    if data_key is None and _is_json_lines(path):
+        yield from iter_json_lines_tables(path)
+        return
+
+    records = iter_json_records(path, data_key)
+    for batch in iter(lambda: list(itertools.islice(records, BATCH_SIZE)), []):
+        yield _records_to_table(batch)
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Convert a table to a schema that unifies its own schema with others."""
+    columns = [
+        table[field.name]
+        if field.name in table.column_names
+        else pa.nulls(len(table), field.type)
+        for field in schema
+    ]
+    try:
+        return pa.Table.from_arrays(columns, names=schema.names).cast(schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # nested values whose fields differ are converted through Python objects.
+        return pa.Table.from_pylist(table.to_pylist(), schema=schema)
+
+
+def read_json_files(paths: List[str], data_key: Optional[str]) -> Dataset:
+    """Stream JSON files into a memory mapped dataset.
+
+    The batches of records are written to Arrow files of the datasets cache as
+    they are parsed, so the files are loaded in bounded memory. A new file is
+    started whenever the schema of a batch changes, e.g. when a key appears
+    for the first time or an integer column has a float value. The schemas of
+    all the batches are then unified, promoting the types of each column (e.g.
+    integers to floats) and adding the columns missing from some records as
+    nulls, and the files are rewritten batch by batch with the unified schema.
+
+    Parameters
+    ----------
+    paths : List[str]
+        Paths (or URLs) of the files.
+    data_key : Optional[str]
+        Field of the JSON documents that contains the list of records.
+
+    Returns
+    -------
+    Dataset
+        The records of all the files.
+
+    Raises
+    ------
+    ValueError
+        If the files are not valid or their columns have incompatible types.
+    """
+    cache_path = pathlib.Path(datasets.config.HF_DATASETS_CACHE) / "json_dataloader"
+    cache_path.mkdir(parents=True, exist_ok=True)
+    arrow_path = str(cache_path / f"{uuid.uuid4().hex}.arrow")
+
+    parts: List[Tuple[str, pa.Schema]] = []
+    writer = None
+    try:
+        try:
+            for path in paths:
+                for table in iter_json_tables(path, data_key):
+                    if writer is None or table.schema != parts[-1][1]:
+                        if writer is not None:
+                            writer.close()
+                        parts.append((f"{arrow_path}.{len(parts)}", table.schema))
+                        writer = pa.ipc.new_stream(parts[-1][0], table.schema)
+                    writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if not parts:
+            return Dataset.from_dict({})
+        if len(parts) == 1:
+            os.replace(parts[0][0], arrow_path)
+            return Dataset.from_file(arrow_path)
+
+        try:
+            schema = pa.unify_schemas(
+                [part_schema for _, part_schema in parts],
+                promote_options="permissive",
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(f"The JSON files have incompatible columns: {e}") from e
+
+        with pa.ipc.new_stream(arrow_path, schema) as writer:
+            for part_path, _ in parts:
+                with pa.memory_map(part_path) as source:
+                    for batch in pa.ipc.open_stream(source):
+                        table = pa.Table.from_batches([batch])
+                        try:
+                            writer.write_table(_conform_table(table, schema))
+                        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                            raise ValueError(
+                                f"The JSON files have incompatible columns: {e}"
+                            ) from e
+    finally:
+        for part_path, _ in parts:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    return Dataset.from_file(arrow_path)
+
 
 class JSONDataloaderSchema(BaseSchema):
     name: schema_field(
@@ -40,7 +352,8 @@ class JSONDataloaderSchema(BaseSchema):
             where the list with dictionaries with the data should be found.
 
             In case the format is only a list of dictionaries (also known as
-            "records" orient in pandas), set this value as null.
+            "records" orient in pandas) or JSON Lines (one dictionary per line),
+            set this value as null.
         """,
     )  # type: ignore
     splits_in_folders: schema_field(
@@ -87,6 +400,11 @@ class JSONDataLoader(BaseDataLoader):
     ) -> DatasetDict:
         """Load the uploaded JSON dataset into a DatasetDict.
 
+        The files are parsed incrementally and written by batches to an Arrow
+        file, so large files are loaded in bounded memory. Files without
+        data_key may be a list of records or JSON Lines, which are parsed by
+        blocks with the pyarrow JSON reader. URLs are streamed with fsspec.
+
         Parameters
         ----------
         filepath_or_buffer : Union[UploadFile, str], optional
@@ -96,7 +414,8 @@ class JSONDataLoader(BaseDataLoader):
             The temporary path where the files will be extracted and then uploaded.
         params : Dict[str, Any]
             Dict with the dataloader parameters. The options are:
-            - data_key (str): The key of the json where the data is contained.
+            - data_key (str): The key of the json where the data is contained, or
+              None for a list of records or JSON Lines.
 
         Returns
         -------
@@ -106,32 +425,40 @@ class JSONDataLoader(BaseDataLoader):
         self._check_params(params)
         field = params["data_key"]
 
-        if isinstance(filepath_or_buffer, str):
-            dataset = load_dataset(
-                "json",
-                data_files=filepath_or_buffer,
-                field=field,
-            )
+        try:
+            if isinstance(filepath_or_buffer, str):
+                dataset = DatasetDict(
+                    {"train": read_json_files([filepath_or_buffer], field)}
+                )
 
-        elif isinstance(filepath_or_buffer, UploadFile):
-            files_path = self.extract_files(temp_path, filepath_or_buffer)
-            if files_path.split("/")[-1] == "files":
-                try:
-                    dataset = load_dataset(
-                        "json",
-                        data_dir=files_path,
-                        field=field,
-                    )
-                finally:
-                    shutil.rmtree(temp_path, ignore_errors=True)
-            else:
-                try:
-                    dataset = load_dataset(
-                        "json",
-                        data_files=files_path,
-                        field=field,
-                    )
-                finally:
-                    os.remove(files_path)
+            elif isinstance(filepath_or_buffer, UploadFile):
+                files_path = self.extract_files(temp_path, filepath_or_buffer)
+                if files_path.split("/")[-1] == "files":
+                    try:
+                        split_files = {
+                            "train": glob.glob(files_path + "/train/*"),
+                            "test": glob.glob(files_path + "/test/*"),
+                            "validation": glob.glob(files_path + "/val/*")
+                            + glob.glob(files_path + "/validation/*"),
+                        }
+                        dataset = DatasetDict(
+                            {
+                                split: read_json_files(sorted(files), field)
+                                for split, files in split_files.items()
+                                if files
+                            }
+                        )
+                    finally:
+                        shutil.rmtree(temp_path, ignore_errors=True)
+                else:
+                    try:
+                        dataset = DatasetDict(
+                            {"train": read_json_files([files_path], field)}
+                        )
+                    finally:
+                        os.remove(files_path)
+
+        except ValueError as e:
+            raise DatasetGenerationError from e
 
         return dataset
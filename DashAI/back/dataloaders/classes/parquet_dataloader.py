@@ -0,0 +1,13 @@
+"""DashAI Parquet Dataloader."""
+
+from DashAI.back.dataloaders.classes.columnar_dataloader import ColumnarDataLoader
+
+
+class ParquetDataLoader(ColumnarDataLoader):
+    """Data loader for data in Apache Parquet files.
+
+    The filter is evaluated against the statistics of the row groups, so the
+    row groups without matching rows are not decoded.
+    """
+
+    FORMAT = "parquet"
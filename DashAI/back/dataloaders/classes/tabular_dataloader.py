@@ -1,7 +1,8 @@
 from typing import List, Tuple, Union
 
-from datasets import ClassLabel, DatasetDict
+from datasets import DatasetDict
 
+from DashAI.back.dataloaders.classes.dashai_dataset import encode_class_columns
 from DashAI.back.dataloaders.classes.dataloader import BaseDataLoader
 
 
@@ -21,6 +22,9 @@ class TabularDataLoader(BaseDataLoader):
         Note that this method cast the class column as a ClassLabel, wich is necessary
         to stratify in splitting process with HuggingFace datasets.
 
+        The classes are the sorted unique values of the column over all the splits,
+        so every split shares the same encoding (see `encode_class_columns`).
+
         Also, considerate that this method encodes the classes to numeric data, but
         you can retrieve the labels with conversion methods:
         - ClassLabel.int2str(): encoded labels to string labels
@@ -59,16 +63,8 @@ class TabularDataLoader(BaseDataLoader):
                 f"Class column '{class_column}' does not exist in dataset."
             )
 
-        # Set class column
-        for split in ["train", "test", "validation"]:
-            if split in dataset:
-                if isinstance(class_column, str):
-                    label = class_column
-                else:
-                    label = dataset[split].column_names[class_column]
-                new_features = dataset[split].features.copy()
-                new_features[label] = ClassLabel(names=list(set(dataset[split][label])))
-                dataset[split] = dataset[split].cast(new_features)
+        label = class_column if isinstance(class_column, str) else columns[class_column]
+        dataset = encode_class_columns(dataset, [label])
         return dataset, label
 
     def select_features(
@@ -33,11 +33,25 @@ def build_config_dict(
             * 'LOCAL_PATH': The provided local path (or default if None).
             * 'SQLITE_DB_PATH': The path to the SQLite database file
                 (relative to LOCAL_PATH).
+            * 'SQLITE_POOL_SIZE': Number of connections of the SQLite pool.
+            * 'SQLITE_BUSY_TIMEOUT': Milliseconds that a SQLite connection waits
+                for a lock before failing.
             * 'DATASETS_PATH': The path to the datasets directory
                 (relative to LOCAL_PATH).
+            * 'DATASET_SHARDS_PATH': The path to the store of the Arrow shards
+                shared by the datasets (relative to LOCAL_PATH).
+            * 'PREPARED_DATASETS_PATH': The path to the datasets prepared for the
+                experiments tasks (relative to LOCAL_PATH).
+            * 'AUDIO_FEATURES_PATH': The path to the cache of the features
+                extracted from audio clips (relative to LOCAL_PATH).
             * 'RUNS_PATH': The path to the runs directory (relative to LOCAL_PATH).
             * 'FRONT_BUILD_PATH': The absolute path to the front-end build directory.
             * 'LOGGING_LEVEL': The configured logging level.
+            * 'JOB_QUEUE': The job queue implementation, "simple" (in memory, by
+              default) or "sqlite" (persistent and shared by several workers).
+            * 'JOB_QUEUE_SCHEDULING': The job queue scheduling policy.
+            * 'EVALUATION_BATCH_SIZE': Maximum number of rows predicted at once
+              when the metrics of a run are computed.
     """
 
     config = DefaultSettings().model_dump()
@@ -53,6 +67,9 @@ def build_config_dict(
     config["LOCAL_PATH"] = local_path
     config["SQLITE_DB_PATH"] = local_path / config["SQLITE_DB_PATH"]
     config["DATASETS_PATH"] = local_path / config["DATASETS_PATH"]
+    config["DATASET_SHARDS_PATH"] = local_path / config["DATASET_SHARDS_PATH"]
+    config["PREPARED_DATASETS_PATH"] = local_path / config["PREPARED_DATASETS_PATH"]
+    config["AUDIO_FEATURES_PATH"] = local_path / config["AUDIO_FEATURES_PATH"]
     config["EXPLANATIONS_PATH"] = local_path / config["EXPLANATIONS_PATH"]
     config["RUNS_PATH"] = local_path / config["RUNS_PATH"]
     config["FRONT_BUILD_PATH"] = pathlib.Path(config["FRONT_BUILD_PATH"]).absolute()
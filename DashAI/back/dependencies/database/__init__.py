@@ -1,2 +1,2 @@
-from DashAI.back.dependencies.database.sqlite_database import  setup_sqlite_db
+from DashAI.back.dependencies.database.sqlite_database import  setup_sqlite_db, unit_of_work
 from DashAI.back.dependencies.database.models import Base, Dataset, Experiment, Run
@@ -2,11 +2,11 @@ import logging
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String
+from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from DashAI.back.core.enums.status import ExplainerStatus, RunStatus
+from DashAI.back.core.enums.status import ExplainerStatus, JobStatus, RunStatus
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,7 @@ class Dataset(Base):
         onupdate=datetime.now,
     )
     file_path: Mapped[str] = mapped_column(String, nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String, nullable=True, index=True)
     experiments: Mapped[List["Experiment"]] = relationship()
 
 
@@ -37,7 +38,7 @@ class Experiment(Base):
     Table to store all the information about a model.
     """
     id: Mapped[int] = mapped_column(primary_key=True)
-    dataset_id: Mapped[int] = mapped_column(ForeignKey("dataset.id"))
+    dataset_id: Mapped[int] = mapped_column(ForeignKey("dataset.id"), index=True)
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     task_name: Mapped[str] = mapped_column(String, nullable=False)
     input_columns: Mapped[str] = mapped_column(JSON, nullable=False)
@@ -58,7 +59,7 @@ class Run(Base):
     Table to store all the information about a specific run of a model.
     """
     id: Mapped[int] = mapped_column(primary_key=True)
-    experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"))
+    experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"), index=True)
     created: Mapped[DateTime] = mapped_column(DateTime, default=datetime.now)
     last_modified: Mapped[DateTime] = mapped_column(
         DateTime,
@@ -88,7 +89,7 @@ class Run(Base):
     description: Mapped[str] = mapped_column(String, nullable=True)
     run_path: Mapped[str] = mapped_column(String, nullable=True)
     status: Mapped[Enum] = mapped_column(
-        Enum(RunStatus), nullable=False, default=RunStatus.NOT_STARTED
+        Enum(RunStatus), nullable=False, default=RunStatus.NOT_STARTED, index=True
     )
     delivery_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
     start_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
@@ -113,6 +114,11 @@ class Run(Base):
         """Update the status of the run to error."""
         self.status = RunStatus.ERROR
 
+    def get_n_trials(self) -> int:
+        """Return the number of optimizer trials of the run, or 1 if it is not set."""
+        optimizer_parameters = self.optimizer_parameters or {}
+        return int(optimizer_parameters.get("n_trials") or 1)
+
 
 class GlobalExplainer(Base):
     __tablename__ = "global_explainer"
@@ -121,7 +127,7 @@ class GlobalExplainer(Base):
     """
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
-    run_id: Mapped[int] = mapped_column(nullable=False)
+    run_id: Mapped[int] = mapped_column(nullable=False, index=True)
     explainer_name: Mapped[str] = mapped_column(String, nullable=False)
     explanation_path: Mapped[str] = mapped_column(String, nullable=True)
     plot_path: Mapped[str] = mapped_column(String, nullable=True)
@@ -161,7 +167,7 @@ class LocalExplainer(Base):
     """
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
-    run_id: Mapped[int] = mapped_column(nullable=False)
+    run_id: Mapped[int] = mapped_column(nullable=False, index=True)
     explainer_name: Mapped[str] = mapped_column(String, nullable=False)
     dataset_id: Mapped[int] = mapped_column(nullable=False)
     explanation_path: Mapped[str] = mapped_column(String, nullable=True)
@@ -197,3 +203,21 @@ class LocalExplainer(Base):
     def set_status_as_error(self) -> None:
         """Update the status of the local explainer to error."""
         self.status = ExplainerStatus.ERROR
+
+
+class Job(Base):
+    __tablename__ = "job"
+    """
+    Table to store the jobs waiting in a persistent job queue.
+    """
+    id: Mapped[int] = mapped_column(primary_key=True)
+    job_type: Mapped[str] = mapped_column(String, nullable=False)
+    kwargs: Mapped[JSON] = mapped_column(JSON, nullable=False)
+    priority: Mapped[int] = mapped_column(nullable=False, default=0)
+    cost: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    created: Mapped[DateTime] = mapped_column(DateTime, default=datetime.now)
+    status: Mapped[Enum] = mapped_column(
+        Enum(JobStatus), nullable=False, default=JobStatus.QUEUED
+    )
+    claimed_by: Mapped[str] = mapped_column(String, nullable=True)
+    claim_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
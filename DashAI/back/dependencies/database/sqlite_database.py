@@ -1,14 +1,34 @@
 """SQLite database module, implemented to be compatible with dependency injection."""
 
 import logging
-from typing import Dict, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 10
+DEFAULT_BUSY_TIMEOUT = 30000
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, busy_timeout: int) -> None:
+    """Configure a new SQLite connection for concurrent readers and writers.
+
+    WAL mode lets readers run concurrently with the writer, synchronous=NORMAL
+    only syncs the WAL on checkpoints instead of on every commit, and the busy
+    timeout makes a connection wait for a lock instead of failing.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout)}")
+    finally:
+        cursor.close()
+
 
 def setup_sqlite_db(config: Dict[str, str]) -> Tuple[Engine, sessionmaker]:
     """
@@ -22,6 +42,10 @@ def setup_sqlite_db(config: Dict[str, str]) -> Tuple[Engine, sessionmaker]:
             * 'SQLITE_DB_PATH': The path to the SQLite database file.
             * 'LOGGING_LEVEL' (optional): The logging level (e.g., 'DEBUG', 'INFO').
                 Defaults to 'INFO' if not provided.
+            * 'SQLITE_POOL_SIZE' (optional): Number of connections kept open
+                in the pool. Defaults to 10.
+            * 'SQLITE_BUSY_TIMEOUT' (optional): Milliseconds that a connection
+                waits for a database lock. Defaults to 30000.
 
     Returns
     -------
@@ -32,15 +56,26 @@ def setup_sqlite_db(config: Dict[str, str]) -> Tuple[Engine, sessionmaker]:
                 for creating database sessions.
     """
 
-    if not str(config["SQLITE_DB_PATH"]).startswith("sqlite:///"):
-        db_url = "sqlite:///" + str(config["SQLITE_DB_PATH"])
+    db_url = str(config["SQLITE_DB_PATH"])
+    if not db_url.startswith("sqlite:///"):
+        db_url = "sqlite:///" + db_url
 
     logger.info("Using %s as SQLite path.", db_url)
 
+    pool_size = config.get("SQLITE_POOL_SIZE", DEFAULT_POOL_SIZE)
+    busy_timeout = config.get("SQLITE_BUSY_TIMEOUT", DEFAULT_BUSY_TIMEOUT)
+
     engine: Engine = create_engine(
         db_url,
-        echo=config["LOGGING_LEVEL"] == logging.DEBUG,
-        connect_args={"check_same_thread": False},
+        echo=config.get("LOGGING_LEVEL") == logging.DEBUG,
+        connect_args={"check_same_thread": False, "timeout": busy_timeout / 1000},
+        pool_size=pool_size,
+        max_overflow=pool_size,
+    )
+    event.listen(
+        engine,
+        "connect",
+        lambda dbapi_connection, _: _set_sqlite_pragmas(dbapi_connection, busy_timeout),
     )
 
     session_factory = sessionmaker(
@@ -50,3 +85,29 @@ def setup_sqlite_db(config: Dict[str, str]) -> Tuple[Engine, sessionmaker]:
     )
 
     return engine, session_factory
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """Group the updates made in the context into a single transaction.
+
+    The changes are committed once when the context exits, or rolled back if
+    it raises an exception, so a set of related updates costs one commit and
+    is never partially visible to the other connections.
+
+    Parameters
+    ----------
+    db : Session
+        The session where the updates are made.
+
+    Yields
+    ------
+    Session
+        The same session.
+    """
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
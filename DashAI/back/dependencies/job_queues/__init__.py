@@ -1,2 +1,3 @@
 from DashAI.back.dependencies.job_queues.base_job_queue import BaseJobQueue
 from DashAI.back.dependencies.job_queues.simple_job_queue import SimpleJobQueue
+from DashAI.back.dependencies.job_queues.sqlite_job_queue import SQLiteJobQueue
@@ -10,13 +10,18 @@ class BaseJobQueue(metaclass=ABCMeta):
     """Abstract class for all Jobs Queues."""
 
     @abstractmethod
-    def put(self, job: BaseJob) -> int:
-        """Put a job at the end of the queue.
+    def put(self, job: BaseJob, priority: int = 0) -> int:
+        """Put a job in the queue.
+
+        Jobs with higher priority are extracted first, jobs with the same priority
+        are extracted in insertion order.
 
         Parameters
         ----------
         job: Job
             Job to put in the queue.
+        priority: int
+            Priority of the job, by default 0.
 
         Returns
         ----------
@@ -85,6 +90,20 @@ class BaseJobQueue(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def task_done(self, job: BaseJob) -> None:  # noqa: B027
+        """Indicate that a job extracted from the queue was processed.
+
+        Queues that keep the extracted jobs until they are processed (e.g. to
+        recover them after a failure) release them here. By default it does
+        nothing, since queues that forget the jobs when they are extracted
+        (such as the SimpleJobQueue) have nothing to release.
+
+        Parameters
+        ----------
+        job: Job
+            The processed job.
+        """
+
     @abstractmethod
     def is_empty(self) -> bool:
         """Predicate that indicates if the queue is empty.
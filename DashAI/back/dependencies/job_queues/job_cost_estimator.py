@@ -0,0 +1,170 @@
+"""Job cost estimator module."""
+
+import logging
+import math
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from DashAI.back.core.enums.status import RunStatus
+from DashAI.back.dataloaders.classes.dashai_dataset import get_dataset_info
+from DashAI.back.dependencies.database.models import Dataset, Experiment, Run
+from DashAI.back.job.base_job import BaseJob
+
+logger = logging.getLogger(__name__)
+
+
+class JobCostEstimator:
+    """Estimate how long a job will take from the timings of past jobs.
+
+    Each job describes its workload as a pair (component name, size), e.g. the
+    model of a run and the number of dataset rows times the number of optimizer
+    trials. The estimator keeps, for each component, the mean number of seconds
+    that a unit of workload took to execute, and estimates the cost of a new job
+    as its size times that rate.
+
+    Components without recorded timings are estimated using the mean rate of all
+    the recorded components, or the default rate if nothing has been recorded yet.
+    Jobs whose workload can not be computed are estimated with the mean duration
+    of the recorded jobs, so they are not scheduled before the jobs known to be
+    short.
+    """
+
+    def __init__(self, default_rate: float = 1e-3, history_size: int = 50) -> None:
+        """Initialize the estimator.
+
+        Parameters
+        ----------
+        default_rate : float
+            Seconds per unit of workload used when there are no recorded timings,
+            by default 1e-3.
+        history_size : int
+            Number of timings kept per component, by default 50.
+        """
+        self.default_rate = default_rate
+        self.history_size = history_size
+        self._rates: Dict[str, List[float]] = {}
+        self._durations: List[float] = []
+
+    def record(self, component_name: str, size: float, seconds: float) -> None:
+        """Record the execution time of a workload.
+
+        Parameters
+        ----------
+        component_name : str
+            Name of the component that was executed.
+        size : float
+            Size of the executed workload.
+        seconds : float
+            Elapsed time in seconds.
+        """
+        rates = self._rates.setdefault(component_name, [])
+        rates.append(seconds / max(size, 1.0))
+        if len(rates) > self.history_size:
+            del rates[0]
+        self._durations.append(seconds)
+        if len(self._durations) > self.history_size:
+            del self._durations[0]
+
+    def rate(self, component_name: str) -> float:
+        """Return the estimated seconds per unit of workload of a component.
+
+        Parameters
+        ----------
+        component_name : str
+            Name of the component.
+
+        Returns
+        -------
+        float
+            The estimated rate.
+        """
+        if component_name in self._rates:
+            rates = self._rates[component_name]
+            return sum(rates) / len(rates)
+        if self._rates:
+            return sum(self.rate(name) for name in self._rates) / len(self._rates)
+        return self.default_rate
+
+    def estimate(self, job: BaseJob) -> float:
+        """Estimate the execution time of a job in seconds.
+
+        If the job workload can not be computed, the job is estimated with the
+        mean duration of the recorded jobs, or as infinite if no job has been
+        recorded yet (i.e., it is scheduled after the estimated jobs).
+
+        Parameters
+        ----------
+        job : BaseJob
+            The job to estimate.
+
+        Returns
+        -------
+        float
+            The estimated execution time.
+        """
+        try:
+            component_name, size = job.get_workload()
+        except Exception as e:
+            logger.warning("Unable to compute the workload of a job: %s", e)
+            if not self._durations:
+                return math.inf
+            return sum(self._durations) / len(self._durations)
+        return self.rate(component_name) * max(size, 1.0)
+
+    def record_job(self, job: BaseJob, seconds: float) -> None:
+        """Record the execution time of a job.
+
+        Parameters
+        ----------
+        job : BaseJob
+            The executed job.
+        seconds : float
+            Elapsed time in seconds.
+        """
+        try:
+            component_name, size = job.get_workload()
+        except Exception as e:
+            logger.warning("Unable to compute the workload of a job: %s", e)
+            return
+        self.record(component_name, size, seconds)
+
+    def load_history(self, session_factory: sessionmaker) -> None:
+        """Record the timings of the runs finished in previous executions.
+
+        Parameters
+        ----------
+        session_factory : sessionmaker
+            Factory of sessions of the database where the runs are stored.
+        """
+        dataset_rows: Dict[int, int] = {}
+        with session_factory() as db:
+            runs: List[Tuple[Run, Dataset]] = db.execute(
+                select(Run, Dataset)
+                .join(Experiment, Run.experiment_id == Experiment.id)
+                .join(Dataset, Experiment.dataset_id == Dataset.id)
+                .where(Run.status == RunStatus.FINISHED)
+                .order_by(Run.end_time.desc())
+                .limit(self.history_size * 10)
+            ).all()
+
+            for run, dataset in reversed(runs):
+                if run.start_time is None or run.end_time is None:
+                    continue
+                if dataset.id not in dataset_rows:
+                    try:
+                        dataset_rows[dataset.id] = get_dataset_info(
+                            f"{dataset.file_path}/dataset"
+                        )["total_rows"]
+                    except Exception:
+                        logger.debug("Skipping runs of missing dataset %s", dataset.id)
+                        dataset_rows[dataset.id] = 0
+                if not dataset_rows[dataset.id]:
+                    continue
+
+                self.record(
+                    run.model_name,
+                    dataset_rows[dataset.id] * run.get_n_trials(),
+                    (run.end_time - run.start_time).total_seconds(),
+                )
@@ -1,28 +1,51 @@
+import asyncio
 import logging
+import time
 
 from kink import inject
 from sqlalchemy import exc
 
 from DashAI.back.dependencies.job_queues import BaseJobQueue
+from DashAI.back.dependencies.job_queues.base_job_queue import JobQueueError
+from DashAI.back.dependencies.job_queues.job_cost_estimator import JobCostEstimator
 from DashAI.back.job.base_job import BaseJob, JobError
+from DashAI.back.job.progress import ProgressBroker, ProgressReporter, progress_scope
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+def _run_job(job: BaseJob, reporter: ProgressReporter) -> None:
+    """Run a job reporting its progress with the given reporter."""
+    with progress_scope(reporter):
+        job.run()
+
+
 @inject
 async def job_queue_loop(
     stop_when_queue_empties: bool,
     job_queue: BaseJobQueue = lambda di: di["job_queue"],
+    job_cost_estimator: JobCostEstimator = lambda di: di["job_cost_estimator"],
+    progress_broker: ProgressBroker = lambda di: di["progress_broker"],
 ):
     """Loop function to execute all the pending jobs in the job queue.
     If the the param stop_when_queue_empties is True, the loop returns when
     the queue empties, else it waits until  new jobs come in.
 
+    Each job runs in a worker thread, so the app keeps serving requests (and
+    streaming the job progress) while it executes. The job progress events are
+    published in the progress broker, labeled with the job id and type and the
+    ids in the job kwargs (e.g. run_id).
+
     Parameters
     ----------
     job_queue : BaseJobQueue
         The current app job queue.
+    job_cost_estimator : JobCostEstimator
+        The current app job cost estimator, which records the duration of the
+        successfully executed jobs.
+    progress_broker : ProgressBroker
+        The current app progress broker, where the job progress is published.
     stop_when_queue_empties: bool
         boolean to set the while loop condition.
 
@@ -30,8 +53,32 @@ async def job_queue_loop(
     while not job_queue.is_empty() if stop_when_queue_empties else True:
         try:
             job: BaseJob = await job_queue.async_get()
-            job.run()
+        except JobQueueError as e:
+            logger.exception(e)
+            continue
+        reporter = ProgressReporter(
+            progress_broker,
+            job_id=job.id,
+            job_type=job.__class__.__name__,
+            **{
+                key: value
+                for key, value in job.kwargs.items()
+                if key.endswith("_id") and isinstance(value, int)
+            },
+        )
+        try:
+            reporter("job", status="started")
+            start = time.perf_counter()
+            await asyncio.get_running_loop().run_in_executor(
+                None, _run_job, job, reporter
+            )
+            job_cost_estimator.record_job(job, time.perf_counter() - start)
+            reporter("job", status="finished")
         except exc.SQLAlchemyError as e:
             logger.exception(e)
+            reporter("job", status="error", message=str(e))
         except JobError as e:
             logger.exception(e)
+            reporter("job", status="error", message=str(e))
+        finally:
+            job_queue.task_done(job)
@@ -1,34 +1,94 @@
+import heapq
+import itertools
 import uuid
-from asyncio import Queue
-from typing import Any, Coroutine, List, Optional, Tuple
+from asyncio import Event
+from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple
 
 from DashAI.back.dependencies.job_queues.base_job_queue import (
     BaseJobQueue,
     JobQueueError,
 )
+from DashAI.back.dependencies.job_queues.job_cost_estimator import JobCostEstimator
 from DashAI.back.job.base_job import BaseJob
 
+# Placeholder stored in the heap entries of jobs removed by id.
+_REMOVED = None
+
+
+SchedulingPolicy = Literal["fifo", "priority", "shortest_job_first"]
+
 
 class SimpleJobQueue(BaseJobQueue):
-    """JobQueue implementation using asyncio Queue."""
+    """In-memory JobQueue implementation using a heap indexed by job id.
+
+    Jobs are kept in a binary heap ordered according to the scheduling policy:
 
-    queue: Queue = Queue()
+    - "fifo": jobs are extracted in insertion order.
+    - "priority": jobs with higher priority are extracted first.
+    - "shortest_job_first": jobs with higher priority are extracted first and,
+      among jobs with the same priority, the ones with the lowest estimated cost.
 
-    def _search_and_split(
-        self, job_id: int
-    ) -> Tuple[List[BaseJob], BaseJob, List[BaseJob]]:
-        """Split the queue using the job with id job_id as a pivot.
+    Ties are always broken by insertion order.
+    A dict maps each job id to its heap entry, which allows looking up a job in
+    O(1) and removing it in O(1) by marking its entry as removed (lazy deletion).
+    Removed entries are discarded when they reach the top of the heap.
+    """
+
+    def __init__(
+        self,
+        scheduling: SchedulingPolicy = "priority",
+        cost_estimator: Optional[JobCostEstimator] = None,
+    ) -> None:
+        """Initialize an empty job queue.
 
         Parameters
         ----------
-        job_id: int
-            Id of the Job used to split the queue.
+        scheduling : SchedulingPolicy
+            Order in which the jobs are extracted, by default "priority".
+        cost_estimator : Optional[JobCostEstimator]
+            Estimator of the jobs cost used by the "shortest_job_first" policy.
+            If None, a new estimator without history is used.
+        """
+        if scheduling not in ("fifo", "priority", "shortest_job_first"):
+            raise ValueError(f"Unknown scheduling policy {scheduling}.")
+
+        self.scheduling = scheduling
+        self.cost_estimator = (
+            cost_estimator if cost_estimator is not None else JobCostEstimator()
+        )
+        self._heap: List[List[Any]] = []
+        self._entries: Dict[int, List[Any]] = {}
+        self._counter = itertools.count()
+        self._not_empty: Optional[Event] = None
+
+    def _sort_key(self, job: BaseJob, priority: int) -> Tuple[float, ...]:
+        """Compute the key used to order the job in the heap."""
+        if self.scheduling == "fifo":
+            return ()
+        if self.scheduling == "priority":
+            return (-priority,)
+        return (-priority, self.cost_estimator.estimate(job))
+
+    def _discard_removed(self) -> None:
+        """Pop the removed entries from the top of the heap."""
+        while self._heap and self._heap[0][-1] is _REMOVED:
+            heapq.heappop(self._heap)
+
+    def _find_entry(self, job_id: Optional[int]) -> List[Any]:
+        """Retrieve the heap entry of the job with id job_id.
+
+        If the id is not specified, it retrieves the entry of the first job in the
+        queue.
+
+        Parameters
+        ----------
+        job_id: Optional int
+            id of the job to find.
 
         Returns
         ----------
-        tuple(List Job, Job, List Job)
-            A tuple containg the first part of the queue,
-            the pivot Job and the second part of the queue.
+        list
+            The heap entry: [sort key, insertion order, job].
 
         Raises
         ----------
@@ -37,74 +97,59 @@ class SimpleJobQueue(BaseJobQueue):
         JobQueueError
             If there is not job with job_id in the queue.
         """
-        first_part = []
-        target_job: BaseJob = self.queue.get_nowait()
-        while target_job.id != job_id and not self.is_empty():
-            first_part.append(target_job)
-            target_job = self.queue.get_nowait()
-
-        if target_job.id != job_id:
-            for job in [*first_part, target_job]:
-                self.queue.put_nowait(job)
+        if self.is_empty():
             raise JobQueueError(
-                f"Error trying to get job {job_id}: the job is not in the queue."
+                f"Error trying to get job {job_id}: the async queue is empty."
             )
 
-        second_part = []
-        while not self.is_empty():
-            second_part.append(self.queue.get_nowait())
+        if job_id:
+            if job_id not in self._entries:
+                raise JobQueueError(
+                    f"Error trying to get job {job_id}: the job is not in the queue."
+                )
+            return self._entries[job_id]
 
-        return (first_part, target_job, second_part)
+        self._discard_removed()
+        return self._heap[0]
 
-    def put(self, job: BaseJob) -> int:
+    def put(self, job: BaseJob, priority: int = 0) -> int:
         job.id = uuid.uuid4().int
-        self.queue.put_nowait(job)
+        entry = [self._sort_key(job, priority), next(self._counter), job]
+        self._entries[job.id] = entry
+        heapq.heappush(self._heap, entry)
+        if self._not_empty is not None:
+            self._not_empty.set()
         return job.id
 
     def get(self, job_id: Optional[int] = None) -> BaseJob:
-        if self.is_empty():
-            raise JobQueueError(
-                f"Error trying to get job {job_id}: the async queue is empty."
-            )
+        entry = self._find_entry(job_id)
+        job: BaseJob = entry[-1]
+        del self._entries[job.id]
 
-        if job_id:
-            (first_part, target_job, second_part) = self._search_and_split(job_id)
-            for job in [*first_part, *second_part]:
-                self.queue.put_nowait(job)
-            return target_job
+        if entry is self._heap[0]:
+            heapq.heappop(self._heap)
         else:
-            return self.queue.get_nowait()
+            entry[-1] = _REMOVED
+
+        if not self._entries:
+            # every remaining entry is a removed one
+            self._heap.clear()
+        return job
 
     async def async_get(self) -> Coroutine[Any, Any, BaseJob]:
-        return await self.queue.get()
+        if self._not_empty is None:
+            self._not_empty = Event()
 
-    def peek(self, job_id: Optional[int] = None) -> BaseJob:
-        if self.is_empty():
-            raise JobQueueError(
-                f"Error trying to get job {job_id}: the async queue is empty."
-            )
+        while self.is_empty():
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get()
 
-        if job_id:
-            (first_part, target_job, second_part) = self._search_and_split(job_id)
-            for job in [*first_part, target_job, *second_part]:
-                self.queue.put_nowait(job)
-            return job
-        else:
-            target_job: BaseJob = self.queue.get_nowait()
-            tmp_queue = Queue()
-            tmp_queue.put_nowait(target_job)
-            while not self.is_empty():
-                tmp_queue.put_nowait(self.queue.get_nowait())
-            self.queue = tmp_queue
-            return target_job
+    def peek(self, job_id: Optional[int] = None) -> BaseJob:
+        return self._find_entry(job_id)[-1]
 
     def is_empty(self) -> bool:
-        return self.queue.empty()
+        return not self._entries
 
     def to_list(self) -> List[BaseJob]:
-        job_list = []
-        while not self.is_empty():
-            job_list.append(self.queue.get_nowait())
-        for job in job_list:
-            self.queue.put_nowait(job)
-        return job_list
+        return [entry[-1] for entry in sorted(self._entries.values())]
@@ -0,0 +1,311 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime
+from typing import Any, Coroutine, Dict, List, Literal, Optional
+
+from kink import inject
+from sqlalchemy import delete, exc, func, select, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import Select
+
+from DashAI.back.core.enums.status import JobStatus
+from DashAI.back.dependencies.database.models import Job
+from DashAI.back.dependencies.job_queues.base_job_queue import (
+    BaseJobQueue,
+    JobQueueError,
+)
+from DashAI.back.dependencies.job_queues.job_cost_estimator import JobCostEstimator
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.job.base_job import BaseJob
+
+logger = logging.getLogger(__name__)
+
+# distinguishes this process from a previous process with the same pid.
+_PROCESS_TOKEN = uuid.uuid4().hex
+
+
+def _process_exists(pid: int) -> bool:
+    """Check if a process of the current host is running."""
+    if os.name == "nt":
+        import ctypes
+
+        process_query_limited_information = 0x1000
+        handle = ctypes.windll.kernel32.OpenProcess(
+            process_query_limited_information, False, pid
+        )
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists, but belongs to another user.
+        return True
+    return True
+
+
+class SQLiteJobQueue(BaseJobQueue):
+    """Persistent JobQueue implementation stored in the app SQLite database.
+
+    Each job is stored as a row of the job table with its type and its
+    parameters (except the database session). A job extracted with `get`
+    receives a new session, which is closed by `task_done`, while the jobs
+    listed by `peek` and `to_list` are built without a session, since they are
+    only read. Jobs are ordered with the same scheduling policies of the
+    SimpleJobQueue.
+
+    Extracting a job claims its row with an atomic update, so several worker
+    processes can pull jobs from the same queue without executing a job twice.
+    The row is deleted when the job is marked as done, hence the jobs claimed by
+    a worker that was interrupted remain in the database and are queued again by
+    `requeue_claimed_jobs` once that worker is no longer running.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        scheduling: Literal["fifo", "priority", "shortest_job_first"] = "priority",
+        cost_estimator: Optional[JobCostEstimator] = None,
+        poll_interval: float = 0.5,
+    ) -> None:
+        """Initialize the job queue.
+
+        Parameters
+        ----------
+        session_factory : sessionmaker
+            Factory of sessions of the database where the jobs are stored.
+        scheduling : Literal["fifo", "priority", "shortest_job_first"]
+            Order in which the jobs are extracted, by default "priority".
+        cost_estimator : Optional[JobCostEstimator]
+            Estimator of the jobs cost used by the "shortest_job_first" policy.
+            If None, a new estimator without history is used.
+        poll_interval : float
+            Seconds between database checks while waiting for a job in
+            `async_get`, by default 0.5.
+        """
+        if scheduling not in ("fifo", "priority", "shortest_job_first"):
+            raise ValueError(f"Unknown scheduling policy {scheduling}.")
+
+        self.session_factory = session_factory
+        self.scheduling = scheduling
+        self.cost_estimator = (
+            cost_estimator if cost_estimator is not None else JobCostEstimator()
+        )
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{_PROCESS_TOKEN}"
+
+    def _queued_jobs(self) -> Select:
+        """Build the query of the queued jobs sorted by the scheduling policy."""
+        query = select(Job).where(Job.status == JobStatus.QUEUED)
+        if self.scheduling == "priority":
+            query = query.order_by(Job.priority.desc())
+        elif self.scheduling == "shortest_job_first":
+            query = query.order_by(Job.priority.desc(), Job.cost)
+        return query.order_by(Job.id)
+
+    @inject
+    def _build_job(
+        self,
+        job_row: Job,
+        with_session: bool = False,
+        component_registry: ComponentRegistry = lambda di: di["component_registry"],
+    ) -> BaseJob:
+        """Create the job object stored in a row of the job table.
+
+        If with_session is True, the job receives a new database session to be
+        executed, which must be closed with `task_done`.
+        """
+        kwargs: Dict[str, Any] = dict(job_row.kwargs)
+        if with_session:
+            kwargs["db"] = self.session_factory()
+        try:
+            job: BaseJob = component_registry[job_row.job_type]["class"](**kwargs)
+        except Exception as e:
+            logger.exception(e)
+            if with_session:
+                kwargs["db"].close()
+            raise JobQueueError(
+                f"Error trying to build job {job_row.id} of type {job_row.job_type}."
+            ) from e
+        job.id = job_row.id
+        return job
+
+    def _find_job_row(self, db: Session, job_id: Optional[int]) -> Job:
+        """Retrieve the row of the queued job with id job_id.
+
+        If the id is not specified, it retrieves the first job in the queue.
+
+        Raises
+        ----------
+        JobQueueError
+            If the queue is empty.
+        JobQueueError
+            If there is not job with job_id in the queue.
+        """
+        query = self._queued_jobs()
+        if job_id:
+            query = query.where(Job.id == job_id)
+        job_row = db.scalars(query.limit(1)).first()
+
+        if job_row is None:
+            if job_id and not self.is_empty():
+                raise JobQueueError(
+                    f"Error trying to get job {job_id}: the job is not in the queue."
+                )
+            raise JobQueueError(
+                f"Error trying to get job {job_id}: the queue is empty."
+            )
+        return job_row
+
+    def put(self, job: BaseJob, priority: int = 0) -> int:
+        kwargs: Dict[str, Any] = {
+            key: value for key, value in job.kwargs.items() if key != "db"
+        }
+        cost = (
+            self.cost_estimator.estimate(job)
+            if self.scheduling == "shortest_job_first"
+            else 0.0
+        )
+        try:
+            with self.session_factory() as db:
+                job_row = Job(
+                    job_type=type(job).__name__,
+                    kwargs=kwargs,
+                    priority=priority,
+                    cost=cost,
+                )
+                db.add(job_row)
+                db.commit()
+                job.id = job_row.id
+        except exc.SQLAlchemyError as e:
+            logger.exception(e)
+            raise JobQueueError("Error trying to store the job.") from e
+        return job.id
+
+    def get(self, job_id: Optional[int] = None) -> BaseJob:
+        with self.session_factory() as db:
+            while True:
+                job_row = self._find_job_row(db, job_id)
+                # the claim only succeeds if no other worker claimed the job
+                # since it was read.
+                claimed = db.execute(
+                    update(Job)
+                    .where(Job.id == job_row.id, Job.status == JobStatus.QUEUED)
+                    .values(
+                        status=JobStatus.CLAIMED,
+                        claimed_by=self.worker_id,
+                        claim_time=datetime.now(),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if claimed.rowcount == 1:
+                    break
+                db.rollback()
+
+            try:
+                job = self._build_job(job_row, with_session=True)
+            except JobQueueError:
+                db.execute(delete(Job).where(Job.id == job_row.id))
+                db.commit()
+                raise
+            db.commit()
+        return job
+
+    async def async_get(self) -> Coroutine[Any, Any, BaseJob]:
+        while True:
+            try:
+                return self.get()
+            except JobQueueError:
+                if not self.is_empty():
+                    raise
+            await asyncio.sleep(self.poll_interval)
+
+    def peek(self, job_id: Optional[int] = None) -> BaseJob:
+        with self.session_factory() as db:
+            return self._build_job(self._find_job_row(db, job_id))
+
+    def task_done(self, job: BaseJob) -> None:
+        job_db: Optional[Session] = job.kwargs.get("db")
+        if job_db is not None:
+            job_db.close()
+        with self.session_factory() as db:
+            db.execute(delete(Job).where(Job.id == job.id))
+            db.commit()
+
+    def is_empty(self) -> bool:
+        with self.session_factory() as db:
+            n_jobs = db.scalar(
+                select(func.count(Job.id)).where(Job.status == JobStatus.QUEUED)
+            )
+        return n_jobs == 0
+
+    def to_list(self) -> List[BaseJob]:
+        with self.session_factory() as db:
+            return [
+                self._build_job(job_row) for job_row in db.scalars(self._queued_jobs())
+            ]
+
+    def _is_worker_alive(self, worker_id: Optional[str]) -> bool:
+        """Check if the worker that claimed a job may still be executing it.
+
+        The workers of other hosts are assumed to be alive, since their
+        processes can not be inspected.
+        """
+        if worker_id == self.worker_id:
+            return True
+        try:
+            host, pid, _ = worker_id.rsplit(":", 2)
+            pid = int(pid)
+        except (AttributeError, ValueError):
+            return False
+        if host != socket.gethostname():
+            return True
+        if pid == os.getpid():
+            # a previous process with the same pid, e.g. after a restart.
+            return False
+        return _process_exists(pid)
+
+    def requeue_claimed_jobs(self) -> int:
+        """Queue again the jobs claimed by workers that are no longer running.
+
+        A job claimed but never marked as done is only queued again when the
+        worker process that claimed it is not running on this host anymore, so
+        the jobs that other live workers are executing are left untouched. This
+        method is called on startup to recover the jobs interrupted by a server
+        shutdown.
+
+        Returns
+        -------
+        int
+            The number of jobs queued again.
+        """
+        with self.session_factory() as db:
+            claims = db.execute(
+                select(Job.id, Job.claimed_by).where(Job.status == JobStatus.CLAIMED)
+            ).all()
+            n_requeued = 0
+            for job_id, claimed_by in claims:
+                if self._is_worker_alive(claimed_by):
+                    continue
+                # the job is not requeued if it was claimed again in between.
+                requeued = db.execute(
+                    update(Job)
+                    .where(
+                        Job.id == job_id,
+                        Job.status == JobStatus.CLAIMED,
+                        Job.claimed_by == claimed_by,
+                    )
+                    .values(status=JobStatus.QUEUED, claimed_by=None, claim_time=None)
+                    .execution_options(synchronize_session=False)
+                )
+                n_requeued += requeued.rowcount
+            db.commit()
+        if n_requeued:
+            logger.info("Requeued %s interrupted jobs.", n_requeued)
+        return n_requeued
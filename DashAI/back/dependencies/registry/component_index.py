@@ -0,0 +1,108 @@
+"""Static index of the components registered lazily by the app.
+
+For each component declared by its dotted path, the index stores what the
+component registry needs to list it without importing its module: its payload
+(name, type, schema, metadata and description), the names of its ancestor
+classes and the components it is compatible with.
+
+The index is generated from the component classes and must be regenerated when
+a component is added or its schema, metadata or compatible components change:
+
+    python -m DashAI.back.dependencies.registry.component_index
+"""
+
+import importlib
+import json
+import logging
+import pathlib
+from typing import Any, Dict, List, Optional
+
+from DashAI.back.dependencies.registry.component_registry import ComponentRegistry
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_INDEX_PATH = pathlib.Path(__file__).parents[2] / "components_index.json"
+
+
+def build_component_index(
+    lazy_components: Dict[str, List[str]],
+) -> Dict[str, Dict[str, Any]]:
+    """Import the components and build their static index.
+
+    Parameters
+    ----------
+    lazy_components : Dict[str, List[str]]
+        Dict from component types to the dotted paths of the components of
+        that type.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        The index entry of each component by its dotted path.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for paths in lazy_components.values():
+        for path in paths:
+            module_path, class_name = path.rsplit(".", 1)
+            component = getattr(importlib.import_module(module_path), class_name)
+            registry = ComponentRegistry(initial_components=[component])
+            index[path] = {
+                "payload": registry.get_payload(class_name),
+                "bases": [base.__name__ for base in component.__bases__],
+                "ancestors": [ancestor.__name__ for ancestor in component.__mro__],
+                "compatible_components": list(
+                    getattr(component, "COMPATIBLE_COMPONENTS", [])
+                ),
+            }
+    # the JSON round trip makes the index equal to the loaded one.
+    return json.loads(json.dumps(index))
+
+
+def load_component_index(
+    path: Optional[pathlib.Path] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Load a component index.
+
+    Parameters
+    ----------
+    path : Optional[pathlib.Path]
+        Path of the index, by default the index of the app components.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        The index entry of each component by its dotted path, or an empty dict if
+        the index does not exist, in which case the components are imported to
+        be listed.
+    """
+    path = COMPONENT_INDEX_PATH if path is None else path
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        logger.warning("The component index %s does not exist.", path)
+        return {}
+
+
+def save_component_index(
+    index: Dict[str, Dict[str, Any]], path: Optional[pathlib.Path] = None
+) -> None:
+    """Write a component index as a JSON file.
+
+    Parameters
+    ----------
+    index : Dict[str, Dict[str, Any]]
+        The index built with `build_component_index`.
+    path : Optional[pathlib.Path]
+        Path of the index, by default the index of the app components.
+    """
+    path = COMPONENT_INDEX_PATH if path is None else path
+    with open(path, "w") as file:
+        json.dump(index, file, indent=1)
+        file.write("\n")
+
+
+if __name__ == "__main__":
+    from DashAI.back.container import INITIAL_COMPONENTS
+
+    save_component_index(build_component_index(INITIAL_COMPONENTS))
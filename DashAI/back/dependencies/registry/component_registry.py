@@ -1,4 +1,7 @@
-from typing import Any, Dict, List, Type, Union
+import importlib
+import threading
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Set, Type, Union
 
 from beartype import beartype
 
@@ -27,12 +30,29 @@ class ComponentRegistry:
 
     By default, every method of the registry should return a component dict or a list
     of component dicts.
+
+    Components can also be registered lazily by their dotted path and their type.
+    Until the component is requested, its component dict only contains its name,
+    type and path, and its module is imported (and its schema generated) the first
+    time that the component dict is obtained from the registry. When the static
+    index of a lazy component is available (see `component_index`), its payload,
+    ancestors and relationships are taken from the index, so the component can be
+    listed and filtered without importing its module.
+
+    The registry keeps indexes to answer the queries without scanning every
+    component: the type of each component name, the children and descendants
+    (by class inheritance) of each class name, the related components (through
+    the relationship manager) and the payload of each component, i.e., its
+    component dict without the class, which is the representation served by
+    the API. The indexes are updated each time that a component is registered.
     """
 
     @beartype
     def __init__(
         self,
         initial_components: Union[List[type], None] = None,
+        lazy_components: Union[Dict[str, List[str]], None] = None,
+        component_index: Union[Dict[str, Dict[str, Any]], None] = None,
     ) -> None:
         """Initialize the component registry.
 
@@ -41,6 +61,12 @@ class ComponentRegistry:
         initial_components : Union[List[type], None]
             List with the initial objects to be entered in the registry,
             by default None.
+        lazy_components : Union[Dict[str, List[str]], None]
+            Dict from component types to the dotted paths of the components of
+            that type to be registered lazily, by default None.
+        component_index : Union[Dict[str, Dict[str, Any]], None]
+            Static index of the lazy components by their dotted path, used to
+            list them without importing them, by default None.
 
         Raises
         ------
@@ -51,11 +77,27 @@ class ComponentRegistry:
         """
         self._registry: Dict[str, Dict[str, Any]] = {}
         self._relationship_manager = RelationshipManager()
+        self._load_lock = threading.RLock()
+
+        # indexes updated on each registration.
+        self._types: Dict[str, str] = {}
+        self._payloads: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._children: DefaultDict[str, List[str]] = defaultdict(list)
+        self._descendants: DefaultDict[str, List[str]] = defaultdict(list)
+        self._lazy: DefaultDict[str, List[str]] = defaultdict(list)
+        # lazy components whose payload and relationships come from the index.
+        self._indexed: Set[str] = set()
+        self._component_index = component_index if component_index else {}
 
         if initial_components is not None:
             for component in initial_components:
                 self.register_component(component)
 
+        if lazy_components is not None:
+            for component_type, paths in lazy_components.items():
+                for path in paths:
+                    self.register_lazy_component(path, component_type)
+
     @property
     @beartype
     def registry(self) -> Dict[str, Dict[str, type]]:
@@ -90,10 +132,7 @@ class ComponentRegistry:
         bool
             True if the component exists in the task registry, False otherwise.
         """
-        for base_type_container in self._registry.values():
-            if item in base_type_container:
-                return True
-        return False
+        return item in self._types
 
     @beartype
     def __getitem__(self, item: str) -> Dict[str, type]:
@@ -116,11 +155,95 @@ class ComponentRegistry:
         KeyError
             If the object does not exist in the registry.
         """
-        for base_type_container in self._registry.values():
-            if item in base_type_container:
-                return base_type_container[item]
+        if item not in self._types:
+            raise KeyError(f"Component '{item}' does not exists in the registry.")
+
+        component_dict = self._registry[self._types[item]][item]
+        if "class" not in component_dict:
+            return self._load_component(component_dict)
+        return component_dict
+
+    def _load_component(self, lazy_component: Dict[str, str]) -> Dict[str, Any]:
+        """Import a lazily registered component and register its class.
+
+        Parameters
+        ----------
+        lazy_component : Dict[str, str]
+            The component dict of the lazy component, with its name, type and path.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The complete component dict.
+
+        Raises
+        ------
+        TypeError
+            If the imported class has not the declared type.
+        """
+        with self._load_lock:
+            name = lazy_component["name"]
+            component_type = lazy_component["type"]
+            # another thread may have loaded the component while waiting the lock.
+            component_dict = self._registry[component_type][name]
+            if "class" in component_dict:
+                return component_dict
+
+            module_path, class_name = lazy_component["path"].rsplit(".", 1)
+            new_component = getattr(importlib.import_module(module_path), class_name)
+
+            base_type = self._get_base_type(new_component)
+            if base_type != component_type:
+                raise TypeError(
+                    f"Component {name} was registered with type {component_type}, "
+                    f"but its class has type {base_type}."
+                )
+            self.register_component(new_component)
+            return self._registry[component_type][name]
 
-        raise KeyError(f"Component '{item}' does not exists in the registry.")
+    def _load_components(
+        self,
+        component_types: Union[List[str], None] = None,
+        include_indexed: bool = True,
+    ) -> None:
+        """Import the lazily registered components of some types.
+
+        Parameters
+        ----------
+        component_types : Union[List[str], None]
+            The types of the components to be loaded. If None, all the lazy
+            components are loaded.
+        include_indexed : bool
+            If False, the components with a static index are not loaded, by
+            default True.
+        """
+        if component_types is None:
+            component_types = list(self._lazy)
+
+        for component_type in component_types:
+            for name in list(self._lazy.get(component_type, [])):
+                if include_indexed or name not in self._indexed:
+                    self._load_component(self._registry[component_type][name])
+
+    def _add_to_indexes(
+        self,
+        name: str,
+        base_names: List[str],
+        ancestor_names: List[str],
+        compatible_components: List[str],
+    ) -> None:
+        """Add a component to the hierarchy and relationship indexes."""
+        for parent in base_names:
+            if name not in self._children[parent]:
+                self._children[parent].append(name)
+        for ancestor in ancestor_names:
+            if name not in self._descendants[ancestor]:
+                self._descendants[ancestor].append(name)
+        # the relationships of indexed components were added when registered.
+        if name in self._indexed:
+            return
+        for compatible_component in compatible_components:
+            self._relationship_manager.add_relationship(name, compatible_component)
 
     @beartype
     def _get_base_type(self, new_component: type) -> str:
@@ -195,17 +318,68 @@ class ComponentRegistry:
             "description": getattr(new_component, "DESCRIPTION", None),
         }
 
-        if base_type not in self._registry:
-            self._registry[base_type] = {new_component.__name__: new_register_component}
-        else:
-            self._registry[base_type][new_component.__name__] = new_register_component
+        name = new_component.__name__
+        self._registry.setdefault(base_type, {})[name] = new_register_component
+        self._types.setdefault(name, base_type)
+        self._payloads.setdefault(base_type, {})[name] = {
+            key: value
+            for key, value in new_register_component.items()
+            if key != "class"
+        }
+        if name in self._lazy.get(base_type, []):
+            self._lazy[base_type].remove(name)
 
-        if hasattr(new_component, "COMPATIBLE_COMPONENTS"):
-            for compatible_component in new_component.COMPATIBLE_COMPONENTS:
-                self._relationship_manager.add_relationship(
-                    new_component.__name__,
-                    compatible_component,
-                )
+        self._add_to_indexes(
+            name,
+            [parent.__name__ for parent in new_component.__bases__],
+            [ancestor.__name__ for ancestor in new_component.__mro__],
+            getattr(new_component, "COMPATIBLE_COMPONENTS", []),
+        )
+
+    @beartype
+    def register_lazy_component(self, path: str, component_type: str) -> None:
+        """Register a component without importing it.
+
+        The component module is imported the first time that the component is
+        obtained from the registry. If the component is in the static index of the
+        registry, its payload, ancestors and relationships are registered from the
+        index. Otherwise, they are registered when the component is imported.
+
+        Parameters
+        ----------
+        path : str
+            Dotted path of the component class, e.g.,
+            "DashAI.back.models.scikit_learn.svc.SVC".
+        component_type : str
+            Type of the component, i.e., the TYPE attribute of its base class.
+        """
+        name = path.rsplit(".", 1)[-1]
+        if name in self._registry.get(component_type, {}):
+            return
+
+        self._registry.setdefault(component_type, {})[name] = {
+            "name": name,
+            "type": component_type,
+            "path": path,
+        }
+        self._types.setdefault(name, component_type)
+        self._lazy[component_type].append(name)
+
+        indexed_component = self._component_index.get(path)
+        if (
+            indexed_component is not None
+            and indexed_component["payload"]["type"] == component_type
+        ):
+            self._payloads.setdefault(component_type, {})[name] = indexed_component[
+                "payload"
+            ]
+            self._add_to_indexes(
+                name,
+                indexed_component["bases"],
+                indexed_component["ancestors"],
+                indexed_component["compatible_components"],
+            )
+            self._indexed.add(name)
 
     @beartype
     def get_components_by_types(
@@ -340,6 +514,9 @@ class ComponentRegistry:
     ) -> List[Dict[str, Any]]:
         """Obtain the compoments that inherits from the specified parent component.
 
+        The children of the indexed components are known without importing them,
+        so only the returned components are loaded.
+
         Note that the method will not raise an exception when a non existant parent
         name is passed.
 
@@ -355,32 +532,33 @@ class ComponentRegistry:
         List[Dict[str, Any]]
             List of component dicts that inherits from the parent component.
         """
-        selected_components = []
-        for type_registry in self._registry.values():
-            for component_dict in type_registry.values():
-                component_bases = (
-                    component_dict["class"].__mro__
-                    if recursive
-                    else component_dict["class"].__bases__
-                )
-                component_bases_names = [cls_.__name__ for cls_ in component_bases]
+        # the parents of the lazy components without index are known once loaded.
+        self._load_components(include_indexed=False)
 
-                if parent_name in component_bases_names:
-                    selected_components.append(component_dict)
-
-        return selected_components
+        children = self._descendants if recursive else self._children
+        return [self.__getitem__(name) for name in children.get(parent_name, [])]
 
     @beartype
-    def get_related_components(self, component_id: str) -> List[Dict[str, Any]]:
+    def get_related_components(
+        self,
+        component_id: str,
+        select: Union[str, List[str], None] = None,
+    ) -> List[Dict[str, Any]]:
         """Obtain any related component of the given component name.
 
         If the component has no related components, then the method returns an empty
         list.
 
+        Since the relationships of a lazy component are known only after it is
+        loaded, this method loads the lazy components of the selected types.
+
         Parameters
         ----------
         component_id : str
             A registered component name.
+        select : Union[str, List[str], None], optional
+            The types of the related components to be returned. If None, related
+            components of any type are returned, by default None.
 
         Returns
         -------
@@ -397,7 +575,136 @@ class ComponentRegistry:
                 f"Component '{component_id}' does not exists in the registry."
             )
 
-        return [
+        if isinstance(select, str):
+            select = [select]
+        self.__getitem__(component_id)
+        self._load_components(select)
+
+        related_components = [
             self.__getitem__(related_component_id)
             for related_component_id in self._relationship_manager[component_id]
         ]
+        if select is None:
+            return related_components
+        return [
+            component_dict
+            for component_dict in related_components
+            if component_dict["type"] in select
+        ]
+
+    @beartype
+    def get_payload(self, component_id: str) -> Dict[str, Any]:
+        """Obtain the payload of a component, i.e., its component dict without the
+        class.
+
+        The payload is built when the component is registered, so the returned dict
+        is shared between calls and must not be modified.
+
+        Parameters
+        ----------
+        component_id : str
+            A registered component name.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The component payload.
+
+        Raises
+        ------
+        KeyError
+            If component id does not exists in the registry.
+        """
+        if component_id not in self._types:
+            raise KeyError(
+                f"Component '{component_id}' does not exists in the registry."
+            )
+        component_type = self._types[component_id]
+        if component_id not in self._payloads.get(component_type, {}):
+            self.__getitem__(component_id)
+        return self._payloads[component_type][component_id]
+
+    @beartype
+    def get_component_payloads(
+        self,
+        select_types: Union[List[str], None] = None,
+        ignore_types: Union[List[str], None] = None,
+        related_component: Union[str, None] = None,
+        component_parent: Union[str, None] = None,
+    ) -> List[Dict[str, Any]]:
+        """Obtain the payloads of the components that satisfy every given filter.
+
+        The components are obtained from the smallest index that applies (the
+        descendants of the parent, the related components or the components of
+        the selected types), so the cost of the query depends on the number of
+        selected components instead of the number of registered components.
+
+        Parameters
+        ----------
+        select_types : Union[List[str], None], optional
+            If specified, only the components of these types are returned,
+            by default None.
+        ignore_types : Union[List[str], None], optional
+            If specified, the components of these types are not returned,
+            by default None.
+        related_component : Union[str, None], optional
+            If specified, only the components related with this component are
+            returned, by default None.
+        component_parent : Union[str, None], optional
+            If specified, only the components that inherit (directly or not) from
+            the class with this name are returned, by default None.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The payloads of the selected components.
+
+        Raises
+        ------
+        ValueError
+            If some selected or ignored type does not exist in the registry.
+        KeyError
+            If the related component does not exist in the registry.
+        """
+        for component_type in (select_types or []) + (ignore_types or []):
+            if component_type not in self._registry:
+                raise ValueError(
+                    f"Component type {component_type} does not exist in the registry."
+                )
+
+        component_types = [
+            component_type
+            for component_type in (
+                select_types if select_types is not None else self._registry
+            )
+            if ignore_types is None or component_type not in ignore_types
+        ]
+        # the lazy components of other types are never part of the result.
+        self._load_components(component_types, include_indexed=False)
+
+        if related_component is not None:
+            if related_component not in self._indexed:
+                # the relationships of a lazy component are known once loaded.
+                self.__getitem__(related_component)
+            related_names = self._relationship_manager[related_component]
+
+        if component_parent is not None:
+            names = self._descendants.get(component_parent, [])
+            if related_component is not None:
+                related_set = set(related_names)
+                names = [name for name in names if name in related_set]
+        elif related_component is not None:
+            names = related_names
+        else:
+            return [
+                self._payloads[component_type][name]
+                for component_type in dict.fromkeys(component_types)
+                for name in self._registry[component_type]
+            ]
+
+        component_types_set = set(component_types)
+        return [
+            self._payloads[self._types[name]][name]
+            for name in dict.fromkeys(names)
+            if self._types.get(name) in component_types_set
+        ]
@@ -1,6 +1,25 @@
 # flake8: noqa
-from DashAI.back.explainability.explainers.kernel_shap import KernelShap
-from DashAI.back.explainability.explainers.partial_dependence import PartialDependence
-from DashAI.back.explainability.explainers.permutation_feature_importance import (
-    PermutationFeatureImportance,
-)
+from typing import TYPE_CHECKING
+
+from DashAI.back.core.lazy_import import lazy_import
+
+# Explainers are imported on first access (e.g., KernelShap imports shap).
+_EXPLAINERS = {
+    "KernelShap": "DashAI.back.explainability.explainers.kernel_shap",
+    "PartialDependence": "DashAI.back.explainability.explainers.partial_dependence",
+    "PermutationFeatureImportance": (
+        "DashAI.back.explainability.explainers.permutation_feature_importance"
+    ),
+}
+
+__all__ = list(_EXPLAINERS)
+__getattr__, __dir__ = lazy_import(__name__, _EXPLAINERS)
+
+if TYPE_CHECKING:
+    from DashAI.back.explainability.explainers.kernel_shap import KernelShap
+    from DashAI.back.explainability.explainers.partial_dependence import (
+        PartialDependence,
+    )
+    from DashAI.back.explainability.explainers.permutation_feature_importance import (
+        PermutationFeatureImportance,
+    )
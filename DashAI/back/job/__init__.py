@@ -1,3 +1,20 @@
 # flake8: noqa
-from DashAI.back.job.explainer_job import ExplainerJob
-from DashAI.back.job.model_job import ModelJob
+from typing import TYPE_CHECKING
+
+from DashAI.back.core.lazy_import import lazy_import
+
+# Jobs are imported on first access, since they import every component base
+# class (and their dependencies, e.g., optuna).
+_JOBS = {
+    "BatchModelJob": "DashAI.back.job.batch_model_job",
+    "ExplainerJob": "DashAI.back.job.explainer_job",
+    "ModelJob": "DashAI.back.job.model_job",
+}
+
+__all__ = list(_JOBS)
+__getattr__, __dir__ = lazy_import(__name__, _JOBS)
+
+if TYPE_CHECKING:
+    from DashAI.back.job.batch_model_job import BatchModelJob
+    from DashAI.back.job.explainer_job import ExplainerJob
+    from DashAI.back.job.model_job import ModelJob
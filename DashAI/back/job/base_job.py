@@ -1,7 +1,7 @@
 """Base Job abstract class."""
 
 from abc import ABCMeta, abstractmethod
-from typing import Final
+from typing import Final, Tuple
 
 
 class BaseJob(metaclass=ABCMeta):
@@ -25,6 +25,19 @@ class BaseJob(metaclass=ABCMeta):
         """Set the status of the job as delivered."""
         raise NotImplementedError
 
+    def get_workload(self) -> Tuple[str, float]:
+        """Describe the amount of work that the job will perform.
+
+        The workload is used by the job queue to estimate the job cost from
+        the timings of previous jobs of the same component.
+
+        Returns
+        -------
+        Tuple[str, float]
+            The name of the executed component and the size of its input.
+        """
+        return self.TYPE, 1.0
+
     @abstractmethod
     def run() -> None:
         """Run the job."""
@@ -0,0 +1,158 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from datasets import DatasetDict
+from kink import inject
+from sqlalchemy import exc, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from DashAI.back.core.enums.status import RunStatus
+from DashAI.back.dataloaders.classes.dashai_dataset import get_dataset_info
+from DashAI.back.dependencies.database.models import Dataset, Experiment, Run
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.job.base_job import BaseJob, JobError
+from DashAI.back.job.model_job import ModelJob, prepare_experiment_dataset
+from DashAI.back.job.progress import (
+    ProgressReporter,
+    get_progress_reporter,
+    progress_scope,
+)
+from DashAI.back.tasks import BaseTask
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class BatchModelJob(BaseJob):
+    """BatchModelJob class to train several runs of an experiment.
+
+    The experiment dataset is loaded and prepared once, and every run is trained
+    and evaluated over the same prepared splits (which are only read by the runs).
+    The results of each run are stored in the run itself, as in ModelJob.
+
+    The job kwargs are:
+
+    - experiment_id: id of the experiment whose runs will be trained.
+    - run_ids (optional): ids of the runs to train. By default, every run of the
+      experiment that is not finished.
+    - n_workers (optional): number of runs trained in parallel threads, by
+      default 1.
+    """
+
+    def _get_runs(self, db: Session) -> List[Run]:
+        """Retrieve the runs to be trained by the job."""
+        experiment_id: int = self.kwargs["experiment_id"]
+        run_ids: Optional[List[int]] = self.kwargs.get("run_ids")
+
+        query = select(Run).where(Run.experiment_id == experiment_id)
+        if run_ids is not None:
+            query = query.where(Run.id.in_(run_ids))
+        else:
+            query = query.where(Run.status != RunStatus.FINISHED)
+        runs = list(db.scalars(query.order_by(Run.id)))
+
+        if not runs:
+            raise JobError(f"Experiment {experiment_id} has no runs to train.")
+        return runs
+
+    def set_status_as_delivered(self) -> None:
+        """Set the status of every run of the job as delivered."""
+        db: Session = self.kwargs["db"]
+
+        runs = self._get_runs(db)
+        try:
+            for run in runs:
+                run.set_status_as_delivered()
+            db.commit()
+        except exc.SQLAlchemyError as e:
+            log.exception(e)
+            raise JobError(
+                "Internal database error",
+            ) from e
+        self.kwargs["run_ids"] = [run.id for run in runs]
+
+    def get_workload(self) -> Tuple[str, float]:
+        """Describe the workload as the number of dataset rows times the number of
+        optimizer trials of all the runs."""
+        experiment_id: int = self.kwargs["experiment_id"]
+        db: Session = self.kwargs["db"]
+
+        experiment: Experiment = db.get(Experiment, experiment_id)
+        if not experiment:
+            raise JobError(f"Experiment {experiment_id} does not exist in DB.")
+        dataset: Dataset = db.get(Dataset, experiment.dataset_id)
+        n_rows = get_dataset_info(f"{dataset.file_path}/dataset")["total_rows"]
+        n_trials = sum(run.get_n_trials() for run in self._get_runs(db))
+        return self.__class__.__name__, float(n_rows * n_trials)
+
+    @inject
+    def _run_model_job(
+        self,
+        run_id: int,
+        prepared_data: Tuple[DatasetDict, DatasetDict],
+        reporter: Optional[ProgressReporter],
+        session_factory: sessionmaker = lambda di: di["session_factory"],
+    ) -> Optional[Exception]:
+        """Train a run with its own DB session and return the raised error.
+
+        The run progress is reported with the batch job reporter, labeled with
+        the run id.
+        """
+        run_reporter = reporter.bind(run_id=run_id) if reporter is not None else None
+        with session_factory() as db, progress_scope(run_reporter):
+            try:
+                ModelJob(run_id=run_id, db=db).run(prepared_data=prepared_data)
+            except Exception as e:
+                log.exception(e)
+                return e
+        return None
+
+    @inject
+    def run(
+        self,
+        component_registry: ComponentRegistry = lambda di: di["component_registry"],
+    ) -> None:
+        experiment_id: int = self.kwargs["experiment_id"]
+        n_workers: int = self.kwargs.get("n_workers", 1)
+        db: Session = self.kwargs["db"]
+
+        experiment: Experiment = db.get(Experiment, experiment_id)
+        if not experiment:
+            raise JobError(f"Experiment {experiment_id} does not exist in DB.")
+        dataset: Dataset = db.get(Dataset, experiment.dataset_id)
+        if not dataset:
+            raise JobError(f"Dataset {experiment.dataset_id} does not exist in DB.")
+        run_ids = [run.id for run in self._get_runs(db)]
+
+        try:
+            try:
+                task: BaseTask = component_registry[experiment.task_name]["class"]()
+            except Exception as e:
+                log.exception(e)
+                raise JobError(
+                    f"Unable to find Task with name {experiment.task_name} in registry",
+                ) from e
+            prepared_data = prepare_experiment_dataset(dataset, experiment, task)
+        except JobError:
+            for run_id in run_ids:
+                db.get(Run, run_id).set_status_as_error()
+            db.commit()
+            raise
+
+        reporter = get_progress_reporter()
+        with ThreadPoolExecutor(max_workers=max(n_workers, 1)) as executor:
+            errors = list(
+                executor.map(
+                    lambda run_id: self._run_model_job(run_id, prepared_data, reporter),
+                    run_ids,
+                )
+            )
+
+        failed_runs = [
+            run_id
+            for run_id, error in zip(run_ids, errors)  # noqa B905
+            if error is not None
+        ]
+        if failed_runs:
+            raise JobError(f"Runs {failed_runs} of experiment {experiment_id} failed.")
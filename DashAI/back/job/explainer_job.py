@@ -1,4 +1,3 @@
-import json
 import logging
 import os
 import pickle
@@ -10,9 +9,9 @@ from sqlalchemy import exc
 from sqlalchemy.orm import Session
 
 from DashAI.back.dataloaders.classes.dashai_dataset import (
+    get_dataset_info,
     load_dataset,
     select_columns,
-    update_dataset_splits,
 )
 from DashAI.back.dependencies.database.models import (
     Dataset,
@@ -25,6 +24,7 @@ from DashAI.back.dependencies.registry import ComponentRegistry
 from DashAI.back.explainability.global_explainer import BaseGlobalExplainer
 from DashAI.back.explainability.local_explainer import BaseLocalExplainer
 from DashAI.back.job.base_job import BaseJob, JobError
+from DashAI.back.job.model_job import prepare_experiment_dataset
 from DashAI.back.models import BaseModel
 from DashAI.back.tasks import BaseTask
 
@@ -59,6 +59,28 @@ class ExplainerJob(BaseJob):
                 "Internal database error",
             ) from e
 
+    def get_workload(self) -> Tuple[str, float]:
+        """Describe the explanation workload as the explainer name and the number
+        of rows of the experiment dataset."""
+        explainer_id: int = self.kwargs["explainer_id"]
+        db: Session = self.kwargs["db"]
+        explainer_scope: str = self.kwargs["explainer_scope"]
+
+        if explainer_scope == "global":
+            explainer: GlobalExplainer = db.get(GlobalExplainer, explainer_id)
+        elif explainer_scope == "local":
+            explainer: LocalExplainer = db.get(LocalExplainer, explainer_id)
+        else:
+            raise JobError(f"{explainer_scope} is an invalid explainer type")
+        if not explainer:
+            raise JobError(f"Explainer with id {explainer_id} does not exist in DB.")
+
+        run: Run = db.get(Run, explainer.run_id)
+        experiment: Experiment = db.get(Experiment, run.experiment_id)
+        dataset: Dataset = db.get(Dataset, experiment.dataset_id)
+        n_rows = get_dataset_info(f"{dataset.file_path}/dataset")["total_rows"]
+        return explainer.explainer_name, float(n_rows)
+
     @inject
     def _generate_global_explanation(
         self,
@@ -251,15 +273,6 @@ class ExplainerJob(BaseJob):
                 raise JobError(
                     f"Unable to instantiate {explainer_scope} explainer.",
                 ) from e
-            try:
-                loaded_dataset: DatasetDict = load_dataset(
-                    f"{dataset.file_path}/dataset"
-                )
-            except Exception as e:
-                log.exception(e)
-                raise JobError(
-                    f"Can not load dataset from path {dataset.file_path}",
-                ) from e
             try:
                 task: BaseTask = component_registry[experiment.task_name]["class"]()
             except Exception as e:
@@ -267,32 +280,7 @@ class ExplainerJob(BaseJob):
                 raise JobError(
                     f"Unable to find Task with name {experiment.task_name} in registry",
                 ) from e
-            try:
-                splits = json.loads(experiment.splits)
-                if splits["has_changed"]:
-                    new_splits = {
-                        "train": splits["train"],
-                        "test": splits["test"],
-                        "validation": splits["validation"],
-                    }
-                    loaded_dataset = update_dataset_splits(
-                        loaded_dataset, new_splits, splits["is_random"]
-                    )
-                prepared_dataset = task.prepare_for_task(
-                    datasetdict=loaded_dataset,
-                    outputs_columns=self.output_columns,
-                )
-                data = select_columns(
-                    prepared_dataset,
-                    self.input_columns,
-                    self.output_columns,
-                )
-
-            except Exception as e:
-                log.exception(e)
-                raise JobError(
-                    f"""Can not prepare dataset {dataset.id} for the explanation""",
-                ) from e
+            data = prepare_experiment_dataset(dataset, experiment, task)
             try:
                 self.explainer_db.set_status_as_started()
                 db.commit()
@@ -1,23 +1,35 @@
+import hashlib
 import json
 import logging
 import os
 import pickle
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
+from datasets import DatasetDict
 from kink import inject
 from sqlalchemy import exc
 from sqlalchemy.orm import Session
 
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     DashAIDataset,
+    get_dataset_info,
+    iter_batches,
     load_dataset,
+    load_prepared_dataset,
+    save_prepared_dataset,
     select_columns,
     update_dataset_splits,
 )
+from DashAI.back.dependencies.database import unit_of_work
 from DashAI.back.dependencies.database.models import Dataset, Experiment, Run
 from DashAI.back.dependencies.registry import ComponentRegistry
 from DashAI.back.job.base_job import BaseJob, JobError
+from DashAI.back.job.progress import report_progress
 from DashAI.back.metrics import BaseMetric
+from DashAI.back.metrics.classification_metric import (
+    ClassificationMetric,
+    ConfusionMatrix,
+)
 from DashAI.back.models import BaseModel
 from DashAI.back.optimizers import BaseOptimizer
 from DashAI.back.tasks import BaseTask
@@ -25,6 +37,225 @@ from DashAI.back.tasks import BaseTask
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
+# version of the format of the prepared datasets, part of their path. It must be
+# bumped whenever the preparation changes (e.g., the prepare_for_task of a task
+# or encode_class_columns), so the datasets prepared before are not reused.
+PREPARED_DATASET_VERSION = 2
+
+
+def score_metrics(
+    metrics: List[BaseMetric],
+    model: BaseModel,
+    x: DashAIDataset,
+    y: DashAIDataset,
+    batch_size: int,
+) -> Dict[str, float]:
+    """Calculate the score of several metrics over the predictions of a split.
+
+    The split is predicted in batches of at most batch_size rows, and the metrics
+    are accumulated batch by batch, so the predictions of the whole split are
+    never held in memory at the same time. The classification metrics share a
+    single confusion matrix. The number of predicted rows is reported after
+    each batch as an "evaluation" progress event.
+
+    Parameters
+    ----------
+    metrics : List[BaseMetric]
+        The metric classes to be scored.
+    model : BaseModel
+        The trained model.
+    x : DashAIDataset
+        The input columns of the split.
+    y : DashAIDataset
+        The true output columns of the split.
+    batch_size : int
+        Maximum number of rows predicted at once.
+
+    Returns
+    -------
+    Dict[str, float]
+        The score of each metric by its name.
+    """
+    classification_metrics = [
+        metric for metric in metrics if issubclass(metric, ClassificationMetric)
+    ]
+    confusion_matrix = ConfusionMatrix()
+    accumulators = {
+        metric.__name__: metric.accumulator()
+        for metric in metrics
+        if metric not in classification_metrics
+    }
+
+    if len(x) != len(y):
+        raise ValueError(
+            f"The input ({len(x)} rows) and output ({len(y)} rows) columns of the "
+            "split must have the same number of rows."
+        )
+    batches = zip(  # noqa B905
+        iter_batches(x, batch_size), iter_batches(y, batch_size)
+    )
+    if len(x) == 0:
+        # an empty split is still predicted and scored once.
+        batches = [(x, y)]
+
+    predicted_rows = 0
+    for x_batch, y_batch in batches:
+        predictions = model.predict(x_batch)
+        if classification_metrics:
+            confusion_matrix.update_from_predictions(y_batch, predictions)
+        for accumulator in accumulators.values():
+            accumulator.update(y_batch, predictions)
+        predicted_rows += len(x_batch)
+        report_progress("evaluation", rows=predicted_rows, total_rows=len(x))
+
+    scores: Dict[str, float] = {}
+    for metric in metrics:
+        if metric in classification_metrics:
+            scores[metric.__name__] = metric.from_confusion_matrix(confusion_matrix)
+        else:
+            scores[metric.__name__] = accumulators[metric.__name__].finalize()
+    return scores
+
+
+def get_prepared_dataset_path(
+    dataset: Dataset, experiment: Experiment, prepared_datasets_path: os.PathLike
+) -> str:
+    """Obtain the path where the prepared dataset of an experiment is published.
+
+    The prepared dataset only depends on the dataset content, the task, the
+    splits and the input and output columns of the experiment, so the path is
+    keyed by them and every experiment with the same configuration shares it.
+    The key also has the PREPARED_DATASET_VERSION, so the datasets prepared by
+    an older version of the preparation are not reused.
+    The prepared datasets of a fingerprinted dataset are grouped by fingerprint;
+    the ones of a dataset without fingerprint are stored in its own folder.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The experiment dataset DB object.
+    experiment : Experiment
+        The experiment DB object.
+    prepared_datasets_path : os.PathLike
+        Path of the prepared datasets store.
+
+    Returns
+    -------
+    str
+        The path of the prepared dataset.
+    """
+    key = hashlib.sha256(
+        json.dumps(
+            {
+                "version": PREPARED_DATASET_VERSION,
+                "fingerprint": dataset.fingerprint,
+                "task_name": experiment.task_name,
+                "splits": json.loads(experiment.splits),
+                "input_columns": experiment.input_columns,
+                "output_columns": experiment.output_columns,
+            },
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+    if dataset.fingerprint is None:
+        return os.path.join(dataset.file_path, "prepared", key)
+    return os.path.join(prepared_datasets_path, dataset.fingerprint, key)
+
+
+@inject
+def prepare_experiment_dataset(
+    dataset: Dataset,
+    experiment: Experiment,
+    task: BaseTask,
+    config: Dict[str, Any] = lambda di: di["config"],
+) -> Tuple[DatasetDict, DatasetDict]:
+    """Load the dataset of an experiment and prepare it to train its runs.
+
+    The dataset is split according to the experiment splits, prepared for the
+    experiment task and divided into the input and output columns.
+
+    The prepared dataset is published in the prepared datasets store the first
+    time it is computed (see `get_prepared_dataset_path`), and every later job
+    of any experiment with the same dataset and configuration (in this or in
+    other processes) memory-maps that published copy instead of preparing and
+    holding its own.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The experiment dataset DB object.
+    experiment : Experiment
+        The experiment DB object.
+    task : BaseTask
+        An instance of the experiment task.
+    config : Dict[str, Any]
+        Application settings, provided by dependency injection.
+
+    Returns
+    -------
+    Tuple[DatasetDict, DatasetDict]
+        The input and output columns of the prepared dataset.
+
+    Raises
+    ------
+    JobError
+        If the dataset can not be loaded or prepared.
+    """
+    prepared_path = get_prepared_dataset_path(
+        dataset, experiment, config["PREPARED_DATASETS_PATH"]
+    )
+    if os.path.exists(prepared_path):
+        try:
+            return load_prepared_dataset(prepared_path)
+        except Exception as e:
+            log.warning("Unable to load prepared dataset %s: %s", prepared_path, e)
+
+    try:
+        loaded_dataset: DashAIDataset = load_dataset(f"{dataset.file_path}/dataset")
+    except Exception as e:
+        log.exception(e)
+        raise JobError(
+            f"Can not load dataset from path {dataset.file_path}",
+        ) from e
+
+    try:
+        splits = json.loads(experiment.splits)
+        if splits["has_changed"]:
+            new_splits = {
+                "train": splits["train"],
+                "test": splits["test"],
+                "validation": splits["validation"],
+            }
+            loaded_dataset = update_dataset_splits(
+                loaded_dataset,
+                new_splits,
+                splits["is_random"],
+            )
+        prepared_dataset = task.prepare_for_task(
+            loaded_dataset, experiment.output_columns
+        )
+        x, y = select_columns(
+            prepared_dataset,
+            experiment.input_columns,
+            experiment.output_columns,
+        )
+    except Exception as e:
+        log.exception(e)
+        raise JobError(
+            f"""Can not prepare Dataset {dataset.id}
+            for Task {experiment.task_name}""",
+        ) from e
+
+    try:
+        os.makedirs(os.path.dirname(prepared_path), exist_ok=True)
+        save_prepared_dataset(x, y, prepared_path)
+        return load_prepared_dataset(prepared_path)
+    except Exception as e:
+        # the job can still use its private copy of the prepared dataset.
+        log.warning("Unable to publish prepared dataset %s: %s", prepared_path, e)
+        return x, y
+
 
 class ModelJob(BaseJob):
     """ModelJob class to run the model training."""
@@ -46,16 +277,38 @@ class ModelJob(BaseJob):
                 "Internal database error",
             ) from e
 
+    def get_workload(self) -> Tuple[str, float]:
+        """Describe the run workload as its model name and the number of dataset
+        rows times the number of optimizer trials."""
+        run_id: int = self.kwargs["run_id"]
+        db: Session = self.kwargs["db"]
+
+        run: Run = db.get(Run, run_id)
+        if not run:
+            raise JobError(f"Run {run_id} does not exist in DB.")
+        experiment: Experiment = db.get(Experiment, run.experiment_id)
+        dataset: Dataset = db.get(Dataset, experiment.dataset_id)
+        n_rows = get_dataset_info(f"{dataset.file_path}/dataset")["total_rows"]
+        return run.model_name, float(n_rows * run.get_n_trials())
+
     @inject
     def run(
         self,
         component_registry: ComponentRegistry = lambda di: di["component_registry"],
         config=lambda di: di["config"],
+        prepared_data: Optional[Tuple[DatasetDict, DatasetDict]] = None,
     ) -> None:
-        from DashAI.back.api.api_v1.endpoints.components import (
-            _intersect_component_lists,
-        )
+        """Train and evaluate the model of the run.
+
+        The job reports its phase transitions as "phase" progress events.
 
+        Parameters
+        ----------
+        prepared_data : Optional[Tuple[DatasetDict, DatasetDict]]
+            The experiment dataset already prepared for the task and split into
+            input and output columns. If None, the dataset is loaded and prepared
+            by the job.
+        """
         # Get the necessary parameters
         run_id: int = self.kwargs["run_id"]
         db: Session = self.kwargs["db"]
@@ -70,16 +323,6 @@ class ModelJob(BaseJob):
             if not dataset:
                 raise JobError(f"Dataset {experiment.dataset_id} does not exist in DB.")
 
-            try:
-                loaded_dataset: DashAIDataset = load_dataset(
-                    f"{dataset.file_path}/dataset"
-                )
-            except Exception as e:
-                log.exception(e)
-                raise JobError(
-                    f"Can not load dataset from path {dataset.file_path}",
-                ) from e
-
             try:
                 task: BaseTask = component_registry[experiment.task_name]["class"]()
             except Exception as e:
@@ -89,19 +332,13 @@ class ModelJob(BaseJob):
                 ) from e
 
             try:
-                # Get all the metrics
-                all_metrics = {
+                # Get the metrics related to the task
+                selected_metrics = {
                     component_dict["name"]: component_dict
-                    for component_dict in component_registry.get_components_by_types(
-                        select="Metric"
+                    for component_dict in component_registry.get_related_components(
+                        experiment.task_name, select="Metric"
                     )
                 }
-                # Get the intersection between the metrics and the task
-                # related components
-                selected_metrics = _intersect_component_lists(
-                    all_metrics,
-                    component_registry.get_related_components(experiment.task_name),
-                )
                 metrics: List[BaseMetric] = [
                     metric["class"] for metric in selected_metrics.values()
                 ]
@@ -112,33 +349,10 @@ class ModelJob(BaseJob):
                     f"Task {experiment.task_name} in registry",
                 ) from e
 
-            try:
-                splits = json.loads(experiment.splits)
-                if splits["has_changed"]:
-                    new_splits = {
-                        "train": splits["train"],
-                        "test": splits["test"],
-                        "validation": splits["validation"],
-                    }
-                    loaded_dataset = update_dataset_splits(
-                        loaded_dataset,
-                        new_splits,
-                        splits["is_random"],
-                    )
-                prepared_dataset = task.prepare_for_task(
-                    loaded_dataset, experiment.output_columns
-                )
-                x, y = select_columns(
-                    prepared_dataset,
-                    experiment.input_columns,
-                    experiment.output_columns,
-                )
-            except Exception as e:
-                log.exception(e)
-                raise JobError(
-                    f"""Can not prepare Dataset {dataset.id}
-                    for Task {experiment.task_name}""",
-                ) from e
+            if prepared_data is None:
+                report_progress("phase", phase="preparing_dataset")
+                prepared_data = prepare_experiment_dataset(dataset, experiment, task)
+            x, y = prepared_data
 
             try:
                 run_model_class = component_registry[run.model_name]["class"]
@@ -250,13 +464,17 @@ class ModelJob(BaseJob):
                         "Optimizer parameters are not compatible with the optimizer",
                     ) from e
             try:
-                run.set_status_as_started()
-                db.commit()
+                with unit_of_work(db):
+                    run.set_status_as_started()
             except exc.SQLAlchemyError as e:
                 log.exception(e)
                 raise JobError(
                     "Connection with the database failed",
                 ) from e
+            report_progress(
+                "phase",
+                phase="optimizing" if run_optimizable_parameters else "training",
+            )
             try:
                 # Hyperparameter Tunning
                 if not run_optimizable_parameters:
@@ -288,58 +506,36 @@ class ModelJob(BaseJob):
                     "Model training failed",
                 ) from e
             if run_optimizable_parameters != {}:
-                if len(run_optimizable_parameters) >= 2:
-                    try:
-                        run.plot_history_path = plot_paths[0]
-                        run.plot_slice_path = plot_paths[1]
+                try:
+                    run.plot_history_path = plot_paths[0]
+                    run.plot_slice_path = plot_paths[1]
+                    if len(run_optimizable_parameters) >= 2:
                         run.plot_contour_path = plot_paths[2]
                         run.plot_importance_path = plot_paths[3]
-                        db.commit()
-                    except Exception as e:
-                        log.exception(e)
-                        raise JobError(
-                            "Hyperparameter plot path saving failed",
-                        ) from e
-                else:
-                    try:
-                        run.plot_history_path = plot_paths[0]
-                        run.plot_slice_path = plot_paths[1]
-                        db.commit()
-                    except Exception as e:
-                        log.exception(e)
-                        raise JobError(
-                            "Hyperparameter plot path saving failed",
-                        ) from e
-            try:
-                run.set_status_as_finished()
-                db.commit()
-            except exc.SQLAlchemyError as e:
-                log.exception(e)
-                raise JobError(
-                    "Connection with the database failed",
-                ) from e
+                except Exception as e:
+                    log.exception(e)
+                    raise JobError(
+                        "Hyperparameter plot path saving failed",
+                    ) from e
 
             try:
-                model_metrics = {
-                    split: {
-                        metric.__name__: metric.score(
-                            y[split],
-                            model.predict(x[split]),
-                        )
-                        for metric in metrics
-                    }
-                    for split in ["train", "validation", "test"]
-                }
+                model_metrics = {}
+                for split in ["train", "validation", "test"]:
+                    report_progress("phase", phase="evaluating", split=split)
+                    model_metrics[split] = score_metrics(
+                        metrics,
+                        model,
+                        x[split],
+                        y[split],
+                        config["EVALUATION_BATCH_SIZE"],
+                    )
             except Exception as e:
                 log.exception(e)
                 raise JobError(
                     "Metrics calculation failed",
                 ) from e
 
-            run.train_metrics = model_metrics["train"]
-            run.validation_metrics = model_metrics["validation"]
-            run.test_metrics = model_metrics["test"]
-
+            report_progress("phase", phase="saving")
             try:
                 run_path = os.path.join(config["RUNS_PATH"], str(run.id))
                 model.save(run_path)
@@ -349,17 +545,23 @@ class ModelJob(BaseJob):
                     "Model saving failed",
                 ) from e
 
+            # the plots, metrics, model path and final status of the run are
+            # published together in a single transaction.
             try:
-                run.run_path = run_path
-                db.commit()
+                with unit_of_work(db):
+                    run.train_metrics = model_metrics["train"]
+                    run.validation_metrics = model_metrics["validation"]
+                    run.test_metrics = model_metrics["test"]
+                    run.run_path = run_path
+                    run.set_status_as_finished()
             except exc.SQLAlchemyError as e:
                 log.exception(e)
-                run.set_status_as_error()
-                db.commit()
                 raise JobError(
                     "Connection with the database failed",
                 ) from e
+            report_progress("phase", phase="finished", metrics=model_metrics)
         except Exception as e:
-            run.set_status_as_error()
-            db.commit()
+            with unit_of_work(db):
+                run.set_status_as_error()
+            report_progress("phase", phase="error", message=str(e))
             raise e
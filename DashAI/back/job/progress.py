@@ -0,0 +1,178 @@
+"""Progress events of the running jobs.
+
+The jobs report their progress (phase transitions, optimizer trials, training
+steps, evaluation batches) with `report_progress`, which publishes the event in
+the broker of the job being executed. The job queue loop sets that broker for
+the duration of each job with `progress_scope`, so components report progress
+without knowing which job (if any) is running them.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+_current_reporter: contextvars.ContextVar = contextvars.ContextVar(
+    "progress_reporter", default=None
+)
+
+
+class ProgressBroker:
+    """Fan-out of progress events to the subscribed clients.
+
+    Events are published from the threads that execute the jobs and delivered
+    to asyncio queues, one per subscriber, in the event loop of each subscriber.
+    The broker keeps the last events, so a new subscriber first receives the
+    current progress of the running jobs.
+    """
+
+    def __init__(self, history_size: int = 500, queue_size: int = 1000) -> None:
+        """Initialize the broker.
+
+        Parameters
+        ----------
+        history_size : int
+            Number of past events sent to every new subscriber, by default 500.
+        queue_size : int
+            Maximum number of events pending delivery to a subscriber, by
+            default 1000. When a subscriber falls behind, its oldest pending
+            events are dropped.
+        """
+        self.queue_size = max(queue_size, history_size)
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    def _deliver(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        """Put an event in a subscriber queue, dropping its oldest event if full."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Publish an event to every subscriber. It is safe to call from any thread.
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            The JSON serializable event.
+        """
+        with self._lock:
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # the event loop of the subscriber was closed.
+                self.unsubscribe(queue)
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Return the last published events, from oldest to newest."""
+        with self._lock:
+            return list(self._history)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Subscribe to the events. It must be called from a running event loop.
+
+        Returns
+        -------
+        asyncio.Queue
+            Queue that receives the last published events followed by every
+            new event.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            for event in self._history:
+                queue.put_nowait(event)
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering events to a subscriber queue."""
+        with self._lock:
+            self._subscribers = [
+                subscriber
+                for subscriber in self._subscribers
+                if subscriber[1] is not queue
+            ]
+
+
+class ProgressReporter:
+    """Publish the progress events of a job, labeled with the job identifiers."""
+
+    def __init__(self, broker: ProgressBroker, **labels: Any) -> None:
+        """Initialize the reporter.
+
+        Parameters
+        ----------
+        broker : ProgressBroker
+            Broker where the events are published.
+        labels : Any
+            Fields added to every event, e.g. the job and run ids.
+        """
+        self.broker = broker
+        self.labels = labels
+
+    def bind(self, **labels: Any) -> "ProgressReporter":
+        """Return a reporter to the same broker with additional labels."""
+        return ProgressReporter(self.broker, **{**self.labels, **labels})
+
+    def __call__(self, event: str, **data: Any) -> None:
+        """Publish an event.
+
+        Parameters
+        ----------
+        event : str
+            Type of the event, e.g. "phase", "trial", "step" or "evaluation".
+        data : Any
+            JSON serializable fields of the event.
+        """
+        self.broker.publish(
+            {"event": event, **self.labels, **data, "timestamp": time.time()}
+        )
+
+
+def get_progress_reporter() -> Optional[ProgressReporter]:
+    """Return the reporter of the job executed in the current context, if any."""
+    return _current_reporter.get()
+
+
+@contextmanager
+def progress_scope(reporter: Optional[ProgressReporter]) -> Iterator[None]:
+    """Set the reporter used by `report_progress` in the current context.
+
+    Context variables are not inherited by the threads of a pool, so jobs that
+    run components in other threads must enter the scope in those threads.
+
+    Parameters
+    ----------
+    reporter : Optional[ProgressReporter]
+        The reporter of the job, or None to discard the progress events.
+    """
+    token = _current_reporter.set(reporter)
+    try:
+        yield
+    finally:
+        _current_reporter.reset(token)
+
+
+def report_progress(event: str, **data: Any) -> None:
+    """Report the progress of the job executed in the current context.
+
+    It does nothing when no job is being executed, e.g. when a model is trained
+    outside the job queue.
+
+    Parameters
+    ----------
+    event : str
+        Type of the event, e.g. "phase", "trial", "step" or "evaluation".
+    data : Any
+        JSON serializable fields of the event.
+    """
+    reporter = _current_reporter.get()
+    if reporter is not None:
+        reporter(event, **data)
@@ -1,9 +1,30 @@
 # flake8: noqa
-from DashAI.back.metrics.base_metric import BaseMetric
-from DashAI.back.metrics.classification.accuracy import Accuracy
-from DashAI.back.metrics.classification.f1 import F1
-from DashAI.back.metrics.classification.precision import Precision
-from DashAI.back.metrics.classification.recall import Recall
-from DashAI.back.metrics.regression.mae import MAE
-from DashAI.back.metrics.regression.rmse import RMSE
-from DashAI.back.metrics.translation.bleu import Bleu
+from typing import TYPE_CHECKING
+
+from DashAI.back.core.lazy_import import lazy_import
+
+# Metrics are imported on first access, so importing the package does not import
+# their dependencies (e.g., sklearn or sacrebleu).
+_METRICS = {
+    "BaseMetric": "DashAI.back.metrics.base_metric",
+    "Accuracy": "DashAI.back.metrics.classification.accuracy",
+    "F1": "DashAI.back.metrics.classification.f1",
+    "Precision": "DashAI.back.metrics.classification.precision",
+    "Recall": "DashAI.back.metrics.classification.recall",
+    "MAE": "DashAI.back.metrics.regression.mae",
+    "RMSE": "DashAI.back.metrics.regression.rmse",
+    "Bleu": "DashAI.back.metrics.translation.bleu",
+}
+
+__all__ = list(_METRICS)
+__getattr__, __dir__ = lazy_import(__name__, _METRICS)
+
+if TYPE_CHECKING:
+    from DashAI.back.metrics.base_metric import BaseMetric
+    from DashAI.back.metrics.classification.accuracy import Accuracy
+    from DashAI.back.metrics.classification.f1 import F1
+    from DashAI.back.metrics.classification.precision import Precision
+    from DashAI.back.metrics.classification.recall import Recall
+    from DashAI.back.metrics.regression.mae import MAE
+    from DashAI.back.metrics.regression.rmse import RMSE
+    from DashAI.back.metrics.translation.bleu import Bleu
@@ -1,9 +1,77 @@
 """Base Metric abstract class."""
 
-from typing import Final
+from typing import Any, Final, List, Type
+
+import numpy as np
+from datasets import Dataset, concatenate_datasets
 
 
 class BaseMetric:
     """Abstract class of all metrics."""
 
     TYPE: Final[str] = "Metric"
+
+    @classmethod
+    def accumulator(cls) -> "MetricAccumulator":
+        """Create an accumulator to score the metric over batches of a split.
+
+        Returns
+        -------
+        MetricAccumulator
+            An empty accumulator of the metric.
+        """
+        return MetricAccumulator(cls)
+
+
+class MetricAccumulator:
+    """Score a metric over a split given batch by batch.
+
+    Each batch of true values and predictions is added with `update`, and the
+    metric score of all the batches is obtained with `finalize`.
+
+    This default accumulator keeps the batches and scores their concatenation.
+    Metrics that can be computed from running statistics override
+    `BaseMetric.accumulator` so that the memory does not grow with the split.
+    """
+
+    def __init__(self, metric: Type[BaseMetric]) -> None:
+        """Initialize the accumulator.
+
+        Parameters
+        ----------
+        metric : Type[BaseMetric]
+            The metric to be scored.
+        """
+        self.metric = metric
+        self._true_values: List[Dataset] = []
+        self._predictions: List[Any] = []
+
+    def update(self, true_values: Dataset, predictions: Any) -> None:
+        """Add a batch of true values and predictions.
+
+        Parameters
+        ----------
+        true_values : Dataset
+            A dataset with the output columns of the batch.
+        predictions : Any
+            The model predictions for the batch.
+        """
+        self._true_values.append(true_values)
+        self._predictions.append(predictions)
+
+    def finalize(self) -> float:
+        """Score the metric over all the added batches.
+
+        Returns
+        -------
+        float
+            The metric score.
+        """
+        if not self._true_values:
+            raise ValueError("No batches were added to the accumulator.")
+        if len(self._true_values) == 1:
+            return self.metric.score(self._true_values[0], self._predictions[0])
+        return self.metric.score(
+            concatenate_datasets(self._true_values),
+            np.concatenate(self._predictions),
+        )
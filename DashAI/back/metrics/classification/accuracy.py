@@ -1,12 +1,11 @@
 """DashAI accuracy classification metric implementation."""
 
 import numpy as np
-from sklearn.metrics import accuracy_score
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.classification_metric import (
     ClassificationMetric,
-    prepare_to_metric,
+    ConfusionMatrix,
 )
 
 
@@ -31,5 +30,10 @@ class Accuracy(ClassificationMetric):
         float
             Accuracy score between true labels and predicted labels
         """
-        true_labels, pred_labels = prepare_to_metric(true_labels, probs_pred_labels)
-        return accuracy_score(true_labels, pred_labels)
+        return Accuracy.from_confusion_matrix(
+            ConfusionMatrix.from_predictions(true_labels, probs_pred_labels)
+        )
+
+    @staticmethod
+    def from_confusion_matrix(confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.accuracy()
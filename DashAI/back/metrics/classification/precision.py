@@ -1,12 +1,11 @@
 """DashAI precision classification metric implementation."""
 
 import numpy as np
-from sklearn.metrics import precision_score
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.classification_metric import (
     ClassificationMetric,
-    prepare_to_metric,
+    ConfusionMatrix,
 )
 
 
@@ -31,9 +30,10 @@ class Precision(ClassificationMetric):
         float
             Precision score between true labels and predicted labels
         """
-        true_labels, pred_labels = prepare_to_metric(true_labels, probs_pred_labels)
-        multiclass = len(np.unique(true_labels)) > 2
-        if multiclass:
-            return precision_score(true_labels, pred_labels, average="macro")
-        else:
-            return precision_score(true_labels, pred_labels, average="binary")
+        return Precision.from_confusion_matrix(
+            ConfusionMatrix.from_predictions(true_labels, probs_pred_labels)
+        )
+
+    @staticmethod
+    def from_confusion_matrix(confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.precision()
@@ -1,12 +1,11 @@
 """DashAI recall classification metric implementation."""
 
 import numpy as np
-from sklearn.metrics import recall_score
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.classification_metric import (
     ClassificationMetric,
-    prepare_to_metric,
+    ConfusionMatrix,
 )
 
 
@@ -31,9 +30,10 @@ class Recall(ClassificationMetric):
         float
             recall score between true labels and predicted labels
         """
-        true_labels, pred_labels = prepare_to_metric(true_labels, probs_pred_labels)
-        multiclass = len(np.unique(true_labels)) > 2
-        if multiclass:
-            return recall_score(true_labels, pred_labels, average="macro")
-        else:
-            return recall_score(true_labels, pred_labels, average="binary")
+        return Recall.from_confusion_matrix(
+            ConfusionMatrix.from_predictions(true_labels, probs_pred_labels)
+        )
+
+    @staticmethod
+    def from_confusion_matrix(confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.recall()
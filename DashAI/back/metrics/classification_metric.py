@@ -1,13 +1,18 @@
-from typing import Tuple
+from typing import Optional, Tuple, Type
 
 import numpy as np
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
-from DashAI.back.metrics.base_metric import BaseMetric
+from DashAI.back.metrics.base_metric import BaseMetric, MetricAccumulator
 
 
 class ClassificationMetric(BaseMetric):
-    """Class for metrics associated to classification models."""
+    """Class for metrics associated to classification models.
+
+    Classification metrics are derived from the confusion matrix of the labels, so
+    several metrics of the same predictions can share a single ConfusionMatrix
+    through `from_confusion_matrix`.
+    """
 
     COMPATIBLE_COMPONENTS = [
         "TabularClassificationTask",
@@ -15,6 +20,33 @@ class ClassificationMetric(BaseMetric):
         "TextClassificationTask",
     ]
 
+    @staticmethod
+    def from_confusion_matrix(confusion_matrix: "ConfusionMatrix") -> float:
+        """Calculate the metric from the confusion matrix of the labels.
+
+        Parameters
+        ----------
+        confusion_matrix : ConfusionMatrix
+            The confusion matrix of the true and predicted labels.
+
+        Returns
+        -------
+        float
+            The metric score.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def accumulator(cls) -> MetricAccumulator:
+        """Create an accumulator that only keeps the confusion matrix of the batches.
+
+        Returns
+        -------
+        MetricAccumulator
+            An empty accumulator of the metric.
+        """
+        return ConfusionMatrixAccumulator(cls)
+
 
 def validate_inputs(true_labels: np.ndarray, pred_labels: np.ndarray) -> None:
     """Validate inputs.
@@ -55,7 +87,197 @@ def prepare_to_metric(
         A tuple with the true and predicted labels in numpy format.
     """
     column_name = y.column_names[0]
-    true_labels = np.array(y[column_name])
+    true_labels = y.with_format("numpy")[column_name]
     validate_inputs(true_labels, probs_pred_labels)
     pred_labels = np.argmax(probs_pred_labels, axis=1)
     return true_labels, pred_labels
+
+
+class ConfusionMatrix:
+    """Confusion matrix of the true and predicted labels of a classification.
+
+    The matrix is computed with a single vectorized pass over the labels, and the
+    classification metrics are derived from its diagonal and its sums. The scores
+    are the same as the sklearn ones: macro averaged over the true and predicted
+    labels in multiclass problems, and of the label 1 in binary problems.
+
+    The matrix can also be accumulated batch by batch with `update`, so the labels
+    of a split never need to be held in memory at the same time.
+    """
+
+    def __init__(
+        self,
+        true_labels: Optional[np.ndarray] = None,
+        pred_labels: Optional[np.ndarray] = None,
+    ) -> None:
+        """Compute the confusion matrix.
+
+        Parameters
+        ----------
+        true_labels : Optional[np.ndarray]
+            True labels. If None, the matrix starts empty, by default None.
+        pred_labels : Optional[np.ndarray]
+            Labels predicted by the model, by default None.
+        """
+        self.labels = np.array([], dtype=np.int64)
+        self.matrix = np.zeros((0, 0), dtype=np.int64)
+        if true_labels is not None:
+            self.update(true_labels, pred_labels)
+
+    def update(self, true_labels: np.ndarray, pred_labels: np.ndarray) -> None:
+        """Add a batch of true and predicted labels to the matrix.
+
+        Parameters
+        ----------
+        true_labels : np.ndarray
+            True labels of the batch.
+        pred_labels : np.ndarray
+            Labels predicted by the model for the batch.
+        """
+        validate_inputs(true_labels, pred_labels)
+        true_labels = np.asarray(true_labels)
+        pred_labels = np.asarray(pred_labels)
+
+        # the labels are encoded by their rank, so the size of the matrix depends
+        # on the number of distinct labels and not on their values.
+        labels, indexes = np.unique(
+            np.concatenate([true_labels, pred_labels]), return_inverse=True
+        )
+        indexes = indexes.reshape(-1)
+        true_indexes = indexes[: len(true_labels)]
+        pred_indexes = indexes[len(true_labels) :]
+        n_labels = len(labels)
+
+        matrix = np.bincount(
+            true_indexes * n_labels + pred_indexes, minlength=n_labels * n_labels
+        ).reshape(n_labels, n_labels)
+
+        if len(self.labels) == 0:
+            self.labels, self.matrix = labels, matrix
+            return
+
+        # merge the batch matrix into the accumulated one.
+        merged_labels = np.union1d(self.labels, labels)
+        merged_matrix = np.zeros(
+            (len(merged_labels), len(merged_labels)), dtype=np.int64
+        )
+        old_positions = np.searchsorted(merged_labels, self.labels)
+        new_positions = np.searchsorted(merged_labels, labels)
+        merged_matrix[np.ix_(old_positions, old_positions)] += self.matrix
+        merged_matrix[np.ix_(new_positions, new_positions)] += matrix
+        self.labels, self.matrix = merged_labels, merged_matrix
+
+    @property
+    def true_counts(self) -> np.ndarray:
+        """Number of examples of each true label."""
+        return self.matrix.sum(axis=1)
+
+    @property
+    def pred_counts(self) -> np.ndarray:
+        """Number of examples predicted as each label."""
+        return self.matrix.sum(axis=0)
+
+    @property
+    def true_positives(self) -> np.ndarray:
+        """Number of correctly predicted examples of each label."""
+        return np.diag(self.matrix)
+
+    @classmethod
+    def from_predictions(
+        cls, y: DashAIDataset, probs_pred_labels: np.ndarray
+    ) -> "ConfusionMatrix":
+        """Compute the confusion matrix of the predictions of a model.
+
+        Parameters
+        ----------
+        y : DashAIDataset
+            A DashAIDataset with the output columns of the data.
+        probs_pred_labels : np.ndarray
+            A two-dimensional matrix in which each column represents a class and
+            the row values represent the probability that an example belongs to
+            the class associated with the column.
+
+        Returns
+        -------
+        ConfusionMatrix
+            The confusion matrix of the true and predicted labels.
+        """
+        return cls(*prepare_to_metric(y, probs_pred_labels))
+
+    def update_from_predictions(
+        self, y: DashAIDataset, probs_pred_labels: np.ndarray
+    ) -> None:
+        """Add a batch of predictions of a model to the matrix.
+
+        Parameters
+        ----------
+        y : DashAIDataset
+            A DashAIDataset with the output columns of the batch.
+        probs_pred_labels : np.ndarray
+            A two-dimensional matrix in which each column represents a class and
+            the row values represent the probability that an example belongs to
+            the class associated with the column.
+        """
+        self.update(*prepare_to_metric(y, probs_pred_labels))
+
+    def _average(self, numerators: np.ndarray, denominators: np.ndarray) -> float:
+        """Average the per label ratios as sklearn does with "macro" or "binary".
+
+        Ratios with a zero denominator are taken as zero.
+        """
+        ratios = np.divide(
+            numerators,
+            denominators,
+            out=np.zeros(len(numerators)),
+            where=denominators > 0,
+        )
+        # multiclass is decided by the true labels, as the metrics used to do.
+        if np.count_nonzero(self.true_counts) > 2:
+            return float(ratios.mean())
+
+        positive = np.flatnonzero(self.labels == 1)
+        if len(self.labels) > 2:
+            raise ValueError(
+                "Target is multiclass but the true labels have only two classes."
+            )
+        if len(positive) == 0:
+            if len(self.labels) == 2:
+                raise ValueError(
+                    f"pos_label=1 is not a valid label. It should be one of "
+                    f"{list(self.labels)}."
+                )
+            return 0.0
+        return float(ratios[positive[0]])
+
+    def accuracy(self) -> float:
+        """Fraction of correctly predicted labels."""
+        total = self.true_counts.sum()
+        return float(self.true_positives.sum() / total) if total > 0 else 0.0
+
+    def precision(self) -> float:
+        """Fraction of the predictions of each label that are correct."""
+        return self._average(self.true_positives, self.pred_counts)
+
+    def recall(self) -> float:
+        """Fraction of the examples of each label that are correctly predicted."""
+        return self._average(self.true_positives, self.true_counts)
+
+    def f1(self) -> float:
+        """Harmonic mean of the precision and recall of each label."""
+        return self._average(
+            2 * self.true_positives, self.true_counts + self.pred_counts
+        )
+
+
+class ConfusionMatrixAccumulator(MetricAccumulator):
+    """Score a classification metric from the confusion matrix of the batches."""
+
+    def __init__(self, metric: Type[ClassificationMetric]) -> None:
+        super().__init__(metric)
+        self.confusion_matrix = ConfusionMatrix()
+
+    def update(self, true_values: DashAIDataset, predictions: np.ndarray) -> None:
+        self.confusion_matrix.update_from_predictions(true_values, predictions)
+
+    def finalize(self) -> float:
+        return self.metric.from_confusion_matrix(self.confusion_matrix)
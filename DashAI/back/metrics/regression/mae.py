@@ -29,3 +29,9 @@ class MAE(RegressionMetric):
         """
         true_values, pred_values = prepare_to_metric(true_values, predicted_values)
         return mean_absolute_error(true_values, pred_values)
+
+    @staticmethod
+    def from_errors(
+        n_values: int, absolute_error_sum: float, squared_error_sum: float
+    ) -> float:
+        return absolute_error_sum / n_values
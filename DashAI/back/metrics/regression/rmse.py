@@ -29,3 +29,9 @@ class RMSE(RegressionMetric):
         """
         true_values, pred_values = prepare_to_metric(true_values, predicted_values)
         return mean_squared_error(true_values, pred_values, squared=False)
+
+    @staticmethod
+    def from_errors(
+        n_values: int, absolute_error_sum: float, squared_error_sum: float
+    ) -> float:
+        return float(np.sqrt(squared_error_sum / n_values))
@@ -1,9 +1,9 @@
-from typing import Tuple
+from typing import Tuple, Type
 
 import numpy as np
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
-from DashAI.back.metrics.base_metric import BaseMetric
+from DashAI.back.metrics.base_metric import BaseMetric, MetricAccumulator
 
 
 class RegressionMetric(BaseMetric):
@@ -11,6 +11,39 @@ class RegressionMetric(BaseMetric):
 
     COMPATIBLE_COMPONENTS = ["RegressionTask"]
 
+    @staticmethod
+    def from_errors(
+        n_values: int, absolute_error_sum: float, squared_error_sum: float
+    ) -> float:
+        """Calculate the metric from the sums of the prediction errors.
+
+        Parameters
+        ----------
+        n_values : int
+            Number of predicted values.
+        absolute_error_sum : float
+            Sum of the absolute errors of the predictions.
+        squared_error_sum : float
+            Sum of the squared errors of the predictions.
+
+        Returns
+        -------
+        float
+            The metric score.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def accumulator(cls) -> MetricAccumulator:
+        """Create an accumulator that only keeps the sums of the errors.
+
+        Returns
+        -------
+        MetricAccumulator
+            An empty accumulator of the metric.
+        """
+        return ErrorAccumulator(cls)
+
 
 def validate_inputs(true_values: np.ndarray, pred_values: np.ndarray) -> None:
     """Validate inputs.
@@ -51,3 +84,31 @@ def prepare_to_metric(
     true_values = np.array(y[column_name])
     validate_inputs(true_values, predicted_values)
     return true_values, predicted_values
+
+
+class ErrorAccumulator(MetricAccumulator):
+    """Score a regression metric from the running sums of the errors."""
+
+    def __init__(self, metric: Type[RegressionMetric]) -> None:
+        super().__init__(metric)
+        self.n_values = 0
+        self.absolute_error_sum = 0.0
+        self.squared_error_sum = 0.0
+
+    def update(self, true_values: DashAIDataset, predictions: np.ndarray) -> None:
+        # regressors fitted on a single output column may predict a (n, 1) array,
+        # which would be broadcast against the (n,) true values.
+        true_values, predictions = prepare_to_metric(true_values, np.ravel(predictions))
+        errors = np.asarray(true_values, dtype=np.float64) - np.asarray(
+            predictions, dtype=np.float64
+        )
+        self.n_values += len(errors)
+        self.absolute_error_sum += float(np.abs(errors).sum())
+        self.squared_error_sum += float(np.square(errors).sum())
+
+    def finalize(self) -> float:
+        if self.n_values == 0:
+            raise ValueError("No values were added to the accumulator.")
+        return self.metric.from_errors(
+            self.n_values, self.absolute_error_sum, self.squared_error_sum
+        )
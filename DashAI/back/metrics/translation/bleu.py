@@ -1,10 +1,14 @@
 """BLEU (bilingual evaluation understudy) metric implementation for DashAI."""
 
-import evaluate
 import numpy as np
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
-from DashAI.back.metrics.translation_metric import TranslationMetric, prepare_to_metric
+from DashAI.back.metrics.translation_metric import (
+    TranslationMetric,
+    corpus_bleu,
+    prepare_to_metric,
+    tokenize,
+)
 
 
 class Bleu(TranslationMetric):
@@ -34,10 +38,10 @@ class Bleu(TranslationMetric):
         float
             The calculated BLEU score ranging between 0 and 1.
         """
-        metric = evaluate.load("bleu")
         source_sentences, target_sentences = prepare_to_metric(
             source_sentences, target_sentences
         )
-        return metric.compute(
-            references=source_sentences, predictions=target_sentences
-        )["bleu"]
+        return corpus_bleu(
+            tokenize(source_sentences, tokenizer="13a"),
+            tokenize(target_sentences, tokenizer="13a"),
+        )
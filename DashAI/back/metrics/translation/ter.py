@@ -1,10 +1,14 @@
 """TER (Translation Edit Rate) metric implementation for DashAI."""
 
-import evaluate
 import numpy as np
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
-from DashAI.back.metrics.translation_metric import TranslationMetric, prepare_to_metric
+from DashAI.back.metrics.translation_metric import (
+    TranslationMetric,
+    corpus_ter,
+    prepare_to_metric,
+    tokenize,
+)
 
 
 class Ter(TranslationMetric):
@@ -32,12 +36,12 @@ class Ter(TranslationMetric):
         Returns
         -------
         float
-            The calculated score.
+            The calculated TER score, as a percentage of the reference tokens.
         """
-        metric = evaluate.load("ter")
         source_sentences, target_sentences = prepare_to_metric(
             source_sentences, target_sentences
         )
-        return metric.compute(
-            references=source_sentences, predictions=target_sentences
-        )["score"]
+        return corpus_ter(
+            tokenize(source_sentences, tokenizer="ter"),
+            tokenize(target_sentences, tokenizer="ter"),
+        )
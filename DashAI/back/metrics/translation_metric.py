@@ -1,4 +1,12 @@
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
 import numpy as np
+from sacrebleu.metrics.lib_ter import translation_edit_rate
+from sacrebleu.tokenizers.tokenizer_13a import Tokenizer13a
+from sacrebleu.tokenizers.tokenizer_ter import TercomTokenizer
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.base_metric import BaseMetric
@@ -43,3 +51,128 @@ def prepare_to_metric(y: DashAIDataset, target_sentences: list):
     source_sentences = np.array(y[column_name])
     validate_inputs(source_sentences, target_sentences)
     return source_sentences, target_sentences
+
+
+@lru_cache(maxsize=None)
+def _get_tokenizer(name: str):
+    """Obtain the tokenizer instance shared by the whole process."""
+    if name == "13a":
+        return Tokenizer13a()
+    if name == "ter":
+        return TercomTokenizer(case_sensitive=False)
+    raise ValueError(f"Unknown tokenizer {name}.")
+
+
+def tokenize(sentences: Sequence[str], tokenizer: str = "13a") -> List[List[str]]:
+    """Split sentences into tokens.
+
+    Parameters
+    ----------
+    sentences : Sequence[str]
+        Sentences to be tokenized.
+    tokenizer : str
+        "13a" (the BLEU mteval-v13a tokenizer) or "ter" (the lowercasing TER
+        tokenizer), by default "13a".
+
+    Returns
+    -------
+    List[List[str]]
+        The tokens of each sentence.
+    """
+    tokenizer_instance = _get_tokenizer(tokenizer)
+    return [tokenizer_instance(str(sentence)).split() for sentence in sentences]
+
+
+def _ngram_counts(tokens: Sequence[str], max_order: int) -> Counter:
+    """Count the ngrams of the tokens up to max_order."""
+    return Counter(
+        tuple(tokens[start : start + order])
+        for order in range(1, max_order + 1)
+        for start in range(len(tokens) - order + 1)
+    )
+
+
+def corpus_bleu(
+    references: Sequence[Sequence[str]],
+    predictions: Sequence[Sequence[str]],
+    max_order: int = 4,
+) -> float:
+    """Compute the corpus BLEU score of pre-tokenized sentences.
+
+    The score is computed without smoothing, as the "bleu" metric of evaluate.
+
+    Parameters
+    ----------
+    references : Sequence[Sequence[str]]
+        Tokens of each reference sentence.
+    predictions : Sequence[Sequence[str]]
+        Tokens of each predicted sentence.
+    max_order : int
+        Maximum ngram order, by default 4.
+
+    Returns
+    -------
+    float
+        The BLEU score ranging between 0 and 1.
+    """
+    validate_inputs(references, predictions)
+    matches = [0] * max_order
+    possible_matches = [0] * max_order
+    references_length = 0
+    predictions_length = 0
+
+    for reference, prediction in zip(references, predictions):  # noqa B905
+        references_length += len(reference)
+        predictions_length += len(prediction)
+
+        overlap = _ngram_counts(reference, max_order) & _ngram_counts(
+            prediction, max_order
+        )
+        for ngram, count in overlap.items():
+            matches[len(ngram) - 1] += count
+        for order in range(1, max_order + 1):
+            possible_matches[order - 1] += max(len(prediction) - order + 1, 0)
+
+    if min(matches) == 0:
+        return 0.0
+
+    log_precisions = sum(
+        math.log(matches[order] / possible_matches[order]) for order in range(max_order)
+    )
+    geo_mean = math.exp(log_precisions / max_order)
+
+    ratio = predictions_length / references_length
+    brevity_penalty = 1.0 if ratio > 1.0 else math.exp(1 - 1.0 / ratio)
+    return geo_mean * brevity_penalty
+
+
+def corpus_ter(
+    references: Sequence[Sequence[str]],
+    predictions: Sequence[Sequence[str]],
+) -> float:
+    """Compute the corpus TER score of pre-tokenized sentences.
+
+    Parameters
+    ----------
+    references : Sequence[Sequence[str]]
+        Tokens of each reference sentence.
+    predictions : Sequence[Sequence[str]]
+        Tokens of each predicted sentence.
+
+    Returns
+    -------
+    float
+        The percentage of edits (insertions, deletions, substitutions and
+        shifts) over the number of reference tokens.
+    """
+    validate_inputs(references, predictions)
+    edits_and_lengths: List[Tuple[int, int]] = [
+        translation_edit_rate(list(prediction), list(reference))
+        for reference, prediction in zip(references, predictions)  # noqa B905
+    ]
+    total_edits = sum(edits for edits, _ in edits_and_lengths)
+    references_length = sum(length for _, length in edits_and_lengths)
+    if references_length == 0:
+        # as the pinned sacrebleu, empty references score 100 even without edits.
+        return 100.0
+    return 100.0 * total_edits / references_length
@@ -1,38 +1,92 @@
 # flake8: noqa
-from DashAI.back.models.base_model import BaseModel
-from DashAI.back.models.hugging_face.distilbert_transformer import DistilBertTransformer
-from DashAI.back.models.hugging_face.opus_mt_en_es_transformer import (
-    OpusMtEnESTransformer,
-)
-from DashAI.back.models.hugging_face.vit_transformer import ViTTransformer
-from DashAI.back.models.scikit_learn.bow_text_classification_model import (
-    BagOfWordsTextClassificationModel,
-)
-from DashAI.back.models.scikit_learn.decision_tree_classifier import (
-    DecisionTreeClassifier,
-)
-from DashAI.back.models.scikit_learn.dummy_classifier import DummyClassifier
-from DashAI.back.models.scikit_learn.gradient_boosting_regression import (
-    GradientBoostingR,
-)
-from DashAI.back.models.scikit_learn.hist_gradient_boosting_classifier import (
-    HistGradientBoostingClassifier,
-)
-from DashAI.back.models.scikit_learn.k_neighbors_classifier import KNeighborsClassifier
-from DashAI.back.models.scikit_learn.linear_regression import LinearRegression
-from DashAI.back.models.scikit_learn.linearSVR import LinearSVR
-from DashAI.back.models.scikit_learn.logistic_regression import LogisticRegression
-from DashAI.back.models.scikit_learn.random_forest_classifier import (
-    RandomForestClassifier,
-)
-from DashAI.back.models.scikit_learn.random_forest_regression import (
-    RandomForestRegression,
-)
-from DashAI.back.models.scikit_learn.mlp_regression import MLPRegression
-from DashAI.back.models.scikit_learn.ridge_regression import RidgeRegression
-from DashAI.back.models.scikit_learn.sklearn_like_classifier import (
-    SklearnLikeClassifier,
-)
-from DashAI.back.models.scikit_learn.sklearn_like_model import SklearnLikeModel
-from DashAI.back.models.scikit_learn.sklearn_like_regressor import SklearnLikeRegressor
-from DashAI.back.models.scikit_learn.svc import SVC
+from typing import TYPE_CHECKING
+
+from DashAI.back.core.lazy_import import lazy_import
+
+# Models are imported on first access, so importing a single model does not
+# import the dependencies (e.g., transformers) of every other model.
+_MODELS = {
+    "BaseModel": "DashAI.back.models.base_model",
+    "DistilBertTransformer": "DashAI.back.models.hugging_face.distilbert_transformer",
+    "OpusMtEnESTransformer": (
+        "DashAI.back.models.hugging_face.opus_mt_en_es_transformer"
+    ),
+    "ViTTransformer": "DashAI.back.models.hugging_face.vit_transformer",
+    "BagOfWordsTextClassificationModel": (
+        "DashAI.back.models.scikit_learn.bow_text_classification_model"
+    ),
+    "DecisionTreeClassifier": (
+        "DashAI.back.models.scikit_learn.decision_tree_classifier"
+    ),
+    "DummyClassifier": "DashAI.back.models.scikit_learn.dummy_classifier",
+    "GradientBoostingR": "DashAI.back.models.scikit_learn.gradient_boosting_regression",
+    "HistGradientBoostingClassifier": (
+        "DashAI.back.models.scikit_learn.hist_gradient_boosting_classifier"
+    ),
+    "KNeighborsClassifier": "DashAI.back.models.scikit_learn.k_neighbors_classifier",
+    "LinearRegression": "DashAI.back.models.scikit_learn.linear_regression",
+    "LinearSVR": "DashAI.back.models.scikit_learn.linearSVR",
+    "LogisticRegression": "DashAI.back.models.scikit_learn.logistic_regression",
+    "RandomForestClassifier": (
+        "DashAI.back.models.scikit_learn.random_forest_classifier"
+    ),
+    "RandomForestRegression": (
+        "DashAI.back.models.scikit_learn.random_forest_regression"
+    ),
+    "MLPRegression": "DashAI.back.models.scikit_learn.mlp_regression",
+    "RidgeRegression": "DashAI.back.models.scikit_learn.ridge_regression",
+    "SklearnLikeClassifier": "DashAI.back.models.scikit_learn.sklearn_like_classifier",
+    "SklearnLikeModel": "DashAI.back.models.scikit_learn.sklearn_like_model",
+    "SklearnLikeRegressor": "DashAI.back.models.scikit_learn.sklearn_like_regressor",
+    "SVC": "DashAI.back.models.scikit_learn.svc",
+}
+
+__all__ = list(_MODELS)
+__getattr__, __dir__ = lazy_import(__name__, _MODELS)
+
+if TYPE_CHECKING:
+    from DashAI.back.models.base_model import BaseModel
+    from DashAI.back.models.hugging_face.distilbert_transformer import (
+        DistilBertTransformer,
+    )
+    from DashAI.back.models.hugging_face.opus_mt_en_es_transformer import (
+        OpusMtEnESTransformer,
+    )
+    from DashAI.back.models.hugging_face.vit_transformer import ViTTransformer
+    from DashAI.back.models.scikit_learn.bow_text_classification_model import (
+        BagOfWordsTextClassificationModel,
+    )
+    from DashAI.back.models.scikit_learn.decision_tree_classifier import (
+        DecisionTreeClassifier,
+    )
+    from DashAI.back.models.scikit_learn.dummy_classifier import DummyClassifier
+    from DashAI.back.models.scikit_learn.gradient_boosting_regression import (
+        GradientBoostingR,
+    )
+    from DashAI.back.models.scikit_learn.hist_gradient_boosting_classifier import (
+        HistGradientBoostingClassifier,
+    )
+    from DashAI.back.models.scikit_learn.k_neighbors_classifier import (
+        KNeighborsClassifier,
+    )
+    from DashAI.back.models.scikit_learn.linear_regression import LinearRegression
+    from DashAI.back.models.scikit_learn.linearSVR import LinearSVR
+    from DashAI.back.models.scikit_learn.logistic_regression import (
+        LogisticRegression,
+    )
+    from DashAI.back.models.scikit_learn.mlp_regression import MLPRegression
+    from DashAI.back.models.scikit_learn.random_forest_classifier import (
+        RandomForestClassifier,
+    )
+    from DashAI.back.models.scikit_learn.random_forest_regression import (
+        RandomForestRegression,
+    )
+    from DashAI.back.models.scikit_learn.ridge_regression import RidgeRegression
+    from DashAI.back.models.scikit_learn.sklearn_like_classifier import (
+        SklearnLikeClassifier,
+    )
+    from DashAI.back.models.scikit_learn.sklearn_like_model import SklearnLikeModel
+    from DashAI.back.models.scikit_learn.sklearn_like_regressor import (
+        SklearnLikeRegressor,
+    )
+    from DashAI.back.models.scikit_learn.svc import SVC
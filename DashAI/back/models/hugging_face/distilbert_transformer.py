@@ -20,6 +20,11 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.models.hugging_face.pretrained_cache import (
+    acquire_pretrained,
+    clone_pretrained,
+)
+from DashAI.back.models.hugging_face.progress_callback import JobProgressCallback
 from DashAI.back.models.text_classification_model import TextClassificationModel
 
 
@@ -80,16 +85,25 @@ class DistilBertTransformer(TextClassificationModel):
         """Initialize the transformer model.
 
         The process includes the instantiation of the pre-trained model and the
-        associated tokenizer.
+        associated tokenizer. Both are shared with the other instances of the
+        process (see `acquire_pretrained`), and the pre-trained model is copied
+        the first time it is fine-tuned.
         """
         kwargs = self.validate_and_transform(kwargs)
         self.model_name = "distilbert-base-uncased"
-        self.tokenizer = DistilBertTokenizer.from_pretrained(self.model_name)
+        self.tokenizer = acquire_pretrained(
+            self, DistilBertTokenizer.from_pretrained, self.model_name
+        )
         self.model = (
             model
             if model is not None
-            else DistilBertForSequenceClassification.from_pretrained(self.model_name)
+            else acquire_pretrained(
+                self,
+                DistilBertForSequenceClassification.from_pretrained,
+                self.model_name,
+            )
         )
+        self.shared_model = model is None
         self.fitted = model is not None
         if model is None:
             self.training_args = kwargs
@@ -154,6 +168,11 @@ class DistilBertTransformer(TextClassificationModel):
         dataset = dataset.map(tokenizer_func, batched=True, batch_size=self.batch_size)
         dataset.set_format("torch", columns=["input_ids", "attention_mask", "labels"])
 
+        if self.shared_model:
+            # the pretrained weights are shared by every instance of the process.
+            self.model = clone_pretrained(self.model)
+            self.shared_model = False
+
         # Arguments for fine-tuning
         training_args = TrainingArguments(
             output_dir="DashAI/back/user_models/temp_checkpoints_distilbert",
@@ -170,6 +189,7 @@ class DistilBertTransformer(TextClassificationModel):
             model=self.model,
             args=training_args,
             train_dataset=dataset,
+            callbacks=[JobProgressCallback()],
         )
 
         trainer.train()
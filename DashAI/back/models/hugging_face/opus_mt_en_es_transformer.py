@@ -19,6 +19,11 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.models.hugging_face.pretrained_cache import (
+    acquire_pretrained,
+    clone_pretrained,
+)
+from DashAI.back.models.hugging_face.progress_callback import JobProgressCallback
 from DashAI.back.models.translation_model import TranslationModel
 
 
@@ -70,11 +75,15 @@ class OpusMtEnESTransformer(TranslationModel):
         """Initialize the transformer.
 
         This process includes the instantiation of the pre-trained model and the
-        associated tokenizer.
+        associated tokenizer. Both are shared with the other instances of the
+        process (see `acquire_pretrained`), and the pre-trained model is copied
+        the first time it is fine-tuned.
         """
         kwargs = self.validate_and_transform(kwargs)
         self.model_name = "Helsinki-NLP/opus-mt-en-es"
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self.tokenizer = acquire_pretrained(
+            self, AutoTokenizer.from_pretrained, self.model_name
+        )
         if model is None:
             self.training_args = kwargs
             self.batch_size = kwargs.pop("batch_size", 16)
@@ -82,8 +91,11 @@ class OpusMtEnESTransformer(TranslationModel):
         self.model = (
             model
             if model is not None
-            else AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+            else acquire_pretrained(
+                self, AutoModelForSeq2SeqLM.from_pretrained, self.model_name
+            )
         )
+        self.shared_model = model is None
         self.fitted = model is not None
 
     def tokenize_data(self, x: Dataset, y: Optional[Dataset] = None) -> Dataset:
@@ -152,6 +164,11 @@ class OpusMtEnESTransformer(TranslationModel):
         dataset = self.tokenize_data(x_train, y_train)
         dataset.set_format("torch", columns=["input_ids", "attention_mask", "labels"])
 
+        if self.shared_model:
+            # the pretrained weights are shared by every instance of the process.
+            self.model = clone_pretrained(self.model)
+            self.shared_model = False
+
         # Arguments for fine-tuning
         training_args = Seq2SeqTrainingArguments(
             output_dir="DashAI/back/user_models/temp_checkpoints_opus-mt-en-es",
@@ -168,6 +185,7 @@ class OpusMtEnESTransformer(TranslationModel):
             model=self.model,
             args=training_args,
             train_dataset=dataset,
+            callbacks=[JobProgressCallback()],
         )
 
         trainer.train()
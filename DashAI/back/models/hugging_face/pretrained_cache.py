@@ -0,0 +1,137 @@
+"""Process-wide cache of the pretrained HuggingFace objects.
+
+The tokenizers, processors and base weights loaded with `from_pretrained` are
+shared by every model instance of the process, so building a model does not
+load them again. The base weights are only read by the instances: a model
+fine-tunes its own copy of them (see `clone_pretrained`).
+"""
+
+import copy
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PretrainedCache:
+    """Reference-counted cache of objects loaded from pretrained checkpoints.
+
+    Each entry is identified by the loader function and the checkpoint name, and
+    counts the objects that use it. When an entry is no longer used it is kept
+    as idle, and the least recently used idle entries are evicted when there
+    are more than max_idle of them, so the next model of the same kind is built
+    without loading the checkpoint again while unused weights are freed.
+    """
+
+    def __init__(self, max_idle: int = 2) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        max_idle : int
+            Maximum number of unused entries kept in memory, by default 2.
+        """
+        self.max_idle = max_idle
+        self._entries: Dict[Tuple[Hashable, str], Any] = {}
+        self._references: Dict[Tuple[Hashable, str], int] = {}
+        self._idle: "OrderedDict[Tuple[Hashable, str], None]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def acquire(self, loader: Callable[[str], Any], name: str) -> Any:
+        """Obtain the object loaded from a checkpoint, loading it if needed.
+
+        Every call must be matched by a call to `release`.
+
+        Parameters
+        ----------
+        loader : Callable[[str], Any]
+            Function that loads the object, e.g. `AutoTokenizer.from_pretrained`.
+        name : str
+            Name (or path) of the pretrained checkpoint.
+
+        Returns
+        -------
+        Any
+            The shared object, which must not be modified.
+        """
+        key = (loader, name)
+        with self._lock:
+            if key not in self._entries:
+                logger.debug("Loading pretrained %s with %s.", name, loader)
+                self._entries[key] = loader(name)
+                self._references[key] = 0
+            self._references[key] += 1
+            self._idle.pop(key, None)
+            return self._entries[key]
+
+    def release(self, loader: Callable[[str], Any], name: str) -> None:
+        """Release an object obtained with `acquire`.
+
+        Parameters
+        ----------
+        loader : Callable[[str], Any]
+            The function that loaded the object.
+        name : str
+            Name (or path) of the pretrained checkpoint.
+        """
+        key = (loader, name)
+        with self._lock:
+            if key not in self._references:
+                return
+            self._references[key] -= 1
+            if self._references[key] > 0:
+                return
+            self._idle[key] = None
+            while len(self._idle) > self.max_idle:
+                evicted_key, _ = self._idle.popitem(last=False)
+                del self._entries[evicted_key]
+                del self._references[evicted_key]
+
+    def references(self, loader: Callable[[str], Any], name: str) -> int:
+        """Return the number of users of a cached object (0 if it is not cached)."""
+        with self._lock:
+            return self._references.get((loader, name), 0)
+
+    def clear(self) -> None:
+        """Evict every entry, used or not."""
+        with self._lock:
+            self._entries.clear()
+            self._references.clear()
+            self._idle.clear()
+
+
+pretrained_cache = PretrainedCache()
+
+
+def acquire_pretrained(owner: object, loader: Callable[[str], Any], name: str) -> Any:
+    """Obtain a shared pretrained object, released when its owner is collected.
+
+    Parameters
+    ----------
+    owner : object
+        The object that uses the pretrained object, e.g. a model instance.
+    loader : Callable[[str], Any]
+        Function that loads the object, e.g. `AutoTokenizer.from_pretrained`.
+    name : str
+        Name (or path) of the pretrained checkpoint.
+
+    Returns
+    -------
+    Any
+        The shared object, which must not be modified.
+    """
+    pretrained = pretrained_cache.acquire(loader, name)
+    weakref.finalize(owner, pretrained_cache.release, loader, name)
+    return pretrained
+
+
+def clone_pretrained(model: Any) -> Any:
+    """Copy shared pretrained weights, so they can be fine-tuned.
+
+    Copying the weights in memory is much faster than loading them again from
+    the checkpoint.
+    """
+    return copy.deepcopy(model)
@@ -0,0 +1,52 @@
+"""Trainer callback that reports the fine-tuning progress of the HF models."""
+
+from typing import Dict, Optional
+
+from transformers import (
+    TrainerCallback,
+    TrainerControl,
+    TrainerState,
+    TrainingArguments,
+)
+
+from DashAI.back.job.progress import report_progress
+
+
+class JobProgressCallback(TrainerCallback):
+    """Report the training steps and logged losses as job progress events.
+
+    A "step" event is reported at the end of every optimization step, and the
+    training logs (loss, learning rate, ...) are reported as "loss" events every
+    `logging_steps` steps.
+    """
+
+    def on_step_end(
+        self,
+        args: TrainingArguments,
+        state: TrainerState,
+        control: TrainerControl,
+        **kwargs,
+    ) -> None:
+        report_progress(
+            "step",
+            step=state.global_step,
+            max_steps=state.max_steps,
+            epoch=state.epoch,
+        )
+
+    def on_log(
+        self,
+        args: TrainingArguments,
+        state: TrainerState,
+        control: TrainerControl,
+        logs: Optional[Dict[str, float]] = None,
+        **kwargs,
+    ) -> None:
+        if logs:
+            report_progress(
+                "loss",
+                step=state.global_step,
+                max_steps=state.max_steps,
+                epoch=state.epoch,
+                **logs,
+            )
@@ -20,6 +20,11 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.models.hugging_face.pretrained_cache import (
+    acquire_pretrained,
+    clone_pretrained,
+)
+from DashAI.back.models.hugging_face.progress_callback import JobProgressCallback
 from DashAI.back.models.image_classification_model import ImageClassificationModel
 
 
@@ -75,16 +80,23 @@ class ViTTransformer(ImageClassificationModel):
         """Initialize the transformer.
 
         This process includes the instantiation of the pre-trained model and the
-        associated feature extractor.
+        associated feature extractor. Both are shared with the other instances of
+        the process (see `acquire_pretrained`), and the pre-trained model is
+        copied the first time it is fine-tuned.
         """
         kwargs = self.validate_and_transform(kwargs)
         self.model_name = "google/vit-base-patch16-224"
-        self.feature_extractor = ViTFeatureExtractor.from_pretrained(self.model_name)
+        self.feature_extractor = acquire_pretrained(
+            self, ViTFeatureExtractor.from_pretrained, self.model_name
+        )
         self.model = (
             model
             if model is not None
-            else ViTForImageClassification.from_pretrained(self.model_name)
+            else acquire_pretrained(
+                self, ViTForImageClassification.from_pretrained, self.model_name
+            )
         )
+        self.shared_model = model is None
         self.fitted = model is not None
         if model is None:
             self.training_args = kwargs
@@ -148,6 +160,11 @@ class ViTTransformer(ImageClassificationModel):
         """
         dataset = self.preprocess_images(x_train, y_train)
 
+        if self.shared_model:
+            # the pretrained weights are shared by every instance of the process.
+            self.model = clone_pretrained(self.model)
+            self.shared_model = False
+
         # Arguments for fine-tuning
         training_args = TrainingArguments(
             output_dir="DashAI/back/user_models/temp_checkpoints_vit",
@@ -164,6 +181,7 @@ class ViTTransformer(ImageClassificationModel):
             model=self.model,
             args=training_args,
             train_dataset=dataset,
+            callbacks=[JobProgressCallback()],
         )
 
         trainer.train()
@@ -1,3 +1,20 @@
-from DashAI.back.optimizers.base_optimizer import BaseOptimizer
-from DashAI.back.optimizers.optuna_optimizer import OptunaOptimizer
-from DashAI.back.optimizers.hyperopt_optimizer import HyperOptOptimizer
+# flake8: noqa
+from typing import TYPE_CHECKING
+
+from DashAI.back.core.lazy_import import lazy_import
+
+# Optimizers are imported on first access, since optuna and hyperopt are slow
+# to import.
+_OPTIMIZERS = {
+    "BaseOptimizer": "DashAI.back.optimizers.base_optimizer",
+    "OptunaOptimizer": "DashAI.back.optimizers.optuna_optimizer",
+    "HyperOptOptimizer": "DashAI.back.optimizers.hyperopt_optimizer",
+}
+
+__all__ = list(_OPTIMIZERS)
+__getattr__, __dir__ = lazy_import(__name__, _OPTIMIZERS)
+
+if TYPE_CHECKING:
+    from DashAI.back.optimizers.base_optimizer import BaseOptimizer
+    from DashAI.back.optimizers.hyperopt_optimizer import HyperOptOptimizer
+    from DashAI.back.optimizers.optuna_optimizer import OptunaOptimizer
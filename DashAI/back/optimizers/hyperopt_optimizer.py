@@ -8,6 +8,7 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.job.progress import report_progress
 from DashAI.back.optimizers.base_optimizer import BaseOptimizer
 
 
@@ -115,8 +116,23 @@ class HyperOptOptimizer(BaseOptimizer):
                 return score
 
         trials = Trials()
+
+        def reported_objective(params):
+            score = objective(params)
+            losses = [loss for loss in trials.losses() if loss is not None]
+            report_progress(
+                "trial",
+                trial=len(trials.trials),
+                n_trials=self.n_trials,
+                state="COMPLETE",
+                params=params,
+                value=score,
+                best_value=min([score, *losses]),
+            )
+            return score
+
         fmin(
-            fn=objective,
+            fn=reported_objective,
             space=search_space,
             algo=self.sampler,
             max_evals=self.n_trials,
@@ -6,6 +6,7 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.job.progress import report_progress
 from DashAI.back.optimizers.base_optimizer import BaseOptimizer
 
 
@@ -119,7 +120,18 @@ class OptunaOptimizer(BaseOptimizer):
 
                 return score
 
-        study.optimize(objective, n_trials=self.n_trials)
+        def report_trial(study, trial):
+            report_progress(
+                "trial",
+                trial=trial.number + 1,
+                n_trials=self.n_trials,
+                state=trial.state.name,
+                params=trial.params,
+                value=trial.value,
+                best_value=study.best_value if study.best_trials else None,
+            )
+
+        study.optimize(objective, n_trials=self.n_trials, callbacks=[report_trial])
 
         best_params = study.best_params
         best_model = self.model
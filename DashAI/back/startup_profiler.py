@@ -0,0 +1,127 @@
+"""Startup profiling module.
+
+Measures the time spent importing the application modules and initializing each
+step of the application, to detect regressions in the server startup cost.
+"""
+
+import json
+import logging
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def _component_name(module_name: str) -> str:
+    """Obtain the component that a module belongs to.
+
+    DashAI modules are grouped by subpackage (e.g., "DashAI.back.models"), while
+    third party modules are grouped by top level package (e.g., "transformers").
+    """
+    parts = module_name.split(".")
+    if parts[0] == "DashAI":
+        return ".".join(parts[:3])
+    return parts[0]
+
+
+def profile_imports(module: str = "DashAI.back.app") -> Dict[str, float]:
+    """Measure the import cost of a module aggregated by component.
+
+    The module is imported in a new interpreter with `-X importtime`, so the
+    measure is not affected by the modules already imported by this process.
+
+    Parameters
+    ----------
+    module : str
+        Name of the module to be imported, by default "DashAI.back.app".
+
+    Returns
+    -------
+    Dict[str, float]
+        Seconds spent executing the modules of each component, sorted from the
+        most to the least expensive.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    components: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_time, _, module_name = line[len("import time:") :].split("|")
+        component = _component_name(module_name.strip())
+        components[component] = components.get(component, 0.0) + (int(self_time) / 1e6)
+
+    return {
+        component: round(seconds, 6)
+        for component, seconds in sorted(
+            components.items(), key=lambda item: item[1], reverse=True
+        )
+    }
+
+
+class StartupProfiler:
+    """Record the time taken by each initialization step of the application."""
+
+    def __init__(self) -> None:
+        self.steps: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Measure the time taken by the body of the context as a step.
+
+        Parameters
+        ----------
+        name : str
+            Name of the step.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + (time.perf_counter() - start)
+            logger.debug("Startup step %s took %.3f s.", name, self.steps[name])
+
+    def report(self, imports: Dict[str, float]) -> Dict[str, Any]:
+        """Build the startup report.
+
+        Parameters
+        ----------
+        imports : Dict[str, float]
+            Import cost by component, as returned by `profile_imports`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The report with the import and initialization times in seconds.
+        """
+        import_seconds = sum(imports.values())
+        steps_seconds = sum(self.steps.values())
+        return {
+            "python": platform.python_version(),
+            "total_seconds": import_seconds + steps_seconds,
+            "imports": {"total_seconds": import_seconds, "components": imports},
+            "steps": {"total_seconds": steps_seconds, "steps": dict(self.steps)},
+        }
+
+    def save_report(self, imports: Dict[str, float], path: pathlib.Path) -> None:
+        """Write the startup report as a JSON file.
+
+        Parameters
+        ----------
+        imports : Dict[str, float]
+            Import cost by component, as returned by `profile_imports`.
+        path : pathlib.Path
+            Path of the JSON file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.report(imports), file, indent=2)
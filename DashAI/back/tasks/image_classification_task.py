@@ -2,6 +2,7 @@ from typing import List
 
 from datasets import ClassLabel, DatasetDict, Image
 
+from DashAI.back.dataloaders.classes.dashai_dataset import encode_class_columns
 from DashAI.back.tasks.base_task import BaseTask
 
 
@@ -25,7 +26,8 @@ class ImageClassificationTask(BaseTask):
     ) -> DatasetDict:
         """Change the column types to suit the tabular classification task.
 
-        A copy of the dataset is created.
+        A copy of the dataset is created, where the output columns are encoded
+        as ClassLabel columns with the same classes in every split.
 
         Parameters
         ----------
@@ -38,7 +40,4 @@ class ImageClassificationTask(BaseTask):
             Dataset with the new types
         """
 
-        types = {column: "Categorical" for column in outputs_columns}
-        for split in datasetdict:
-            datasetdict[split] = datasetdict[split].change_columns_type(types)
-        return datasetdict
+        return encode_class_columns(datasetdict, outputs_columns)
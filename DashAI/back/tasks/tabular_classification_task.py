@@ -2,6 +2,7 @@ from typing import List
 
 from datasets import ClassLabel, DatasetDict, Value
 
+from DashAI.back.dataloaders.classes.dashai_dataset import encode_class_columns
 from DashAI.back.tasks.base_task import BaseTask
 
 
@@ -30,7 +31,8 @@ class TabularClassificationTask(BaseTask):
     ) -> DatasetDict:
         """Change the column types to suit the tabular classification task.
 
-        A copy of the dataset is created.
+        A copy of the dataset is created, where the output columns are encoded
+        as ClassLabel columns with the same classes in every split.
 
         Parameters
         ----------
@@ -42,7 +44,4 @@ class TabularClassificationTask(BaseTask):
         DatasetDict
             Dataset with the new types
         """
-        types = {column: "Categorical" for column in outputs_columns}
-        for split in datasetdict:
-            datasetdict[split] = datasetdict[split].change_columns_type(types)
-        return datasetdict
+        return encode_class_columns(datasetdict, outputs_columns)
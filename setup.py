@@ -13,6 +13,7 @@ requirements = [
     "starlette>=0.27.0,<0.28.0",
     "scikit-learn>=1.2.1",
     "datasets>=2.9.0",
+    "pyarrow>=14.0.1",
     "evaluate>=0.4.0",
     "accelerate>=0.20.3",
     "torch==1.13.0",
@@ -77,6 +77,8 @@ def test_create_csv_dataset(client: TestClient, response_1, response_2) -> None:
     assert response_2.status_code == 200, response_2.text
     data = response_2.json()
     assert data["name"] == "test_csv2"
+    # both datasets have the same file but different splits.
+    assert data["fingerprint"] != response_1.json()["fingerprint"]
 
 
 def test_get_all_datasets(client: TestClient):
@@ -87,6 +89,16 @@ def test_get_all_datasets(client: TestClient):
     assert data[1]["name"] == "test_csv2"
 
 
+def test_get_datasets_page(client: TestClient):
+    response = client.get("/api/v1/dataset/?fields=name&limit=1&after_id=1")
+    assert response.status_code == 200, response.text
+    assert response.json() == [{"id": 2, "name": "test_csv2"}]
+    assert response.headers["X-Next-After-Id"] == "2"
+
+    response = client.get("/api/v1/dataset/?name=test_csv&fields=name")
+    assert response.json() == [{"id": 1, "name": "test_csv"}]
+
+
 def test_get_unexistant_dataset(client: TestClient):
     response = client.get("/api/v1/dataset/31415")
     assert response.status_code == 404, response.text
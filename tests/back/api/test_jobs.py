@@ -6,9 +6,11 @@ import pytest
 from fastapi.testclient import TestClient
 
 from DashAI.back.dataloaders.classes.csv_dataloader import CSVDataLoader
-from DashAI.back.dependencies.database.models import Experiment, Run
+from DashAI.back.dependencies.database.models import Dataset, Experiment, Run
 from DashAI.back.dependencies.registry import ComponentRegistry
-from DashAI.back.job.model_job import ModelJob
+from DashAI.back.job import model_job
+from DashAI.back.job.batch_model_job import BatchModelJob
+from DashAI.back.job.model_job import ModelJob, get_prepared_dataset_path
 from DashAI.back.metrics import BaseMetric
 from DashAI.back.models import BaseModel
 from DashAI.back.optimizers import OptunaOptimizer
@@ -75,6 +77,7 @@ def setup_test_registry(client, monkeypatch: pytest.MonkeyPatch):
             DummyMetric,
             CSVDataLoader,
             ModelJob,
+            BatchModelJob,
             OptunaOptimizer,
         ]
     )
@@ -339,6 +342,98 @@ def test_execute_jobs(client: TestClient, run_id: int, failed_run_id: int):
     assert data["end_time"] is None
 
 
+def test_execute_batch_job(
+    client: TestClient, experiment_id: int, run_id: int, failed_run_id: int
+):
+    response = client.post(
+        "/api/v1/job/",
+        json={
+            "job_type": "BatchModelJob",
+            "kwargs": {
+                "experiment_id": experiment_id,
+                "run_ids": [run_id, failed_run_id],
+                "n_workers": 2,
+            },
+        },
+    )
+    assert response.status_code == 201, response.text
+
+    for id in [run_id, failed_run_id]:
+        response = client.get(f"/api/v1/run/{id}")
+        assert response.json()["status"] == 1
+
+    response = client.post("/api/v1/job/start/?stop_when_queue_empties=True")
+    assert response.status_code == 202, response.text
+
+    response = client.get(f"/api/v1/run/{run_id}")
+    data = response.json()
+    assert data["status"] == 3
+    assert data["train_metrics"]["DummyMetric"] == 1
+    assert data["run_path"] is not None
+
+    response = client.get(f"/api/v1/run/{failed_run_id}")
+    assert response.json()["status"] == 4
+
+
+def test_stream_progress(client: TestClient, run_id: int, failed_run_id: int):
+    response = client.get(f"/api/v1/job/progress?run_id={run_id}&follow=false")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert {event["run_id"] for event in events} == {run_id}
+    phases = [event["phase"] for event in events if event["event"] == "phase"]
+    assert phases[-4:] == ["evaluating", "evaluating", "saving", "finished"]
+    assert any(event["event"] == "evaluation" for event in events)
+    assert any(event["job_type"] == "BatchModelJob" for event in events)
+
+    response = client.get(f"/api/v1/job/progress?run_id={failed_run_id}&follow=false")
+    assert "event: phase" in response.text
+    assert '"phase": "error"' in response.text
+
+
+def test_prepared_dataset_path(monkeypatch: pytest.MonkeyPatch):
+    dataset = Dataset(name="dataset", file_path="datasets/dataset", fingerprint="abc")
+    experiment = Experiment(
+        task_name="DummyTask",
+        input_columns=[0, 1],
+        output_columns=[2],
+        splits=json.dumps({"train": 0.5, "test": 0.2, "validation": 0.3}),
+    )
+    other_experiment = Experiment(
+        task_name="DummyTask",
+        input_columns=[0, 1],
+        output_columns=[2],
+        splits=json.dumps({"validation": 0.3, "test": 0.2, "train": 0.5}),
+    )
+    prepared_path = get_prepared_dataset_path(dataset, experiment, "prepared")
+
+    # experiments with the same configuration share the prepared dataset.
+    assert os.path.dirname(prepared_path) == os.path.join("prepared", "abc")
+    assert get_prepared_dataset_path(dataset, other_experiment, "prepared") == (
+        prepared_path
+    )
+
+    other_experiment.output_columns = [1]
+    assert get_prepared_dataset_path(dataset, other_experiment, "prepared") != (
+        prepared_path
+    )
+
+    # the datasets prepared by other versions of the preparation are not reused.
+    monkeypatch.setattr(model_job, "PREPARED_DATASET_VERSION", -1)
+    assert get_prepared_dataset_path(dataset, experiment, "prepared") != (prepared_path)
+
+    # datasets without fingerprint keep their prepared datasets in their folder.
+    dataset.fingerprint = None
+    assert get_prepared_dataset_path(dataset, experiment, "prepared").startswith(
+        os.path.join("datasets/dataset", "prepared")
+    )
+
+
 def test_job_with_wrong_run(client: TestClient):
     response = client.post(
         "/api/v1/job/", json={"job_type": "ModelJob", "kwargs": {"run_id": 31415}}
@@ -160,6 +160,52 @@ def test_get_all_runs(client: TestClient, experiment_id: int):
     assert data[1]["experiment_id"] == experiment_id
 
 
+def test_get_runs_page(client: TestClient, experiment_id: int):
+    response = client.get(f"/api/v1/run/?experiment_id={experiment_id}&limit=1")
+    assert response.status_code == 200
+    assert [run["name"] for run in response.json()] == ["Run1"]
+    after_id = response.headers["X-Next-After-Id"]
+
+    response = client.get(
+        f"/api/v1/run/?experiment_id={experiment_id}&limit=1&after_id={after_id}"
+    )
+    assert [run["name"] for run in response.json()] == ["Run2"]
+    after_id = response.headers["X-Next-After-Id"]
+
+    response = client.get(
+        f"/api/v1/run/?experiment_id={experiment_id}&limit=1&after_id={after_id}"
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-After-Id" not in response.headers
+
+
+def test_get_runs_fields_and_filters(client: TestClient, experiment_id: int):
+    response = client.get("/api/v1/run/?fields=name,status&status=0")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 1, "name": "Run1", "status": 0},
+        {"id": 2, "name": "Run2", "status": 0},
+    ]
+
+    response = client.get("/api/v1/run/?status=3")
+    assert response.json() == []
+    # filters that match no run of an existing experiment give an empty list.
+    response = client.get(
+        f"/api/v1/run/?experiment_id={experiment_id}&model_name=SVC&fields=id"
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+    response = client.get("/api/v1/run/?model_name=KNeighborsClassifier&fields=id")
+    assert response.json() == [{"id": 1}, {"id": 2}]
+
+    response = client.get("/api/v1/run/?fields=name,unknown")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown fields: unknown"}
+    response = client.get("/api/v1/run/?status=42")
+    assert response.status_code == 422
+
+
 def test_get_wrong_run(client: TestClient):
     # Try to retrieve a non-existent run an get an error
     response = client.get("/api/v1/run/31415")
@@ -0,0 +1,194 @@
+"""Benchmark harness of the DashAI hot paths.
+
+The benchmarks are skipped unless the DASHAI_BENCHMARK_REPORT environment
+variable sets the path of the JSON report, e.g.:
+
+    DASHAI_BENCHMARK_REPORT=benchmarks/0.0.14.json pytest tests/back/benchmarks
+
+The size of the synthetic dataset and the number of rounds of each benchmark are
+set with DASHAI_BENCHMARK_ROWS (by default 10000) and DASHAI_BENCHMARK_ROUNDS
+(by default 3). Two reports (e.g. of two releases) are compared with:
+
+    python -m tests.back.benchmarks.benchmark baseline.json current.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import pathlib
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+REPORT_ENV = "DASHAI_BENCHMARK_REPORT"
+ROWS_ENV = "DASHAI_BENCHMARK_ROWS"
+ROUNDS_ENV = "DASHAI_BENCHMARK_ROUNDS"
+
+
+def _dashai_version() -> str:
+    """Obtain the installed DashAI version."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return "unknown"
+    try:
+        return version("DashAI")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class BenchmarkRecorder:
+    """Measure the time taken by the benchmarked functions over several rounds."""
+
+    def __init__(self, rounds: int = 3) -> None:
+        """Initialize the recorder.
+
+        Parameters
+        ----------
+        rounds : int
+            Default number of times each function is executed, by default 3.
+        """
+        self.rounds = rounds
+        self.timings: Dict[str, List[float]] = {}
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        rounds: Optional[int] = None,
+        setup: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute a function several times, recording the seconds of each round.
+
+        Parameters
+        ----------
+        name : str
+            Name of the benchmark.
+        func : Callable[..., Any]
+            The benchmarked function, called with args and kwargs.
+        rounds : Optional[int]
+            Number of rounds, by default the recorder rounds.
+        setup : Optional[Callable[[], None]]
+            Function called before each round, which is not measured.
+
+        Returns
+        -------
+        Any
+            The value returned by the last round.
+        """
+        timings = self.timings.setdefault(name, [])
+        result = None
+        for _ in range(rounds or self.rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        return result
+
+    def report(self, **parameters: Any) -> Dict[str, Any]:
+        """Build the benchmarks report.
+
+        Parameters
+        ----------
+        parameters : Any
+            Parameters of the benchmarks, e.g. the number of dataset rows.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The report with the timing statistics (in seconds) of each benchmark.
+        """
+        return {
+            "dashai": _dashai_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "parameters": parameters,
+            "benchmarks": {
+                name: {
+                    "rounds": len(timings),
+                    "min": min(timings),
+                    "max": max(timings),
+                    "mean": statistics.mean(timings),
+                    "median": statistics.median(timings),
+                    "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                }
+                for name, timings in sorted(self.timings.items())
+            },
+        }
+
+    def save_report(self, path: pathlib.Path, **parameters: Any) -> None:
+        """Write the benchmarks report as a JSON file.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Path of the JSON file.
+        parameters : Any
+            Parameters of the benchmarks, e.g. the number of dataset rows.
+        """
+        os.makedirs(pathlib.Path(path).parent, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.report(**parameters), file, indent=2)
+
+
+def compare_reports(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> Dict[str, float]:
+    """Compare the median times of the benchmarks present in both reports.
+
+    Parameters
+    ----------
+    baseline : Dict[str, Any]
+        The reference report.
+    current : Dict[str, Any]
+        The report to compare with the reference.
+
+    Returns
+    -------
+    Dict[str, float]
+        The ratio between the current and the baseline median time of each
+        benchmark (greater than one means slower).
+    """
+    return {
+        name: result["median"] / max(baseline["benchmarks"][name]["median"], 1e-9)
+        for name, result in current["benchmarks"].items()
+        if name in baseline["benchmarks"]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the comparison of two reports and fail if some benchmark regressed."""
+    parser = argparse.ArgumentParser(description=compare_reports.__doc__)
+    parser.add_argument("baseline", type=pathlib.Path)
+    parser.add_argument("current", type=pathlib.Path)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown before a benchmark is a regression (default 0.2).",
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    regressions = []
+    for name, ratio in compare_reports(baseline, current).items():
+        regressed = ratio > 1 + args.tolerance
+        print(f"{name:<50} {ratio:8.2f}x{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(name)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import os
+import pathlib
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.back.benchmarks.benchmark import (
+    REPORT_ENV,
+    ROUNDS_ENV,
+    ROWS_ENV,
+    BenchmarkRecorder,
+)
+from tests.back.test_datasets_generator import CSVTestDatasetGenerator
+
+N_FEATURES = 8
+CLASSES = ["class_0", "class_1", "class_2"]
+
+
+@pytest.fixture(scope="session", name="benchmark_rows")
+def fixture_benchmark_rows() -> int:
+    return int(os.environ.get(ROWS_ENV, 10_000))
+
+
+@pytest.fixture(scope="session", name="benchmark_recorder")
+def fixture_benchmark_recorder(benchmark_rows: int):
+    recorder = BenchmarkRecorder(rounds=int(os.environ.get(ROUNDS_ENV, 3)))
+
+    yield recorder
+
+    if os.environ.get(REPORT_ENV) and recorder.timings:
+        recorder.save_report(
+            pathlib.Path(os.environ[REPORT_ENV]),
+            rows=benchmark_rows,
+            features=N_FEATURES,
+            classes=len(CLASSES),
+        )
+
+
+@pytest.fixture(name="benchmark")
+def fixture_benchmark(request, benchmark_recorder: BenchmarkRecorder) -> Callable:
+    """Measure a function as a benchmark named after the test."""
+
+    def benchmark(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return benchmark_recorder.measure(request.node.name, func, *args, **kwargs)
+
+    return benchmark
+
+
+@pytest.fixture(scope="session", name="synthetic_dataset_path")
+def fixture_synthetic_dataset_path(
+    test_datasets_path: pathlib.Path, random_state: int, benchmark_rows: int
+) -> pathlib.Path:
+    """Generate a tabular classification dataset of benchmark_rows rows."""
+    rng = np.random.default_rng(random_state)
+    features = rng.normal(size=(benchmark_rows, N_FEATURES))
+    scores = features @ rng.normal(size=(N_FEATURES, len(CLASSES)))
+    df = pd.DataFrame(
+        features, columns=[f"feature_{i}" for i in range(N_FEATURES)]
+    ).assign(target=np.array(CLASSES)[scores.argmax(axis=1)])
+
+    CSVTestDatasetGenerator(
+        df=df,
+        dataset_name=f"benchmark_{benchmark_rows}",
+        ouptut_path=test_datasets_path,
+        random_state=random_state,
+    )
+    return test_datasets_path / "csv" / f"benchmark_{benchmark_rows}"
@@ -0,0 +1,323 @@
+"""Benchmarks of the dataset, training, evaluation, explainability and prediction
+hot paths. See tests/back/benchmarks/benchmark.py to run them."""
+
+import json
+import os
+import pathlib
+import shutil
+from typing import Callable
+
+import pytest
+from datasets import DatasetDict
+from fastapi.testclient import TestClient
+
+from DashAI.back.dataloaders.classes.dashai_dataset import (
+    load_dataset,
+    select_columns,
+    update_dataset_splits,
+)
+from DashAI.back.dependencies.database.models import Experiment, Run
+from DashAI.back.explainability import (
+    KernelShap,
+    PartialDependence,
+    PermutationFeatureImportance,
+)
+from DashAI.back.job.model_job import ModelJob, score_metrics
+from DashAI.back.metrics import F1, Accuracy, Precision, Recall
+from DashAI.back.models.scikit_learn.decision_tree_classifier import (
+    DecisionTreeClassifier,
+)
+from DashAI.back.models.scikit_learn.logistic_regression import LogisticRegression
+from DashAI.back.models.scikit_learn.random_forest_classifier import (
+    RandomForestClassifier,
+)
+from DashAI.back.tasks.tabular_classification_task import TabularClassificationTask
+from tests.back.benchmarks.benchmark import REPORT_ENV
+from tests.back.benchmarks.conftest import N_FEATURES
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get(REPORT_ENV),
+    reason=f"Set {REPORT_ENV} to the path of the report to run the benchmarks.",
+)
+
+INPUT_COLUMNS = [f"feature_{i}" for i in range(N_FEATURES)]
+OUTPUT_COLUMNS = ["target"]
+SPLITS = {"train": 0.6, "test": 0.2, "validation": 0.2}
+MODELS = [DecisionTreeClassifier, LogisticRegression, RandomForestClassifier]
+# number of instances explained by the local explainers.
+N_EXPLAINED_INSTANCES = 10
+
+
+def _upload_dataset(client: TestClient, csv_path: pathlib.Path, name: str) -> dict:
+    with open(csv_path, "rb") as file:
+        response = client.post(
+            "/api/v1/dataset/",
+            data={
+                "params": json.dumps(
+                    {
+                        "dataloader": "CSVDataLoader",
+                        "name": name,
+                        "splits_in_folders": False,
+                        "splits": {
+                            "train_size": SPLITS["train"],
+                            "test_size": SPLITS["test"],
+                            "val_size": SPLITS["validation"],
+                        },
+                        "separator": ",",
+                        "more_options": {
+                            "seed": 42,
+                            "shuffle": True,
+                            "stratify": False,
+                        },
+                    }
+                ),
+                "url": "",
+            },
+            files={"file": ("data.csv", file, "text/csv")},
+        )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+@pytest.fixture(scope="module", name="dataset")
+def fixture_dataset(client: TestClient, synthetic_dataset_path: pathlib.Path):
+    dataset = _upload_dataset(
+        client, synthetic_dataset_path / "comma.csv", "benchmark_dataset"
+    )
+
+    yield dataset
+
+    response = client.delete(f"/api/v1/dataset/{dataset['id']}")
+    assert response.status_code == 204, response.text
+
+
+@pytest.fixture(scope="module", name="prepared_dataset")
+def fixture_prepared_dataset(dataset: dict):
+    loaded_dataset = load_dataset(f"{dataset['file_path']}/dataset")
+    prepared_dataset = TabularClassificationTask().prepare_for_task(
+        loaded_dataset, OUTPUT_COLUMNS
+    )
+    return select_columns(prepared_dataset, INPUT_COLUMNS, OUTPUT_COLUMNS)
+
+
+@pytest.fixture(scope="module", name="trained_model")
+def fixture_trained_model(prepared_dataset):
+    x, y = prepared_dataset
+    return DecisionTreeClassifier(max_depth=8).fit(x["train"], y["train"])
+
+
+@pytest.fixture(scope="module", name="run_id")
+def fixture_run_id(client: TestClient, dataset: dict):
+    session_factory = client.app.container["session_factory"]
+
+    with session_factory() as db:
+        experiment = Experiment(
+            dataset_id=dataset["id"],
+            name="BenchmarkExperiment",
+            task_name="TabularClassificationTask",
+            input_columns=INPUT_COLUMNS,
+            output_columns=OUTPUT_COLUMNS,
+            splits=json.dumps({**SPLITS, "has_changed": False}),
+        )
+        db.add(experiment)
+        db.commit()
+        run = Run(
+            experiment_id=experiment.id,
+            model_name="DecisionTreeClassifier",
+            parameters={"criterion": "gini"},
+            optimizer_name="OptunaOptimizer",
+            optimizer_parameters={
+                "n_trials": 1,
+                "sampler": "TPESampler",
+                "pruner": "None",
+            },
+            goal_metric="Accuracy",
+            name="BenchmarkRun",
+        )
+        db.add(run)
+        db.commit()
+
+        yield run.id
+
+        db.delete(run)
+        db.delete(experiment)
+        db.commit()
+
+
+def test_upload_dataset(
+    client: TestClient, benchmark: Callable, synthetic_dataset_path: pathlib.Path
+):
+    datasets = []
+    benchmark(
+        lambda: datasets.append(
+            _upload_dataset(
+                client,
+                synthetic_dataset_path / "comma.csv",
+                f"benchmark_upload_{len(datasets)}",
+            )
+        )
+    )
+
+    for dataset in datasets:
+        response = client.delete(f"/api/v1/dataset/{dataset['id']}")
+        assert response.status_code == 204, response.text
+
+
+def test_load_dataset(benchmark: Callable, dataset: dict, benchmark_rows: int):
+    loaded_dataset = benchmark(load_dataset, f"{dataset['file_path']}/dataset")
+
+    assert sum(loaded_dataset.num_rows.values()) == benchmark_rows
+
+
+def test_split_dataset(benchmark: Callable, dataset: dict):
+    loaded_dataset = load_dataset(f"{dataset['file_path']}/dataset")
+
+    split_dataset = benchmark(
+        update_dataset_splits, loaded_dataset, SPLITS, is_random=True
+    )
+
+    assert set(split_dataset) == set(SPLITS)
+
+
+def test_to_pandas(benchmark: Callable, dataset: dict):
+    loaded_dataset = load_dataset(f"{dataset['file_path']}/dataset")
+
+    df = benchmark(loaded_dataset["train"].to_pandas)
+
+    assert len(df) == loaded_dataset["train"].num_rows
+
+
+@pytest.mark.parametrize("model_class", MODELS, ids=lambda model: model.__name__)
+def test_model_fit(benchmark: Callable, prepared_dataset, model_class):
+    x, y = prepared_dataset
+
+    benchmark(lambda: model_class().fit(x["train"], y["train"]))
+
+
+@pytest.mark.parametrize("model_class", MODELS, ids=lambda model: model.__name__)
+def test_model_predict(benchmark: Callable, prepared_dataset, model_class):
+    x, y = prepared_dataset
+    model = model_class().fit(x["train"], y["train"])
+
+    predictions = benchmark(model.predict, x["test"])
+
+    assert len(predictions) == x["test"].num_rows
+
+
+def test_score_metrics(
+    client: TestClient, benchmark: Callable, prepared_dataset, trained_model
+):
+    x, y = prepared_dataset
+
+    scores = benchmark(
+        score_metrics,
+        [Accuracy, F1, Precision, Recall],
+        trained_model,
+        x["test"],
+        y["test"],
+        client.app.container["config"]["EVALUATION_BATCH_SIZE"],
+    )
+
+    assert set(scores) == {"Accuracy", "F1", "Precision", "Recall"}
+
+
+def test_partial_dependence(benchmark: Callable, prepared_dataset, trained_model):
+    explainer = PartialDependence(
+        trained_model,
+        grid_resolution=20,
+        lower_percentile=0.05,
+        upper_percentile=0.95,
+    )
+
+    explanation = benchmark(explainer.explain, prepared_dataset)
+
+    assert len(explanation) == N_FEATURES + 1
+
+
+def test_permutation_feature_importance(
+    benchmark: Callable, prepared_dataset, trained_model
+):
+    explainer = PermutationFeatureImportance(
+        trained_model,
+        scoring="accuracy",
+        n_repeats=5,
+        random_state=42,
+        max_samples=1,
+    )
+
+    explanation = benchmark(explainer.explain, prepared_dataset)
+
+    assert len(explanation["features"]) == N_FEATURES
+
+
+def test_kernel_shap(benchmark: Callable, prepared_dataset, trained_model):
+    x, _ = prepared_dataset
+    instances = DatasetDict({"test": x["test"].select(range(N_EXPLAINED_INSTANCES))})
+
+    def explain():
+        explainer = KernelShap(trained_model, link="identity")
+        explainer.fit(
+            background_dataset=prepared_dataset,
+            sample_background_data=True,
+            n_background_samples=50,
+            sampling_method="kmeans",
+        )
+        return explainer.explain_instance(instances)
+
+    explanation = benchmark(explain)
+
+    assert len(explanation) == N_EXPLAINED_INSTANCES + 2
+
+
+def test_model_job(client: TestClient, benchmark: Callable, run_id: int):
+    session_factory = client.app.container["session_factory"]
+
+    def run_job():
+        with session_factory() as db:
+            ModelJob(run_id=run_id, db=db).run()
+
+    benchmark(run_job)
+
+    with session_factory() as db:
+        assert db.get(Run, run_id).test_metrics is not None
+
+
+def test_predict_endpoint(
+    client: TestClient,
+    benchmark: Callable,
+    prepared_dataset,
+    trained_model,
+    run_id: int,
+):
+    x, _ = prepared_dataset
+    config = client.app.container["config"]
+    session_factory = client.app.container["session_factory"]
+    with session_factory() as db:
+        run = db.get(Run, run_id)
+        run.run_path = str(pathlib.Path(config["RUNS_PATH"]) / f"{run_id}_predict")
+        trained_model.save(run.run_path)
+        db.commit()
+    input_path = pathlib.Path(config["DATASETS_PATH"]) / "benchmark_input.json"
+    with open(input_path, "w") as file:
+        json.dump({"data": x["test"].to_pandas().to_dict(orient="records")}, file)
+
+    def predict():
+        with open(input_path, "rb") as file:
+            response = client.post(
+                "/api/v1/predict/",
+                params={"run_id": run_id},
+                files={"input_file": ("input.json", file, "text/json")},
+            )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    predictions = benchmark(
+        predict,
+        # the endpoint keeps the uploaded input of each run.
+        setup=lambda: shutil.rmtree(
+            pathlib.Path(config["DATASETS_PATH"]) / "tmp_predict" / str(run_id),
+            ignore_errors=True,
+        ),
+    )
+
+    assert len(predictions) == x["test"].num_rows
@@ -0,0 +1,132 @@
+"""Audio features pipeline tests module."""
+
+import pathlib
+import wave
+
+import numpy as np
+import pytest
+from datasets import Audio, Dataset
+
+from DashAI.back.dataloaders.classes import audio_features
+from DashAI.back.dataloaders.classes.audio_features import (
+    AudioFeatureConfig,
+    compute_audio_features,
+    decode_audio,
+    extract_audio_features,
+)
+
+FEATURE_CONFIG = AudioFeatureConfig(max_duration=0.5, n_mels=20)
+
+
+def _write_wav(path: pathlib.Path, frequency: float, sampling_rate: int) -> None:
+    time = np.arange(int(0.3 * sampling_rate)) / sampling_rate
+    samples = (0.5 * np.sin(2 * np.pi * frequency * time) * 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sampling_rate)
+        wav_file.writeframes(samples.tobytes())
+
+
+@pytest.fixture(name="audio_dataset")
+def fixture_audio_dataset(tmp_path: pathlib.Path) -> Dataset:
+    _write_wav(tmp_path / "a.wav", 440, 16000)
+    _write_wav(tmp_path / "b.wav", 880, 8000)
+    # the same clip under another name.
+    _write_wav(tmp_path / "c.wav", 440, 16000)
+    return Dataset.from_dict(
+        {
+            "audio": [str(tmp_path / name) for name in ["a.wav", "b.wav", "c.wav"]],
+            "label": [0, 1, 0],
+        }
+    ).cast_column("audio", Audio(decode=False))
+
+
+@pytest.fixture(name="features_config")
+def fixture_features_config(tmp_path: pathlib.Path):
+    return {"AUDIO_FEATURES_PATH": tmp_path / "audio_features"}
+
+
+@pytest.fixture(name="decode_counter")
+def fixture_decode_counter(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+
+    def counting_decode_audio(audio):
+        calls.append(audio["path"])
+        return decode_audio(audio)
+
+    monkeypatch.setattr(audio_features, "decode_audio", counting_decode_audio)
+    return calls
+
+
+def test_compute_audio_features_shape() -> None:
+    waveform = np.zeros(2000, dtype=np.float32)
+
+    log_mel = compute_audio_features(waveform, 16000, FEATURE_CONFIG)
+    mfcc = compute_audio_features(
+        waveform, 8000, FEATURE_CONFIG.model_copy(update={"feature": "mfcc"})
+    )
+
+    assert log_mel.shape == FEATURE_CONFIG.shape() == (20, 51)
+    assert mfcc.shape == (13, 51)
+    assert log_mel.dtype == np.float32
+
+
+def test_decode_audio(tmp_path: pathlib.Path) -> None:
+    _write_wav(tmp_path / "a.wav", 440, 8000)
+
+    from_path = decode_audio({"bytes": None, "path": str(tmp_path / "a.wav")})
+    from_bytes = decode_audio(
+        {"bytes": (tmp_path / "a.wav").read_bytes(), "path": "a.wav"}
+    )
+
+    assert from_path[1] == from_bytes[1] == 8000
+    np.testing.assert_array_equal(from_path[0], from_bytes[0])
+    assert np.abs(from_path[0]).max() == pytest.approx(0.5, abs=1e-3)
+
+
+def test_decode_invalid_audio() -> None:
+    with pytest.raises(ValueError, match="Unable to decode audio"):
+        decode_audio({"bytes": b"not an audio file", "path": "bad.wav"})
+
+
+def test_extract_audio_features(
+    audio_dataset: Dataset, features_config, decode_counter
+) -> None:
+    dataset = extract_audio_features(
+        audio_dataset, FEATURE_CONFIG, config=features_config
+    )
+
+    assert dataset.column_names == ["audio", "label", "audio_features"]
+    features = np.array(dataset.with_format("numpy")["audio_features"])
+    assert features.shape == (3, *FEATURE_CONFIG.shape())
+    np.testing.assert_array_equal(features[0], features[2])
+    assert not np.array_equal(features[0], features[1])
+    # identical clips are decoded once.
+    assert len(decode_counter) == 2
+
+
+def test_extract_audio_features_uses_cache(
+    audio_dataset: Dataset, features_config, decode_counter
+) -> None:
+    first = extract_audio_features(
+        audio_dataset, FEATURE_CONFIG, config=features_config
+    )
+    second = extract_audio_features(
+        audio_dataset.select([2, 1]), FEATURE_CONFIG, config=features_config
+    )
+
+    assert len(decode_counter) == 2
+    np.testing.assert_array_equal(
+        np.array(second.with_format("numpy")["audio_features"]),
+        np.array(first.with_format("numpy")["audio_features"])[[2, 1]],
+    )
+
+    # another configuration computes its own features.
+    extract_audio_features(
+        audio_dataset,
+        FEATURE_CONFIG.model_copy(update={"feature": "mfcc"}),
+        config=features_config,
+    )
+    assert len(decode_counter) == 4
+    assert len(list(features_config["AUDIO_FEATURES_PATH"].iterdir())) == 2
@@ -0,0 +1,210 @@
+"""Parquet and Arrow IPC DataLoaders tests module."""
+
+import pathlib
+import shutil
+from typing import Type
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+from datasets import DatasetDict
+from datasets.builder import DatasetGenerationError
+from starlette.datastructures import Headers, UploadFile
+
+from DashAI.back.dataloaders import ArrowDataLoader, ParquetDataLoader
+from DashAI.back.dataloaders.classes.columnar_dataloader import (
+    ColumnarDataLoader,
+    parse_filter,
+)
+
+DF = pd.DataFrame(
+    {
+        "age": list(range(20, 80)),
+        "sex": ["F", "M", "X"] * 20,
+        "score": [i / 10 for i in range(60)],
+    }
+)
+
+
+def _write(dataloader_cls: Type[ColumnarDataLoader], df: pd.DataFrame, path) -> None:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if dataloader_cls is ParquetDataLoader:
+        pq.write_table(table, path, row_group_size=10)
+    else:
+        feather.write_feather(table, path, compression="uncompressed")
+
+
+def _upload(path: pathlib.Path, content_type: str) -> UploadFile:
+    return UploadFile(
+        filename=path.name,
+        file=open(path, "rb"),  # noqa: SIM115
+        headers=Headers({"Content-Type": content_type}),
+    )
+
+
+@pytest.fixture(name="upload_path")
+def fixture_upload_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Folder of the dataset where the upload is stored, as the API does."""
+    upload_path = tmp_path / "upload"
+    upload_path.mkdir()
+    return upload_path
+
+
+@pytest.fixture(params=[ParquetDataLoader, ArrowDataLoader], name="dataloader_cls")
+def fixture_dataloader_cls(request) -> Type[ColumnarDataLoader]:
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ("params", "nrows", "columns"),
+    [
+        ({}, 60, ["age", "sex", "score"]),
+        ({"columns": "sex, age"}, 60, ["sex", "age"]),
+        ({"filter": "age >= 70"}, 10, ["age", "sex", "score"]),
+        ({"columns": "score", "filter": "sex == 'F' and age < 50"}, 10, ["score"]),
+        ({"filter": 'sex in ["F", "M"] and score != 0.0'}, 39, ["age", "sex", "score"]),
+        ({"filter": "sex not in ['F', 'M']"}, 20, ["age", "sex", "score"]),
+    ],
+    ids=["all", "columns", "filter", "columns_and_filter", "in", "not_in"],
+)
+def test_load_data_from_file(
+    tmp_path: pathlib.Path,
+    upload_path: pathlib.Path,
+    dataloader_cls: Type[ColumnarDataLoader],
+    params,
+    nrows: int,
+    columns,
+) -> None:
+    path = tmp_path / "data.bin"
+    _write(dataloader_cls, DF, path)
+
+    dataset = dataloader_cls().load_data(
+        filepath_or_buffer=_upload(path, "application/octet-stream"),
+        temp_path=str(upload_path),
+        params={"columns": None, "filter": None, **params},
+    )
+
+    assert isinstance(dataset, DatasetDict)
+    assert dataset["train"].num_rows == nrows
+    assert dataset["train"].column_names == columns
+
+
+def test_load_data_from_zip(
+    tmp_path: pathlib.Path,
+    upload_path: pathlib.Path,
+    dataloader_cls: Type[ColumnarDataLoader],
+) -> None:
+    splits_path = tmp_path / "splits"
+    for split, start, end in [("train", 0, 30), ("test", 30, 45), ("val", 45, 60)]:
+        (splits_path / split).mkdir(parents=True)
+        # each split is stored in two files.
+        middle = (start + end) // 2
+        _write(dataloader_cls, DF.iloc[start:middle], splits_path / split / "0.bin")
+        _write(dataloader_cls, DF.iloc[middle:end], splits_path / split / "1.bin")
+    shutil.make_archive(str(splits_path), "zip", splits_path)
+
+    dataset = dataloader_cls().load_data(
+        filepath_or_buffer=_upload(tmp_path / "splits.zip", "application/zip"),
+        temp_path=str(upload_path),
+        params={"columns": "age", "filter": "age < 70"},
+    )
+
+    assert dataset.num_rows == {"train": 30, "test": 15, "validation": 5}
+    assert dataset["train"]["age"] == list(range(20, 50))
+    assert dataset["validation"]["age"] == list(range(65, 70))
+
+
+def test_uploaded_files_are_removed(
+    tmp_path: pathlib.Path,
+    upload_path: pathlib.Path,
+    dataloader_cls: Type[ColumnarDataLoader],
+) -> None:
+    path = tmp_path / "data.bin"
+    _write(dataloader_cls, DF, path)
+    dataset = dataloader_cls().load_data(
+        filepath_or_buffer=_upload(path, "application/octet-stream"),
+        temp_path=str(upload_path),
+        params={"columns": None, "filter": None},
+    )
+
+    # the dataset maps its own copy of the data, not the upload.
+    assert list(upload_path.iterdir()) == []
+    assert dataset["train"].cache_files
+    assert dataset["train"].to_pandas().equals(DF)
+
+
+def test_invalid_upload_is_removed(
+    tmp_path: pathlib.Path,
+    upload_path: pathlib.Path,
+    dataloader_cls: Type[ColumnarDataLoader],
+) -> None:
+    path = tmp_path / "data.bin"
+    _write(dataloader_cls, DF, path)
+
+    with pytest.raises(DatasetGenerationError):
+        dataloader_cls().load_data(
+            filepath_or_buffer=_upload(path, "application/octet-stream"),
+            temp_path=str(upload_path),
+            params={"columns": "unknown", "filter": None},
+        )
+    assert list(upload_path.iterdir()) == []
+
+
+def test_load_arrow_data_is_memory_mapped(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.arrow"
+    _write(ArrowDataLoader, pd.concat([DF] * 1000), path)
+
+    allocated_bytes = pa.total_allocated_bytes()
+    dataset = ArrowDataLoader().load_data(
+        filepath_or_buffer=str(path),
+        temp_path=str(tmp_path),
+        params={"columns": "age,score", "filter": None},
+    )
+
+    assert dataset["train"].num_rows == 60_000
+    assert dataset["train"].data.nbytes > 0
+    assert pa.total_allocated_bytes() - allocated_bytes < dataset["train"].data.nbytes
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"columns": "unknown", "filter": None},
+        {"columns": None, "filter": "unknown > 1"},
+        {"columns": None, "filter": "age >> 1"},
+        {"columns": None, "filter": "age > not_a_literal"},
+    ],
+    ids=["unknown_column", "unknown_filter_column", "bad_operator", "bad_value"],
+)
+def test_load_data_with_invalid_params(
+    tmp_path: pathlib.Path, dataloader_cls: Type[ColumnarDataLoader], params
+) -> None:
+    path = tmp_path / "data.bin"
+    _write(dataloader_cls, DF, path)
+
+    with pytest.raises(DatasetGenerationError):
+        dataloader_cls().load_data(
+            filepath_or_buffer=str(path), temp_path=str(tmp_path), params=params
+        )
+
+
+def test_load_data_with_bad_format(
+    tmp_path: pathlib.Path, dataloader_cls: Type[ColumnarDataLoader]
+) -> None:
+    path = tmp_path / "data.bin"
+    path.write_text("age;sex\n20;F\n#$%&--")
+
+    with pytest.raises(DatasetGenerationError):
+        dataloader_cls().load_data(
+            filepath_or_buffer=str(path), temp_path=str(tmp_path), params={}
+        )
+
+
+def test_parse_filter() -> None:
+    assert parse_filter(None) is None
+    assert parse_filter("  ") is None
+    assert str(parse_filter("a == 1 AND b in [1, 2]")) == str(
+        (pa.compute.field("a") == 1) & pa.compute.field("b").isin([1, 2])
+    )
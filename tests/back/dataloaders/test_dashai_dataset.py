@@ -8,7 +8,7 @@ from typing import List
 
 import datasets
 import pytest
-from datasets import DatasetDict
+from datasets import ClassLabel, DatasetDict
 from pyarrow.lib import ArrowInvalid
 from sklearn.datasets import load_iris
 from starlette.datastructures import UploadFile
@@ -17,9 +17,13 @@ from DashAI.back.api.api_v1.schemas.datasets_params import ColumnSpecItemParams
 from DashAI.back.dataloaders.classes.csv_dataloader import CSVDataLoader
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     DashAIDataset,
+    encode_class_columns,
     get_column_names_from_indexes,
+    iter_batches,
     load_dataset,
+    load_prepared_dataset,
     save_dataset,
+    save_prepared_dataset,
     select_columns,
     split_dataset,
     split_indexes,
@@ -521,6 +525,30 @@ def test_save_to_disk_and_load(
     assert initial_num_rows == loaded_num_rows
 
 
+def test_save_and_load_prepared_dataset(
+    split_dashai_datasetdict,
+    test_path: pathlib.Path,
+):
+    x, y = select_columns(
+        dataset=split_dashai_datasetdict,
+        input_columns=["sepal length (cm)", "petal length (cm)"],
+        output_columns=["target"],
+    )
+    prepared_path = test_path / "dataloaders/dashaidataset/prepared/experiment"
+    save_prepared_dataset(x, y, prepared_path)
+    # publishing an already published dataset keeps the first copy.
+    save_prepared_dataset(x, y, prepared_path)
+    assert list(prepared_path.parent.iterdir()) == [prepared_path]
+
+    loaded_x, loaded_y = load_prepared_dataset(prepared_path)
+    for split in ["train", "test", "validation"]:
+        assert isinstance(loaded_x[split], DashAIDataset)
+        assert loaded_x[split].to_dict() == x[split].to_dict()
+        assert loaded_y[split].to_dict() == y[split].to_dict()
+        # the loaded splits are memory-mapped from the published files.
+        assert loaded_x[split].cache_files
+
+
 @pytest.fixture(name="split_dashai_datasetdict_two_class_cols")
 def split_dashai_datasetdict_two_class_cols(test_datasetdict):
     """A split DashAIDataset with two target columns."""
@@ -622,6 +650,43 @@ def test_update_columns_spec_on_disk(
         assert new_cols_specs[col_name].dtype == updated_features[col_name].dtype
 
 
+def test_update_columns_spec_shares_classes_between_splits(
+    split_dashai_datasetdict, test_path: pathlib.Path
+):
+    dataset_path = test_path / "dataloaders/dashaidataset/update_col_specs_classes"
+    save_dataset(split_dashai_datasetdict, dataset_path)
+    columns = {
+        name: ColumnSpecItemParams(type="Value", dtype="float64")
+        for name in split_dashai_datasetdict["train"].column_names
+    }
+    columns["target"] = ColumnSpecItemParams(type="ClassLabel", dtype="int64")
+    updated_dataset = update_columns_spec(str(dataset_path), columns=columns)
+
+    class_label = updated_dataset["train"].features["target"]
+    for split in ["train", "test", "validation"]:
+        assert updated_dataset[split].features["target"] == class_label
+        assert [
+            class_label.int2str(label) for label in updated_dataset[split]["target"]
+        ] == [str(label) for label in split_dashai_datasetdict[split]["target"]]
+        # the encoded splits are still memory-mapped from disk.
+        assert updated_dataset[split].cache_files
+
+
+def test_encode_class_columns_keeps_memory_mapped_splits(
+    split_dashai_datasetdict, test_path: pathlib.Path
+):
+    dataset_path = test_path / "dataloaders/dashaidataset/encode_class_columns"
+    save_dataset(split_dashai_datasetdict, dataset_path)
+    dataset = load_dataset(str(dataset_path))
+
+    encoded_dataset = encode_class_columns(dataset, ["target"])
+
+    for split in ["train", "test", "validation"]:
+        assert isinstance(encoded_dataset[split], DashAIDataset)
+        assert isinstance(encoded_dataset[split].features["target"], ClassLabel)
+        assert encoded_dataset[split].cache_files
+
+
 # This test is not working with the current version of datasets.
 # Check in the future if it is required or not with the new type definitions.
 # def test_update_columns_spec_unsupported_input(
@@ -725,3 +790,15 @@ def test_update_splits_by_specific_rows(split_dashai_datasetdict):
     assert len(new_dataset["train"]) == 100
     assert len(new_dataset["test"]) == 30
     assert len(new_dataset["validation"]) == 20
+
+
+def test_iter_batches(dashai_datasetdict: DatasetDict):
+    dataset = dashai_datasetdict["train"]
+    batches = list(iter_batches(dataset, 40))
+
+    assert [len(batch) for batch in batches] == [40, 40, 40, 30]
+    assert all(isinstance(batch, DashAIDataset) for batch in batches)
+    assert batches[1][0] == dataset[40]
+
+    with pytest.raises(ValueError, match="batch_size must be positive, got 0."):
+        list(iter_batches(dataset, 0))
@@ -0,0 +1,74 @@
+"""Tests of the content addressed storage of the dataset shards."""
+
+import pathlib
+
+from datasets import Dataset, DatasetDict
+
+from DashAI.back.dataloaders.classes.dashai_dataset import (
+    load_dataset,
+    save_dataset,
+    to_dashai_dataset,
+)
+from DashAI.back.dataloaders.classes.dataset_store import (
+    release_dataset_shards,
+    store_dataset_shards,
+)
+
+
+def _save(path: pathlib.Path, train_values, test_values) -> pathlib.Path:
+    datasetdict = to_dashai_dataset(
+        DatasetDict(
+            {
+                "train": Dataset.from_dict({"a": train_values}),
+                "test": Dataset.from_dict({"a": test_values}),
+            }
+        )
+    )
+    path.mkdir(parents=True)
+    save_dataset(datasetdict, path)
+    return path
+
+
+def _shard(dataset_path: pathlib.Path, split: str) -> pathlib.Path:
+    return next((dataset_path / split).glob("*.arrow"))
+
+
+def test_store_dataset_shards(tmp_path: pathlib.Path):
+    shards_path = tmp_path / "shards"
+    dataset_1 = _save(tmp_path / "dataset_1", [1, 2, 3], [4])
+    dataset_2 = _save(tmp_path / "dataset_2", [1, 2, 3], [4])
+    dataset_3 = _save(tmp_path / "dataset_3", [1, 2, 3], [5])
+
+    fingerprint_1 = store_dataset_shards(dataset_1, shards_path)
+    fingerprint_2 = store_dataset_shards(dataset_2, shards_path)
+    fingerprint_3 = store_dataset_shards(dataset_3, shards_path)
+
+    # identical datasets have the same fingerprint and share their shards.
+    assert fingerprint_1 == fingerprint_2
+    assert fingerprint_1 != fingerprint_3
+    assert _shard(dataset_1, "train").samefile(_shard(dataset_2, "train"))
+    assert _shard(dataset_1, "train").samefile(_shard(dataset_3, "train"))
+    assert not _shard(dataset_1, "test").samefile(_shard(dataset_3, "test"))
+    assert len(list(shards_path.glob("*.arrow"))) == 3
+
+    assert load_dataset(str(dataset_2))["train"]["a"] == [1, 2, 3]
+
+
+def test_release_dataset_shards(tmp_path: pathlib.Path):
+    shards_path = tmp_path / "shards"
+    dataset_1 = _save(tmp_path / "dataset_1", [1, 2, 3], [4])
+    dataset_2 = _save(tmp_path / "dataset_2", [1, 2, 3], [5])
+    store_dataset_shards(dataset_1, shards_path)
+    store_dataset_shards(dataset_2, shards_path)
+
+    for file_path in sorted(dataset_1.rglob("*"), reverse=True):
+        if file_path.is_file():
+            file_path.unlink()
+    release_dataset_shards(shards_path)
+
+    # only the shards used by the second dataset are kept.
+    shards = list(shards_path.glob("*.arrow"))
+    assert len(shards) == 2
+    for split in ["train", "test"]:
+        assert any(_shard(dataset_2, split).samefile(shard) for shard in shards)
+    assert load_dataset(str(dataset_2))["test"]["a"] == [5]
@@ -3,8 +3,10 @@
 import pathlib
 from typing import Any, Dict
 
+import pandas as pd
 import pytest
 from sklearn.datasets import load_diabetes, load_iris, load_wine
+from starlette.datastructures import UploadFile
 
 from DashAI.back.dataloaders.classes.excel_dataloader import ExcelDataLoader
 from tests.back.dataloaders.base_tabular_dataloader_tests import (
@@ -249,3 +251,40 @@ class TestExcelDataloader(BaseTabularDataLoaderTester):
             dataset_path=test_datasets_path / self.data_type_name / dataset_path,
             params=params,
         )
+
+
+def test_read_files_with_different_column_types(tmp_path: pathlib.Path) -> None:
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_excel(
+        tmp_path / "1.xlsx", index=False
+    )
+    pd.DataFrame({"a": [1.5, 2.5], "b": ["z", "w"]}).to_excel(
+        tmp_path / "2.xlsx", index=False
+    )
+
+    dataset = ExcelDataLoader()._read_files(
+        [str(tmp_path / "1.xlsx"), str(tmp_path / "2.xlsx")],
+        {"sheet": 0, "header": 0, "usecols": None},
+    )
+
+    assert dataset.num_rows == 4
+    assert dataset["a"] == [1.0, 2.0, 1.5, 2.5]
+    assert dataset["b"] == ["x", "y", "z", "w"]
+
+
+def test_uploaded_file_is_removed(tmp_path: pathlib.Path) -> None:
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_excel(
+        tmp_path / "data.xlsx", index=False
+    )
+    upload_path = tmp_path / "upload"
+    upload_path.mkdir()
+
+    with open(tmp_path / "data.xlsx", "rb") as file:
+        dataset = ExcelDataLoader().load_data(
+            filepath_or_buffer=UploadFile(file, filename="data.xlsx"),
+            temp_path=str(upload_path),
+            params={"sheet": 0, "header": 0, "usecols": None},
+        )
+
+    # the data is read to memory, so the saved dataset is the only copy.
+    assert list(upload_path.iterdir()) == []
+    assert dataset["train"]["a"] == [1, 2]
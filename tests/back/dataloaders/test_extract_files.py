@@ -0,0 +1,76 @@
+"""Tests of the extraction of the uploaded files."""
+
+import io
+import pathlib
+import zipfile
+
+from starlette.datastructures import Headers, UploadFile
+
+from DashAI.back.dataloaders.classes.dataloader import BaseDataLoader
+
+
+class DummyDataLoader(BaseDataLoader):
+    def load_data(self, filepath_or_buffer, temp_path, params):
+        pass
+
+
+class NonSeekableFile(io.RawIOBase):
+    """A file object that can only be read sequentially, like a network stream."""
+
+    def __init__(self, content: bytes) -> None:
+        self._buffer = io.BytesIO(content)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._buffer.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _zip_content() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for split in ["train", "test"]:
+            for idx in range(20):
+                zip_file.writestr(f"{split}/class_{idx % 2}/{idx}.txt", f"{idx}")
+        zip_file.writestr("../outside.txt", "outside")
+    return buffer.getvalue()
+
+
+def _upload(file, content_type: str, filename: str = "files.zip") -> UploadFile:
+    return UploadFile(
+        filename=filename, file=file, headers=Headers({"Content-Type": content_type})
+    )
+
+
+def test_extract_zip_files(tmp_path: pathlib.Path):
+    for name, file in [
+        ("seekable", io.BytesIO(_zip_content())),
+        ("stream", NonSeekableFile(_zip_content())),
+    ]:
+        files_path = DummyDataLoader().extract_files(
+            str(tmp_path / name), _upload(file, "application/zip")
+        )
+
+        assert files_path == f"{tmp_path / name}/files"
+        extracted_files = sorted(
+            path.relative_to(files_path).as_posix()
+            for path in pathlib.Path(files_path).rglob("*.txt")
+        )
+        assert len(extracted_files) == 41
+        assert "train/class_1/19.txt" in extracted_files
+        # members are never extracted outside the files folder.
+        assert "outside.txt" in extracted_files
+        assert not (tmp_path / name / "outside.txt").exists()
+        assert (pathlib.Path(files_path) / "test/class_0/4.txt").read_text() == "4"
+
+
+def test_extract_plain_file(tmp_path: pathlib.Path):
+    file_path = DummyDataLoader().extract_files(
+        str(tmp_path),
+        _upload(NonSeekableFile(b"a,b\n1,2\n"), "text/csv", "data.csv"),
+    )
+
+    assert pathlib.Path(file_path).read_bytes() == b"a,b\n1,2\n"
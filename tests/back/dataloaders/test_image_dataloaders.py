@@ -1,11 +1,18 @@
 """Dataloaders tests."""
 
+import io
 import shutil
 
+import pytest
 from datasets import DatasetDict
+from PIL import Image
 from starlette.datastructures import Headers, UploadFile
 
-from DashAI.back.dataloaders.classes.image_dataloader import ImageDataLoader
+from DashAI.back.dataloaders.classes import image_dataloader as image_dataloader_module
+from DashAI.back.dataloaders.classes.image_dataloader import (
+    ImageDataLoader,
+    process_image,
+)
 
 
 def test_image_dataloader_from_zip():
@@ -28,3 +35,56 @@ def test_image_dataloader_from_zip():
     assert isinstance(dataset, DatasetDict)
 
     shutil.rmtree("tests/back/dataloaders/beans_dataset_small", ignore_errors=True)
+
+
+def test_image_dataloader_resizes_images(monkeypatch: pytest.MonkeyPatch):
+    # process the images by several chunks in the worker processes.
+    monkeypatch.setattr(image_dataloader_module, "CHUNK_SIZE", 4)
+    test_dataset_path = "tests/back/dataloaders/beans_dataset_small.zip"
+    image_dataloader = ImageDataLoader()
+
+    with open(test_dataset_path, "rb") as file:
+        uploaded_file = UploadFile(
+            filename=test_dataset_path,
+            file=file,
+            headers=Headers({"Content-Type": "application/zip"}),
+        )
+
+        dataset = image_dataloader.load_data(
+            filepath_or_buffer=uploaded_file,
+            temp_path="tests/back/dataloaders/beans_dataset_resized",
+            params={"image_size": 32, "n_workers": 2},
+        )
+    # the images are stored in the dataset, not only their paths.
+    shutil.rmtree("tests/back/dataloaders/beans_dataset_resized", ignore_errors=True)
+
+    train = dataset["train"]
+    assert len(train) == 27
+    assert train.features["label"].names == [
+        "angular_leaf_spot",
+        "bean_rust",
+        "healthy",
+    ]
+    assert all(image.size == (32, 32) for image in train["image"])
+    # the processed images are written to disk, not kept in memory.
+    assert train.cache_files
+
+
+def test_process_image_invalid_file(tmp_path):
+    invalid_image_path = tmp_path / "image.jpg"
+    invalid_image_path.write_bytes(b"not an image")
+
+    with pytest.raises(OSError, match="Unable to decode image"):
+        process_image({"bytes": None, "path": str(invalid_image_path)})
+
+
+def test_process_image_resizes_cmyk_image():
+    buffer = io.BytesIO()
+    Image.new("CMYK", (8, 8)).save(buffer, format="JPEG")
+
+    image = process_image({"bytes": buffer.getvalue(), "path": None}, image_size=4)
+
+    with Image.open(io.BytesIO(image["bytes"])) as resized_image:
+        assert resized_image.format == "PNG"
+        assert resized_image.mode == "RGB"
+        assert resized_image.size == (4, 4)
@@ -1,12 +1,19 @@
 """JSON DataLoader tests module."""
 
+import json
 import pathlib
 from typing import Any, Dict
 
+import fsspec
 import pytest
+from datasets.builder import DatasetGenerationError
 from sklearn.datasets import load_diabetes, load_iris, load_wine
 
-from DashAI.back.dataloaders.classes.json_dataloader import JSONDataLoader
+from DashAI.back.dataloaders.classes import json_dataloader
+from DashAI.back.dataloaders.classes.json_dataloader import (
+    JSONDataLoader,
+    iter_json_records,
+)
 from tests.back.dataloaders.base_tabular_dataloader_tests import (
     BaseTabularDataLoaderTester,
 )
@@ -200,3 +207,129 @@ class TestJSONDataLoader(BaseTabularDataLoaderTester):
             dataset_path=test_datasets_path / self.data_type_name / dataset_path,
             params=params,
         )
+
+
+RECORDS = [{"a": i, "b": f"text {i}", "c": i / 3} for i in range(25)]
+
+
+@pytest.fixture(name="small_chunks")
+def fixture_small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Read the files by tiny chunks and batches to exercise the streaming."""
+    monkeypatch.setattr(json_dataloader, "CHUNK_SIZE", 7)
+    monkeypatch.setattr(json_dataloader, "BATCH_SIZE", 4)
+
+
+@pytest.mark.usefixtures("small_chunks")
+@pytest.mark.parametrize(
+    ("document", "data_key"),
+    [
+        ({"schema": {"fields": [1, 2]}, "data": RECORDS, "version": 1}, "data"),
+        ({"data": RECORDS}, "data"),
+        (RECORDS, None),
+    ],
+    ids=["table", "only_data", "records"],
+)
+def test_iter_json_records(tmp_path: pathlib.Path, document: Any, data_key) -> None:
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(document, indent=2))
+
+    assert list(iter_json_records(str(path), data_key)) == RECORDS
+
+
+@pytest.mark.usefixtures("small_chunks")
+@pytest.mark.parametrize(
+    ("content", "data_key", "error_msg"),
+    [
+        (json.dumps({"other": RECORDS}), "data", "not found"),
+        (json.dumps({"data": RECORDS}) + "#$%&--", "data", "Extra data"),
+        (json.dumps({"data": RECORDS})[:-5], "data", "Expecting"),
+        (json.dumps(RECORDS) + "]", None, "Extra data"),
+    ],
+    ids=["missing_data_key", "extra_data", "truncated", "extra_bracket"],
+)
+def test_iter_json_records_with_invalid_documents(
+    tmp_path: pathlib.Path, content: str, data_key: str, error_msg: str
+) -> None:
+    path = tmp_path / "data.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match=error_msg):
+        list(iter_json_records(str(path), data_key))
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_load_json_lines(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS))
+
+    dataset = JSONDataLoader().load_data(
+        filepath_or_buffer=str(path), temp_path=str(tmp_path), params={"data_key": None}
+    )
+
+    assert list(dataset.keys()) == ["train"]
+    assert dataset["train"].to_list() == RECORDS
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_load_json_lines_with_bad_format(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_text(json.dumps(RECORDS[0]) + "\n#$%&--\n")
+
+    with pytest.raises(DatasetGenerationError):
+        JSONDataLoader().load_data(
+            filepath_or_buffer=str(path),
+            temp_path=str(tmp_path),
+            params={"data_key": None},
+        )
+
+
+@pytest.mark.usefixtures("small_chunks")
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"], ids=["records", "json_lines"])
+def test_load_json_with_schema_drift(tmp_path: pathlib.Path, suffix: str) -> None:
+    # the first batch has only integers in "a" and no "c" key.
+    records = [{"a": i, "b": f"text {i}"} for i in range(8)]
+    records += [{"a": 8.5, "c": True}, {"b": "text 9", "c": False}]
+    path = tmp_path / f"data{suffix}"
+    if suffix == ".json":
+        path.write_text(json.dumps(records))
+    else:
+        path.write_text("\n".join(json.dumps(record) for record in records))
+
+    dataset = JSONDataLoader().load_data(
+        filepath_or_buffer=str(path), temp_path=str(tmp_path), params={"data_key": None}
+    )
+
+    assert dataset["train"].features.to_dict() == {
+        "a": {"dtype": "float64", "_type": "Value"},
+        "b": {"dtype": "string", "_type": "Value"},
+        "c": {"dtype": "bool", "_type": "Value"},
+    }
+    assert dataset["train"].to_list() == [
+        {"a": record.get("a"), "b": record.get("b"), "c": record.get("c")}
+        for record in records
+    ]
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_load_json_with_incompatible_types(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(RECORDS + [{"a": "text"}]))
+
+    with pytest.raises(DatasetGenerationError):
+        JSONDataLoader().load_data(
+            filepath_or_buffer=str(path),
+            temp_path=str(tmp_path),
+            params={"data_key": None},
+        )
+
+
+def test_load_json_from_url(tmp_path: pathlib.Path) -> None:
+    url = "memory://json_dataloader/data.json"
+    with fsspec.open(url, "w") as file:
+        json.dump({"data": RECORDS}, file)
+
+    dataset = JSONDataLoader().load_data(
+        filepath_or_buffer=url, temp_path=str(tmp_path), params={"data_key": "data"}
+    )
+
+    assert dataset["train"].to_list() == RECORDS
@@ -0,0 +1,62 @@
+"""Tests of the TabularDataLoader methods."""
+
+import pytest
+from datasets import ClassLabel, Dataset, DatasetDict
+
+from DashAI.back.dataloaders.classes.dashai_dataset import (
+    DashAIDataset,
+    to_dashai_dataset,
+)
+from DashAI.back.dataloaders.classes.tabular_dataloader import TabularDataLoader
+
+
+class DummyTabularDataLoader(TabularDataLoader):
+    def load_data(self, filepath_or_buffer, temp_path, params):
+        pass
+
+
+@pytest.fixture(name="datasetdict")
+def fixture_datasetdict() -> DatasetDict:
+    return to_dashai_dataset(
+        DatasetDict(
+            {
+                "train": Dataset.from_dict(
+                    {"x": [1, 2, 3, 4], "label": ["dog", "cat", "dog", None]}
+                ),
+                "test": Dataset.from_dict({"x": [5], "label": ["bird"]}),
+                "validation": Dataset.from_dict({"x": [6, 7], "label": ["cat", "cat"]}),
+            }
+        )
+    )
+
+
+@pytest.mark.parametrize("class_column", ["label", 1])
+def test_set_classes(datasetdict: DatasetDict, class_column):
+    dataset, label = DummyTabularDataLoader()._set_classes(datasetdict, class_column)
+
+    assert label == "label"
+    # every split shares the same sorted classes.
+    for split in ["train", "test", "validation"]:
+        assert isinstance(dataset[split], DashAIDataset)
+        assert dataset[split].features["label"] == ClassLabel(
+            names=["bird", "cat", "dog"]
+        )
+        assert dataset[split].column_names == ["x", "label"]
+    assert dataset["train"]["label"] == [2, 1, 2, None]
+    assert dataset["test"]["label"] == [0]
+    assert dataset["validation"]["label"] == [1, 1]
+
+
+def test_set_classes_numeric_labels():
+    # only the selected rows of the split are encoded.
+    train = Dataset.from_dict({"label": [7, 5, 3, 7, 10]}).select([0, 1, 3, 4])
+    dataset = DatasetDict({"train": train})
+    dataset, _ = DummyTabularDataLoader()._set_classes(dataset, "label")
+
+    assert dataset["train"].features["label"] == ClassLabel(names=["5", "7", "10"])
+    assert dataset["train"]["label"] == [1, 0, 1, 2]
+
+
+def test_set_classes_unexistent_column(datasetdict: DatasetDict):
+    with pytest.raises(ValueError, match="Class column 'y' does not exist"):
+        DummyTabularDataLoader()._set_classes(datasetdict, "y")
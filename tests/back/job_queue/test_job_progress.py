@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+import pytest
+
+from DashAI.back.dependencies.job_queues import SimpleJobQueue
+from DashAI.back.dependencies.job_queues.job_cost_estimator import JobCostEstimator
+from DashAI.back.dependencies.job_queues.job_queue import job_queue_loop
+from DashAI.back.job.base_job import BaseJob, JobError
+from DashAI.back.job.progress import (
+    ProgressBroker,
+    ProgressReporter,
+    get_progress_reporter,
+    progress_scope,
+    report_progress,
+)
+
+
+class ReportingJob(BaseJob):
+    def run(self) -> None:
+        report_progress("phase", phase="training")
+        if self.kwargs.get("fail"):
+            raise JobError("Always fails")
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+
+def test_report_progress_in_scope():
+    broker = ProgressBroker()
+
+    report_progress("phase", phase="training")
+    with progress_scope(ProgressReporter(broker, run_id=1)):
+        report_progress("phase", phase="training")
+        with progress_scope(get_progress_reporter().bind(split="test")):
+            report_progress("evaluation", rows=10)
+    report_progress("phase", phase="finished")
+
+    events = broker.history()
+    assert [event["event"] for event in events] == ["phase", "evaluation"]
+    assert events[0]["run_id"] == events[1]["run_id"] == 1
+    assert events[1]["split"] == "test"
+    assert "timestamp" in events[0]
+
+
+@pytest.mark.asyncio()
+async def test_broker_delivers_events_from_threads():
+    broker = ProgressBroker(history_size=2)
+    reporter = ProgressReporter(broker, job_id=1)
+    for step in range(3):
+        reporter("step", step=step)
+
+    queue = broker.subscribe()
+    thread = threading.Thread(target=lambda: reporter("step", step=3))
+    thread.start()
+    thread.join()
+
+    steps = [(await asyncio.wait_for(queue.get(), 1))["step"] for _ in range(3)]
+    assert steps == [1, 2, 3]
+
+    broker.unsubscribe(queue)
+    reporter("step", step=4)
+    await asyncio.sleep(0)
+    assert queue.empty()
+
+
+@pytest.mark.asyncio()
+async def test_broker_drops_oldest_events_of_slow_subscribers():
+    broker = ProgressBroker(history_size=0, queue_size=2)
+    queue = broker.subscribe()
+    for step in range(4):
+        broker.publish({"event": "step", "step": step})
+    await asyncio.sleep(0)
+
+    assert [queue.get_nowait()["step"] for _ in range(queue.qsize())] == [2, 3]
+
+
+@pytest.mark.asyncio()
+async def test_job_queue_loop_reports_progress():
+    broker = ProgressBroker()
+    job_queue = SimpleJobQueue()
+    job_id = job_queue.put(ReportingJob(kwargs={"run_id": 3}))
+    failed_job_id = job_queue.put(ReportingJob(kwargs={"run_id": 4, "fail": True}))
+
+    await job_queue_loop(
+        True,
+        job_queue=job_queue,
+        job_cost_estimator=JobCostEstimator(),
+        progress_broker=broker,
+    )
+
+    events = [
+        (event["job_id"], event["run_id"], event["event"], event.get("status"))
+        for event in broker.history()
+    ]
+    assert events == [
+        (job_id, 3, "job", "started"),
+        (job_id, 3, "phase", None),
+        (job_id, 3, "job", "finished"),
+        (failed_job_id, 4, "job", "started"),
+        (failed_job_id, 4, "phase", None),
+        (failed_job_id, 4, "job", "error"),
+    ]
+    assert broker.history()[-1]["job_type"] == "ReportingJob"
@@ -1,7 +1,11 @@
+import asyncio
+import math
+
 import pytest
 
 from DashAI.back.dependencies.job_queues import BaseJobQueue, SimpleJobQueue
 from DashAI.back.dependencies.job_queues.base_job_queue import JobQueueError
+from DashAI.back.dependencies.job_queues.job_cost_estimator import JobCostEstimator
 from DashAI.back.job.base_job import BaseJob
 
 
@@ -134,3 +138,138 @@ def test_peek_nonexistent_job(job_queue: BaseJobQueue):
     job_queue.put(job)
     with pytest.raises(JobQueueError):
         job_queue.peek(job_id=-1)
+
+
+def test_jobs_priority_order(job_queue: BaseJobQueue):
+    job_1_id = job_queue.put(DummyJob())
+    job_2_id = job_queue.put(DummyJob(), priority=1)
+    job_3_id = job_queue.put(DummyJob())
+    job_4_id = job_queue.put(DummyJob(), priority=1)
+
+    assert [job.id for job in job_queue.to_list()] == [
+        job_2_id,
+        job_4_id,
+        job_1_id,
+        job_3_id,
+    ]
+    assert job_queue.peek().id == job_2_id
+    assert job_queue.get().id == job_2_id
+    assert job_queue.get().id == job_4_id
+    assert job_queue.get().id == job_1_id
+    assert job_queue.get().id == job_3_id
+
+
+def test_get_job_keeps_order(job_queue: BaseJobQueue):
+    job_1_id = job_queue.put(DummyJob())
+    job_2_id = job_queue.put(DummyJob())
+    job_3_id = job_queue.put(DummyJob())
+
+    assert job_queue.get(job_1_id).id == job_1_id
+    assert job_queue.peek().id == job_2_id
+    with pytest.raises(JobQueueError):
+        job_queue.peek(job_1_id)
+
+    assert job_queue.get(job_3_id).id == job_3_id
+    assert [job.id for job in job_queue.to_list()] == [job_2_id]
+    assert job_queue.get().id == job_2_id
+    assert job_queue.is_empty()
+
+
+@pytest.mark.asyncio()
+async def test_async_get_waits_for_job(job_queue: BaseJobQueue):
+    async def put_job_later() -> int:
+        await asyncio.sleep(0.01)
+        return job_queue.put(DummyJob())
+
+    put_task = asyncio.ensure_future(put_job_later())
+    job = await job_queue.async_get()
+    assert job.id == await put_task
+    assert job_queue.is_empty()
+
+
+class SizedDummyJob(DummyJob):
+    def __init__(self, model_name: str, size: float):
+        super().__init__()
+        self.model_name = model_name
+        self.size = size
+
+    def get_workload(self):
+        return self.model_name, self.size
+
+
+def test_cost_estimator():
+    estimator = JobCostEstimator(default_rate=0.5)
+    assert estimator.estimate(SizedDummyJob("Slow", 10)) == 5.0
+
+    estimator.record("Slow", size=10, seconds=100)
+    estimator.record("Slow", size=20, seconds=400)
+    estimator.record("Fast", size=100, seconds=1)
+
+    assert estimator.rate("Slow") == 15.0
+    assert estimator.rate("Fast") == 0.01
+    assert estimator.estimate(SizedDummyJob("Slow", 2)) == 30.0
+    # unknown components are estimated with the mean rate of the known ones
+    assert estimator.rate("Unknown") == (15.0 + 0.01) / 2
+
+
+class UnknownWorkloadJob(DummyJob):
+    def get_workload(self):
+        raise ValueError("Unknown workload")
+
+
+def test_cost_estimator_unknown_workload():
+    estimator = JobCostEstimator()
+    assert estimator.estimate(UnknownWorkloadJob()) == math.inf
+
+    estimator.record("Slow", size=10, seconds=100)
+    estimator.record("Fast", size=100, seconds=2)
+    assert estimator.estimate(UnknownWorkloadJob()) == 51.0
+
+
+def test_shortest_job_first_queue_unknown_workload():
+    job_queue = SimpleJobQueue(scheduling="shortest_job_first")
+
+    unknown_1_id = job_queue.put(UnknownWorkloadJob())
+    fast_id = job_queue.put(SizedDummyJob("Fast", 1))
+    unknown_2_id = job_queue.put(UnknownWorkloadJob())
+
+    assert [job.id for job in job_queue.to_list()] == [
+        fast_id,
+        unknown_1_id,
+        unknown_2_id,
+    ]
+
+
+def test_shortest_job_first_queue():
+    estimator = JobCostEstimator()
+    estimator.record("Slow", size=1, seconds=100)
+    estimator.record("Fast", size=1, seconds=1)
+    job_queue = SimpleJobQueue(
+        scheduling="shortest_job_first", cost_estimator=estimator
+    )
+
+    slow_id = job_queue.put(SizedDummyJob("Slow", 100))
+    fast_id = job_queue.put(SizedDummyJob("Fast", 100))
+    big_fast_id = job_queue.put(SizedDummyJob("Fast", 1000))
+    urgent_slow_id = job_queue.put(SizedDummyJob("Slow", 100), priority=1)
+
+    assert [job.id for job in job_queue.to_list()] == [
+        urgent_slow_id,
+        fast_id,
+        big_fast_id,
+        slow_id,
+    ]
+
+
+def test_fifo_queue():
+    job_queue = SimpleJobQueue(scheduling="fifo")
+    job_1_id = job_queue.put(DummyJob())
+    job_2_id = job_queue.put(DummyJob(), priority=1)
+
+    assert job_queue.get().id == job_1_id
+    assert job_queue.get().id == job_2_id
+
+
+def test_unknown_scheduling_policy():
+    with pytest.raises(ValueError, match="Unknown scheduling policy"):
+        SimpleJobQueue(scheduling="random")
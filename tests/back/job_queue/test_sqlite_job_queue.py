@@ -0,0 +1,156 @@
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+from kink import di
+from sqlalchemy import select, update
+
+from DashAI.back.dependencies.database import setup_sqlite_db
+from DashAI.back.dependencies.database.models import Base, Job
+from DashAI.back.dependencies.job_queues import BaseJobQueue, SQLiteJobQueue
+from DashAI.back.dependencies.job_queues.base_job_queue import JobQueueError
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.job.base_job import BaseJob
+
+
+class DummyJob(BaseJob):
+    def run(self) -> None:
+        return None
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+
+@pytest.fixture(name="session_factory")
+def fixture_session_factory(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    engine, session_factory = setup_sqlite_db(
+        {"SQLITE_DB_PATH": tmp_path / "db.sqlite", "LOGGING_LEVEL": "ERROR"}
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setitem(
+        di._services,
+        "component_registry",
+        ComponentRegistry(initial_components=[DummyJob]),
+    )
+    yield session_factory
+    engine.dispose()
+
+
+@pytest.fixture(name="job_queue")
+def fixture_job_queue(session_factory) -> BaseJobQueue:
+    return SQLiteJobQueue(session_factory=session_factory, poll_interval=0.01)
+
+
+def test_put_and_get_jobs(job_queue: BaseJobQueue):
+    assert job_queue.is_empty()
+    job_1_id = job_queue.put(DummyJob(run_id=1))
+    job_2_id = job_queue.put(DummyJob(run_id=2))
+    job_3_id = job_queue.put(DummyJob(run_id=3))
+    assert not job_queue.is_empty()
+
+    assert job_queue.peek().id == job_1_id
+    assert job_queue.peek(job_3_id).kwargs["run_id"] == 3
+
+    job = job_queue.get(job_3_id)
+    assert job.id == job_3_id
+    assert isinstance(job, DummyJob)
+    assert job.kwargs["run_id"] == 3
+
+    assert [job.id for job in job_queue.to_list()] == [job_1_id, job_2_id]
+    assert job_queue.get().id == job_1_id
+    assert job_queue.get().id == job_2_id
+    assert job_queue.is_empty()
+
+
+def test_priority_order(job_queue: BaseJobQueue):
+    job_1_id = job_queue.put(DummyJob())
+    job_2_id = job_queue.put(DummyJob(), priority=2)
+
+    assert [job.id for job in job_queue.to_list()] == [job_2_id, job_1_id]
+
+
+def test_get_from_empty_queue(job_queue: BaseJobQueue):
+    with pytest.raises(JobQueueError):
+        job_queue.get()
+    with pytest.raises(JobQueueError):
+        job_queue.peek()
+
+    job_queue.put(DummyJob())
+    with pytest.raises(JobQueueError):
+        job_queue.get(job_id=-1)
+
+
+def test_jobs_are_claimed_once(session_factory):
+    worker_1 = SQLiteJobQueue(session_factory=session_factory)
+    worker_2 = SQLiteJobQueue(session_factory=session_factory)
+    job_1_id = worker_1.put(DummyJob())
+    job_2_id = worker_1.put(DummyJob())
+
+    assert worker_2.get().id == job_1_id
+    assert worker_1.get().id == job_2_id
+    assert worker_1.is_empty()
+    assert worker_2.is_empty()
+
+
+def _claim_as(session_factory, job_id: int, worker_id: str) -> None:
+    with session_factory() as db:
+        db.execute(update(Job).where(Job.id == job_id).values(claimed_by=worker_id))
+        db.commit()
+
+
+def test_requeue_claimed_jobs(session_factory):
+    worker_1 = SQLiteJobQueue(session_factory=session_factory)
+    worker_2 = SQLiteJobQueue(session_factory=session_factory)
+    job_ids = [worker_1.put(DummyJob()) for _ in range(5)]
+
+    done_job = worker_1.get()
+    worker_1.task_done(done_job)
+    # a job being executed by a live worker.
+    worker_1.get()
+    # a job claimed by a worker process that exited.
+    dead_process = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead_process.wait()
+    _claim_as(
+        session_factory,
+        worker_1.get().id,
+        f"{socket.gethostname()}:{dead_process.pid}:a",
+    )
+    # a job claimed by a previous process with the same pid.
+    _claim_as(
+        session_factory, worker_1.get().id, f"{socket.gethostname()}:{os.getpid()}:a"
+    )
+    # a job claimed by a worker of another host.
+    _claim_as(session_factory, worker_1.get().id, "other-host:1:a")
+    assert worker_1.is_empty()
+
+    # e.g. a second server started while the first one executes jobs.
+    assert worker_2.requeue_claimed_jobs() == 2
+    assert [job.id for job in worker_2.to_list()] == job_ids[2:4]
+    assert worker_2.requeue_claimed_jobs() == 0
+
+
+def test_job_sessions_are_closed(session_factory):
+    job_queue = SQLiteJobQueue(session_factory=session_factory)
+    pool = session_factory.kw["bind"].pool
+    job_queue.put(DummyJob())
+    job_queue.put(DummyJob())
+
+    assert all("db" not in job.kwargs for job in job_queue.to_list())
+    assert "db" not in job_queue.peek().kwargs
+    assert pool.checkedout() == 0
+
+    job = job_queue.get()
+    job.kwargs["db"].execute(select(Job))
+    assert pool.checkedout() == 1
+
+    job_queue.task_done(job)
+    assert pool.checkedout() == 0
+
+
+@pytest.mark.asyncio()
+async def test_async_get_job(job_queue: BaseJobQueue):
+    job_id = job_queue.put(DummyJob())
+    job = await job_queue.async_get()
+    assert job.id == job_id
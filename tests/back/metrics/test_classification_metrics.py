@@ -3,11 +3,13 @@ from typing import Dict, List
 import numpy as np
 import pytest
 from datasets import Dataset
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 
 from DashAI.back.metrics.classification.accuracy import Accuracy
 from DashAI.back.metrics.classification.f1 import F1
 from DashAI.back.metrics.classification.precision import Precision
 from DashAI.back.metrics.classification.recall import Recall
+from DashAI.back.metrics.classification_metric import ConfusionMatrix
 
 
 @pytest.fixture(scope="module", name="metric_input")
@@ -80,3 +82,76 @@ def test_metrics_different_input_sizes(metric_input: Dict[str, List[int]]):
         match=error_pattern,
     ):
         F1.score(metric_input["true_labels"], metric_input["wrong_size_labels"])
+
+
+def test_confusion_matrix():
+    confusion_matrix = ConfusionMatrix(
+        np.array([0, 0, 1, 2, 2]), np.array([0, 1, 1, 2, 0])
+    )
+
+    assert confusion_matrix.labels.tolist() == [0, 1, 2]
+    assert confusion_matrix.matrix.tolist() == [[1, 1, 0], [0, 1, 0], [1, 0, 1]]
+
+
+def test_confusion_matrix_non_integer_labels():
+    confusion_matrix = ConfusionMatrix(
+        np.array(["b", "a", "c"]), np.array(["b", "d", "c"])
+    )
+
+    assert confusion_matrix.labels.tolist() == ["a", "b", "c", "d"]
+    assert confusion_matrix.accuracy() == pytest.approx(2 / 3)
+    assert confusion_matrix.precision() == pytest.approx(0.5)
+
+
+def test_confusion_matrix_sparse_integer_labels():
+    rng = np.random.default_rng(0)
+    classes = np.array([0, 2024, 100_000, 10**12])
+    true_labels = rng.choice(classes, 200)
+    pred_labels = rng.choice(classes, 200)
+
+    # the matrix is accumulated by batches, as the metrics of a split are.
+    confusion_matrix = ConfusionMatrix(true_labels[:120], pred_labels[:120])
+    confusion_matrix.update(true_labels[120:], pred_labels[120:])
+
+    assert confusion_matrix.labels.tolist() == classes.tolist()
+    assert confusion_matrix.matrix.shape == (4, 4)
+    assert confusion_matrix.accuracy() == pytest.approx(
+        accuracy_score(true_labels, pred_labels)
+    )
+    assert confusion_matrix.f1() == pytest.approx(
+        f1_score(true_labels, pred_labels, average="macro")
+    )
+
+
+@pytest.mark.parametrize("n_classes", [2, 3, 5])
+def test_confusion_matrix_scores_match_sklearn(n_classes: int):
+    rng = np.random.default_rng(n_classes)
+    true_labels = rng.integers(0, n_classes, 200)
+    pred_labels = rng.integers(0, n_classes, 200)
+    average = "binary" if n_classes == 2 else "macro"
+
+    confusion_matrix = ConfusionMatrix(true_labels, pred_labels)
+
+    assert confusion_matrix.accuracy() == pytest.approx(
+        accuracy_score(true_labels, pred_labels)
+    )
+    assert confusion_matrix.precision() == pytest.approx(
+        precision_score(true_labels, pred_labels, average=average)
+    )
+    assert confusion_matrix.recall() == pytest.approx(
+        recall_score(true_labels, pred_labels, average=average)
+    )
+    assert confusion_matrix.f1() == pytest.approx(
+        f1_score(true_labels, pred_labels, average=average)
+    )
+
+
+def test_metrics_from_confusion_matrix(metric_input: Dict[str, List[int]]):
+    confusion_matrix = ConfusionMatrix.from_predictions(
+        metric_input["true_labels"], metric_input["pred_labels"]
+    )
+
+    for metric in [Accuracy, Precision, Recall, F1]:
+        assert metric.from_confusion_matrix(confusion_matrix) == metric.score(
+            metric_input["true_labels"], metric_input["pred_labels"]
+        )
@@ -0,0 +1,96 @@
+"""Metric accumulators tests."""
+
+import numpy as np
+import pytest
+from datasets import Dataset
+
+from DashAI.back.dataloaders.classes.dashai_dataset import iter_batches
+from DashAI.back.job.model_job import score_metrics
+from DashAI.back.metrics.classification.accuracy import Accuracy
+from DashAI.back.metrics.classification.f1 import F1
+from DashAI.back.metrics.regression.mae import MAE
+from DashAI.back.metrics.regression.rmse import RMSE
+from DashAI.back.metrics.translation.bleu import Bleu
+from DashAI.back.models.scikit_learn.linear_regression import LinearRegression
+
+
+def _accumulate(metric, true_values, predictions, batch_size):
+    accumulator = metric.accumulator()
+    for batch_number, y_batch in enumerate(iter_batches(true_values, batch_size)):
+        start = batch_number * batch_size
+        accumulator.update(y_batch, predictions[start : start + batch_size])
+    return accumulator.finalize()
+
+
+@pytest.mark.parametrize("metric", [Accuracy, F1])
+def test_classification_accumulator(metric):
+    rng = np.random.default_rng(0)
+    true_values = Dataset.from_dict({"foo": rng.integers(0, 3, 50)})
+    predictions = rng.random((50, 3))
+
+    assert _accumulate(metric, true_values, predictions, 7) == pytest.approx(
+        metric.score(true_values, predictions)
+    )
+
+
+@pytest.mark.parametrize("metric", [MAE, RMSE])
+def test_regression_accumulator(metric):
+    rng = np.random.default_rng(0)
+    true_values = Dataset.from_dict({"foo": rng.random(50)})
+    predictions = rng.random(50)
+
+    assert _accumulate(metric, true_values, predictions, 7) == pytest.approx(
+        metric.score(true_values, predictions)
+    )
+
+
+@pytest.mark.parametrize("metric", [MAE, RMSE])
+def test_regression_accumulator_with_column_predictions(metric):
+    rng = np.random.default_rng(0)
+    true_values = Dataset.from_dict({"foo": rng.random(50)})
+    predictions = rng.random((50, 1))
+
+    assert _accumulate(metric, true_values, predictions, 7) == pytest.approx(
+        metric.score(true_values, predictions.ravel())
+    )
+
+
+def test_regression_accumulator_length_mismatch():
+    true_values = Dataset.from_dict({"foo": [1.0, 2.0]})
+
+    with pytest.raises(ValueError, match="must be equal"):
+        MAE.accumulator().update(true_values, np.ones((2, 2)))
+
+
+def test_score_metrics_with_column_regressor():
+    rng = np.random.default_rng(0)
+    features = rng.random((50, 3))
+    x = Dataset.from_dict({f"x_{i}": features[:, i] for i in range(3)})
+    y = Dataset.from_dict({"foo": features.sum(axis=1) + rng.normal(size=50)})
+    model = LinearRegression()
+    model.fit(x, y)
+    predictions = model.predict(x)
+
+    scores = score_metrics([MAE, RMSE], model, x, y, batch_size=7)
+
+    assert scores["MAE"] == pytest.approx(MAE.score(y, np.ravel(predictions)))
+    assert scores["RMSE"] == pytest.approx(RMSE.score(y, np.ravel(predictions)))
+
+
+def test_default_accumulator():
+    true_values = Dataset.from_dict(
+        {"foo": ["Tuve que hacerlo", "Quiero que suspendas la pelea.", "Hola"]}
+    )
+    predictions = ["Tuve que hacerlo", "Quiero que la pelea.", "Hola"]
+
+    assert _accumulate(Bleu, true_values, predictions, 2) == pytest.approx(
+        Bleu.score(true_values, predictions)
+    )
+
+
+def test_empty_accumulator():
+    with pytest.raises(ValueError, match="No batches were added to the accumulator."):
+        Bleu.accumulator().finalize()
+
+    with pytest.raises(ValueError, match="No values were added to the accumulator."):
+        MAE.accumulator().finalize()
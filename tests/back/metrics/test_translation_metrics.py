@@ -2,9 +2,15 @@
 
 import pytest
 from datasets import Dataset
+from sacrebleu.metrics import TER
 
 from DashAI.back.metrics.translation.bleu import Bleu
 from DashAI.back.metrics.translation.ter import Ter
+from DashAI.back.metrics.translation_metric import (
+    corpus_bleu,
+    corpus_ter,
+    tokenize,
+)
 
 
 @pytest.fixture(scope="module", name="metric_input")
@@ -41,3 +47,61 @@ def test_metrics_different_input_sizes(metric_input: dict):
 
     with pytest.raises(ValueError, match=err_pattern):
         Ter.score(metric_input["true_sentences"], metric_input["wrong_size_sentences"])
+
+
+def test_tokenize():
+    assert tokenize(["Quiero que suspendas la pelea."]) == [
+        ["Quiero", "que", "suspendas", "la", "pelea", "."]
+    ]
+    assert tokenize(["Quiero que suspendas la pelea."], tokenizer="ter") == [
+        ["quiero", "que", "suspendas", "la", "pelea."]
+    ]
+
+    with pytest.raises(ValueError, match="Unknown tokenizer foo."):
+        tokenize(["Tuve que hacerlo"], tokenizer="foo")
+
+
+def test_corpus_bleu():
+    references = [["the", "cat", "is", "on", "the", "mat"]]
+
+    assert corpus_bleu(references, references) == pytest.approx(1.0)
+    # no 4-gram matches.
+    assert corpus_bleu(references, [["the", "cat", "on", "the", "mat"]]) == 0.0
+    # all ngrams match, but the prediction is shorter than the reference.
+    assert corpus_bleu(references, [["the", "cat", "is", "on", "the"]]) == (
+        pytest.approx(0.8187307)
+    )
+    assert corpus_bleu(references, [[]]) == 0.0
+
+
+def test_corpus_ter():
+    references = [["the", "cat", "is", "on", "the", "mat"]]
+
+    assert corpus_ter(references, references) == 0.0
+    # one deletion over six reference tokens.
+    assert corpus_ter(references, [["the", "cat", "on", "the", "mat"]]) == (
+        pytest.approx(100 / 6)
+    )
+    # one shift.
+    assert corpus_ter(references, [["on", "the", "mat", "the", "cat", "is"]]) == (
+        pytest.approx(100 / 6)
+    )
+    assert corpus_ter([[]], [[]]) == 100.0
+    assert corpus_ter([[]], [["the"]]) == 100.0
+
+
+@pytest.mark.parametrize(
+    ("references", "predictions"),
+    [
+        (["The cat is on the mat."], ["the cat on the mat"]),
+        (["", "Hola"], ["", "Hola"]),
+        (["", ""], ["Hola", ""]),
+        (["", ""], ["", ""]),
+    ],
+)
+def test_corpus_ter_matches_sacrebleu(references, predictions):
+    expected = TER().corpus_score(predictions, [references]).score
+
+    assert corpus_ter(
+        tokenize(references, tokenizer="ter"), tokenize(predictions, tokenizer="ter")
+    ) == pytest.approx(expected)
@@ -0,0 +1,103 @@
+import gc
+import threading
+from typing import Dict, List
+
+import pytest
+
+from DashAI.back.models.hugging_face.pretrained_cache import (
+    PretrainedCache,
+    acquire_pretrained,
+    clone_pretrained,
+    pretrained_cache,
+)
+
+
+class Owner:
+    pass
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def __call__(self, name: str) -> Dict[str, List[float]]:
+        self.calls.append(name)
+        return {"name": name, "weights": [0.0, 1.0]}
+
+
+def test_acquire_loads_once():
+    cache = PretrainedCache()
+    loader = CountingLoader()
+
+    first = cache.acquire(loader, "model")
+    second = cache.acquire(loader, "model")
+    other = cache.acquire(loader, "other_model")
+
+    assert first is second
+    assert other is not first
+    assert loader.calls == ["model", "other_model"]
+    assert cache.references(loader, "model") == 2
+
+
+def test_release_evicts_least_recently_used_idle_entries():
+    cache = PretrainedCache(max_idle=1)
+    loader = CountingLoader()
+
+    cache.acquire(loader, "model")
+    cache.acquire(loader, "other_model")
+    cache.release(loader, "model")
+    # the only idle entry is kept.
+    cache.acquire(loader, "model")
+    assert loader.calls == ["model", "other_model"]
+
+    cache.release(loader, "model")
+    cache.release(loader, "other_model")
+    assert cache.references(loader, "model") == 0
+
+    cache.acquire(loader, "model")
+    cache.acquire(loader, "other_model")
+    assert loader.calls == ["model", "other_model", "model"]
+
+
+def test_concurrent_acquire_loads_once():
+    cache = PretrainedCache()
+    loader = CountingLoader()
+
+    threads = [
+        threading.Thread(target=cache.acquire, args=(loader, "model")) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == ["model"]
+    assert cache.references(loader, "model") == 8
+
+
+@pytest.fixture(name="loader")
+def fixture_loader():
+    loader = CountingLoader()
+    yield loader
+    pretrained_cache.clear()
+
+
+def test_acquire_pretrained_releases_with_owner(loader: CountingLoader):
+    owners = [Owner(), Owner()]
+    weights = [acquire_pretrained(owner, loader, "model") for owner in owners]
+
+    assert weights[0] is weights[1]
+    assert pretrained_cache.references(loader, "model") == 2
+
+    del owners[0]
+    gc.collect()
+    assert pretrained_cache.references(loader, "model") == 1
+
+
+def test_clone_pretrained(loader: CountingLoader):
+    weights = acquire_pretrained(Owner(), loader, "model")
+
+    clone = clone_pretrained(weights)
+    clone["weights"][0] = 2.0
+
+    assert weights["weights"] == [0.0, 1.0]
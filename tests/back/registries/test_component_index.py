@@ -0,0 +1,92 @@
+from DashAI.back.container import INITIAL_COMPONENTS
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.dependencies.registry.component_index import (
+    build_component_index,
+    load_component_index,
+    save_component_index,
+)
+from tests.back.registries.test_registry import (
+    COMPONENT1_DICT,
+    COMPONENT3_DICT,
+    RELATED_COMPONENT1_DICT,
+    RELATED_COMPONENT2_DICT,
+    SUBCOMPONENT1_DICT,
+)
+
+MODULE = "tests.back.registries.test_registry"
+LAZY_COMPONENTS = {
+    "ConfigComponent1": [f"{MODULE}.Component1", f"{MODULE}.SubComponent1"],
+    "StaticComponent": [
+        f"{MODULE}.Component3",
+        f"{MODULE}.RelatedComponent1",
+        f"{MODULE}.RelatedComponent2",
+    ],
+}
+
+
+def _payload(component_dict):
+    return {key: value for key, value in component_dict.items() if key != "class"}
+
+
+def test_list_indexed_components_without_loading(tmp_path):
+    index_path = tmp_path / "components_index.json"
+    save_component_index(build_component_index(LAZY_COMPONENTS), index_path)
+    test_registry = ComponentRegistry(
+        lazy_components=LAZY_COMPONENTS,
+        component_index=load_component_index(index_path),
+    )
+
+    assert test_registry.get_component_payloads(select_types=["StaticComponent"]) == [
+        _payload(COMPONENT3_DICT),
+        _payload(RELATED_COMPONENT1_DICT),
+        _payload(RELATED_COMPONENT2_DICT),
+    ]
+    assert test_registry.get_component_payloads(component_parent="Component1") == [
+        _payload(COMPONENT1_DICT),
+        _payload(SUBCOMPONENT1_DICT),
+    ]
+    assert test_registry.get_component_payloads(
+        select_types=["StaticComponent"], related_component="Component1"
+    ) == [_payload(RELATED_COMPONENT1_DICT), _payload(RELATED_COMPONENT2_DICT)]
+    assert test_registry.get_payload("Component1") == _payload(COMPONENT1_DICT)
+    # no component was imported.
+    assert all(
+        "class" not in component_dict
+        for components in test_registry.registry.values()
+        for component_dict in components.values()
+    )
+
+    # loading the components does not duplicate their relationships.
+    assert test_registry.get_related_components("Component1") == [
+        RELATED_COMPONENT1_DICT,
+        RELATED_COMPONENT2_DICT,
+    ]
+    assert test_registry["Component1"] == COMPONENT1_DICT
+
+
+def test_get_child_components_loads_only_the_children(tmp_path):
+    index_path = tmp_path / "components_index.json"
+    save_component_index(build_component_index(LAZY_COMPONENTS), index_path)
+    test_registry = ComponentRegistry(
+        lazy_components=LAZY_COMPONENTS,
+        component_index=load_component_index(index_path),
+    )
+
+    assert test_registry.get_child_components("Component1") == [SUBCOMPONENT1_DICT]
+    assert test_registry.get_child_components("XYZ") == []
+    loaded = [
+        name
+        for components in test_registry.registry.values()
+        for name, component_dict in components.items()
+        if "class" in component_dict
+    ]
+    assert loaded == ["SubComponent1"]
+
+
+def test_missing_component_index(tmp_path):
+    assert load_component_index(tmp_path / "components_index.json") == {}
+
+
+def test_component_index_is_up_to_date():
+    # regenerate it with: python -m DashAI.back.dependencies.registry.component_index
+    assert load_component_index() == build_component_index(INITIAL_COMPONENTS)
@@ -462,3 +462,147 @@ def test_relationships_module():
         COMPONENT1_DICT,
         COMPONENT2_DICT,
     ]
+
+
+def test_register_lazy_component():
+    test_registry = ComponentRegistry(
+        lazy_components={
+            "ConfigComponent1": [f"{__name__}.Component1"],
+            "StaticComponent": [f"{__name__}.Component3"],
+        }
+    )
+
+    # the components are not loaded until they are requested.
+    assert "Component1" in test_registry
+    assert test_registry.registry["ConfigComponent1"]["Component1"] == {
+        "name": "Component1",
+        "type": "ConfigComponent1",
+        "path": f"{__name__}.Component1",
+    }
+
+    assert test_registry["Component1"] == COMPONENT1_DICT
+    assert test_registry.registry == {
+        "ConfigComponent1": {"Component1": COMPONENT1_DICT},
+        "StaticComponent": {
+            "Component3": {
+                "name": "Component3",
+                "type": "StaticComponent",
+                "path": f"{__name__}.Component3",
+            }
+        },
+    }
+    assert test_registry.get_components_by_types() == [
+        COMPONENT1_DICT,
+        COMPONENT3_DICT,
+    ]
+
+
+def test_register_lazy_component_wrong_type():
+    test_registry = ComponentRegistry()
+    test_registry.register_lazy_component(f"{__name__}.Component3", "ConfigComponent1")
+
+    with pytest.raises(
+        TypeError,
+        match=(
+            r"Component Component3 was registered with type ConfigComponent1, "
+            r"but its class has type StaticComponent."
+        ),
+    ):
+        test_registry["Component3"]
+
+
+def test_lazy_related_components():
+    test_registry = ComponentRegistry(
+        initial_components=[Component2],
+        lazy_components={
+            "ConfigComponent1": [f"{__name__}.Component1"],
+            "StaticComponent": [
+                f"{__name__}.RelatedComponent1",
+                f"{__name__}.RelatedComponent2",
+            ],
+        },
+    )
+
+    assert (
+        test_registry.get_related_components("Component2", select="ConfigComponent1")
+        == []
+    )
+    assert test_registry.get_related_components("Component2") == [
+        RELATED_COMPONENT2_DICT
+    ]
+    assert test_registry.get_related_components("Component1") == [
+        RELATED_COMPONENT1_DICT,
+        RELATED_COMPONENT2_DICT,
+    ]
+
+
+def _payload(component_dict):
+    return {key: value for key, value in component_dict.items() if key != "class"}
+
+
+def test_get_payload():
+    test_registry = ComponentRegistry(
+        initial_components=[Component3],
+        lazy_components={"ConfigComponent1": [f"{__name__}.Component1"]},
+    )
+
+    assert test_registry.get_payload("Component3") == _payload(COMPONENT3_DICT)
+    assert test_registry.get_payload("Component1") == _payload(COMPONENT1_DICT)
+    # the payload is cached when the component is registered.
+    assert test_registry.get_payload("Component1") is test_registry.get_payload(
+        "Component1"
+    )
+
+    with pytest.raises(KeyError):
+        test_registry.get_payload("Component2")
+
+
+def test_get_component_payloads():
+    test_registry = ComponentRegistry(
+        initial_components=[Component1, Component2, SubComponent1],
+        lazy_components={
+            "StaticComponent": [
+                f"{__name__}.Component3",
+                f"{__name__}.RelatedComponent1",
+                f"{__name__}.RelatedComponent2",
+            ],
+        },
+    )
+
+    assert test_registry.get_component_payloads() == [
+        _payload(component_dict)
+        for component_dict in test_registry.get_components_by_types()
+    ]
+    assert test_registry.get_component_payloads(select_types=["StaticComponent"]) == [
+        _payload(COMPONENT3_DICT),
+        _payload(RELATED_COMPONENT1_DICT),
+        _payload(RELATED_COMPONENT2_DICT),
+    ]
+    assert test_registry.get_component_payloads(
+        ignore_types=["StaticComponent"], component_parent="BaseConfigComponent1"
+    ) == [
+        _payload(COMPONENT1_DICT),
+        _payload(COMPONENT2_DICT),
+        _payload(SUBCOMPONENT1_DICT),
+    ]
+    assert test_registry.get_component_payloads(component_parent="Component1") == [
+        _payload(COMPONENT1_DICT),
+        _payload(SUBCOMPONENT1_DICT),
+    ]
+    assert test_registry.get_component_payloads(related_component="Component2") == [
+        _payload(RELATED_COMPONENT2_DICT)
+    ]
+    assert test_registry.get_component_payloads(
+        related_component="Component1", component_parent="RelatedComponent1"
+    ) == [_payload(RELATED_COMPONENT1_DICT)]
+    assert (
+        test_registry.get_component_payloads(
+            select_types=["ConfigComponent1"], related_component="Component1"
+        )
+        == []
+    )
+
+    with pytest.raises(ValueError, match="Component type XYZ does not exist"):
+        test_registry.get_component_payloads(select_types=["XYZ"])
+    with pytest.raises(KeyError):
+        test_registry.get_component_payloads(related_component="XYZ")
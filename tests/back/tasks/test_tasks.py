@@ -2,7 +2,7 @@ import io
 import shutil
 
 import pytest
-from datasets import DatasetDict
+from datasets import ClassLabel, Dataset, DatasetDict
 from starlette.datastructures import Headers, UploadFile
 
 from DashAI.back.dataloaders.classes.csv_dataloader import CSVDataLoader
@@ -109,6 +109,33 @@ def test_prepare_task():
         pytest.fail(f"Unexpected error in test_prepare_task: {repr(e)}")
 
 
+def test_prepare_task_shares_classes_between_splits():
+    dataset = to_dashai_dataset(
+        DatasetDict(
+            {
+                "train": Dataset.from_dict(
+                    {"x": [1, 2, 3], "label": ["dog", "cat", "dog"]}
+                ),
+                "test": Dataset.from_dict({"x": [4, 5], "label": ["bird", "cat"]}),
+            }
+        )
+    )
+    dataset = TabularClassificationTask().prepare_for_task(dataset, ["label"])
+
+    for split in ["train", "test"]:
+        assert dataset[split].features["label"] == ClassLabel(
+            names=["bird", "cat", "dog"]
+        )
+    assert dataset["train"]["label"] == [2, 1, 2]
+    assert dataset["test"]["label"] == [0, 1]
+
+
+def test_prepare_task_unexistent_output_column():
+    dataset = to_dashai_dataset(load_csv_into_datasetdict("iris.csv"))
+    with pytest.raises(ValueError, match="column 'Class' does not exist"):
+        TabularClassificationTask().prepare_for_task(dataset, ["Class"])
+
+
 def test_not_prepared_task():
     dataset = to_dashai_dataset(load_csv_into_datasetdict("iris.csv"))
     tabular_task = TabularClassificationTask()
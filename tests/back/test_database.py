@@ -0,0 +1,61 @@
+import pathlib
+
+import pytest
+from sqlalchemy import text
+
+from DashAI.back.dependencies.database import (
+    Base,
+    Dataset,
+    setup_sqlite_db,
+    unit_of_work,
+)
+
+
+@pytest.fixture(name="session_factory")
+def fixture_session_factory(tmp_path: pathlib.Path):
+    engine, session_factory = setup_sqlite_db(
+        {
+            "SQLITE_DB_PATH": tmp_path / "db.sqlite",
+            "LOGGING_LEVEL": "ERROR",
+            "SQLITE_POOL_SIZE": 3,
+            "SQLITE_BUSY_TIMEOUT": 1234,
+        }
+    )
+    Base.metadata.create_all(bind=engine)
+    yield session_factory
+    engine.dispose()
+
+
+def test_sqlite_engine_configuration(session_factory):
+    with session_factory() as db:
+        assert db.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # 1 is the value of synchronous NORMAL.
+        assert db.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert db.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert db.get_bind().pool.size() == 3
+
+
+def test_unit_of_work_commits_once(session_factory):
+    with session_factory() as db, unit_of_work(db):
+        db.add(Dataset(name="a", file_path="a"))
+        db.add(Dataset(name="b", file_path="b"))
+
+    with session_factory() as db:
+        assert {dataset.name for dataset in db.query(Dataset)} == {"a", "b"}
+
+
+def _add_dataset_and_fail(db) -> None:
+    with unit_of_work(db):
+        db.add(Dataset(name="a", file_path="a"))
+        db.flush()
+        raise RuntimeError("failed")
+
+
+def test_unit_of_work_rolls_back_on_error(session_factory):
+    with session_factory() as db:
+        with pytest.raises(RuntimeError, match="failed"):
+            _add_dataset_and_fail(db)
+        assert db.query(Dataset).count() == 0
+
+    with session_factory() as db:
+        assert db.query(Dataset).count() == 0
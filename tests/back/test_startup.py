@@ -0,0 +1,57 @@
+import json
+
+from DashAI.__main__ import main
+from DashAI.back.app import create_app
+from DashAI.back.core.enums.logging_levels import LoggingLevel
+from DashAI.back.startup_profiler import StartupProfiler, profile_imports
+
+# Startup cost thresholds (in seconds). They are well above the expected costs to
+# avoid flaky failures in slow machines, but below the cost of importing the
+# heavy model dependencies at startup.
+MAX_IMPORT_SECONDS = 6.0
+MAX_INIT_SECONDS = 3.0
+
+# Packages that should only be imported when a component that uses them is used.
+LAZY_PACKAGES = ["torch", "transformers", "optuna", "hyperopt", "shap", "evaluate"]
+
+
+def test_startup_imports():
+    imports = profile_imports()
+
+    assert "DashAI.back.api" in imports
+    for package in LAZY_PACKAGES:
+        assert package not in imports
+    assert sum(imports.values()) < MAX_IMPORT_SECONDS
+
+
+def test_startup_steps(test_path):
+    profiler = StartupProfiler()
+    create_app(local_path=test_path, profiler=profiler)
+
+    assert list(profiler.steps) == [
+        "config",
+        "container",
+        "local_paths",
+        "database",
+        "job_queue",
+        "routers",
+    ]
+    assert sum(profiler.steps.values()) < MAX_INIT_SECONDS
+
+
+def test_profile_startup_report(test_path):
+    report_path = test_path / "startup_report.json"
+    main(
+        local_path=test_path,
+        logging_level=LoggingLevel.INFO,
+        profile_startup=report_path,
+    )
+
+    with open(report_path) as file:
+        report = json.load(file)
+    assert set(report) == {"python", "total_seconds", "imports", "steps"}
+    assert report["total_seconds"] == (
+        report["imports"]["total_seconds"] + report["steps"]["total_seconds"]
+    )
+    assert "routers" in report["steps"]["steps"]
+    assert report["imports"]["components"]